@@ -0,0 +1,32 @@
+"""add products.source_code
+
+Revision ID: a3e9c7f2d481
+Revises: f5c1d8b3a926
+Create Date: 2026-10-19 17:20:05.662310
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3e9c7f2d481"
+down_revision: Union[str, None] = "f5c1d8b3a926"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "products", sa.Column("source_code", sa.String(length=50), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_products_source_code"), "products", ["source_code"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_products_source_code"), table_name="products")
+    op.drop_column("products", "source_code")
@@ -0,0 +1,27 @@
+"""add user wishlist cursor index
+
+Revision ID: a7c4e2f9b135
+Revises: e7f2b9a4c316
+Create Date: 2026-10-19 21:12:40.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c4e2f9b135"
+down_revision: Union[str, None] = "e7f2b9a4c316"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_wishlists_user_id_id", "user_wishlists", ["user_id", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_wishlists_user_id_id", table_name="user_wishlists")
@@ -0,0 +1,45 @@
+"""make user wishlist uniqueness partial on active rows
+
+Revision ID: b3d9f6a2c847
+Revises: a7c4e2f9b135
+Create Date: 2026-10-19 22:05:13.527816
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d9f6a2c847"
+down_revision: Union[str, None] = "a7c4e2f9b135"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("unique_user_product", "user_wishlists", type_="unique")
+    op.create_index(
+        "unique_user_product",
+        "user_wishlists",
+        ["user_id", "product_id"],
+        unique=True,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("unique_user_product", table_name="user_wishlists")
+    # 삭제 후 다시 담은 위시리스트가 있으면 가장 최근(id 가 큰) 행만 남김
+    op.execute(
+        """
+        DELETE FROM user_wishlists
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM user_wishlists GROUP BY user_id, product_id
+        )
+        """
+    )
+    op.create_unique_constraint(
+        "unique_user_product", "user_wishlists", ["user_id", "product_id"]
+    )
@@ -0,0 +1,85 @@
+"""add products.geohash for nearby hall search
+
+Revision ID: b7d3e1a9c2f4
+Revises: eba540576a0f
+Create Date: 2026-10-19 10:12:41.218337
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3e1a9c2f4"
+down_revision: Union[str, None] = "eba540576a0f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이 리비전 시점의 geohash 인코딩 (utils/geo.py 변경과 무관하게 고정)
+GEOHASH_PRECISION = 8
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def _geohash_or_none(lat: float | None, lng: float | None) -> str | None:
+    """좌표가 있으면 geohash, 없으면 None (0.0, 0.0 은 미설정으로 간주)"""
+    if lat is None or lng is None or (lat == 0.0 and lng == 0.0):
+        return None
+
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < GEOHASH_PRECISION:
+        value, value_range = (lng, lng_range) if even else (lat, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits <<= 1
+            value_range[1] = mid
+
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "products",
+        sa.Column(
+            "geohash", sqlmodel.sql.sqltypes.AutoString(length=12), nullable=True
+        ),
+    )
+    op.create_index(
+        "ix_products_geohash",
+        "products",
+        ["geohash"],
+        postgresql_ops={"geohash": "varchar_pattern_ops"},
+    )
+
+    # 기존 상품 좌표로 geohash 채우기
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, lat, lng FROM products")).fetchall()
+    values = [
+        {"id": row.id, "geohash": _geohash_or_none(row.lat, row.lng)} for row in rows
+    ]
+    if values:
+        conn.execute(
+            sa.text("UPDATE products SET geohash = :geohash WHERE id = :id"), values
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_geohash", table_name="products")
+    op.drop_column("products", "geohash")
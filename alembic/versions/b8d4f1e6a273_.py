@@ -0,0 +1,92 @@
+"""add product_studios scene_flags and package price envelope
+
+Revision ID: b8d4f1e6a273
+Revises: a3e9c7f2d481
+Create Date: 2026-10-19 18:05:41.270318
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d4f1e6a273"
+down_revision: Union[str, None] = "a3e9c7f2d481"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "product_studios",
+        sa.Column("scene_flags", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "product_studios",
+        sa.Column("min_package_price", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "product_studios",
+        sa.Column("max_package_price", sa.Integer(), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_product_studios_scene_flags"), "product_studios", ["scene_flags"]
+    )
+    op.create_index(
+        op.f("ix_product_studios_min_package_price"),
+        "product_studios",
+        ["min_package_price"],
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_product_studios_max_package_price_desc",
+            "product_studios",
+            [sa.text("max_package_price DESC NULLS LAST")],
+        )
+
+    # 기존 씬 컬럼으로 비트마스크 채우기 (utils.studio_scenes.SCENE_COLUMNS 순서)
+    op.execute(
+        """
+        UPDATE product_studios SET scene_flags =
+            (CASE WHEN has_garden_scene THEN 1 ELSE 0 END)
+            + (CASE WHEN has_road_scene THEN 2 ELSE 0 END)
+            + (CASE WHEN has_rooftop_scene THEN 4 ELSE 0 END)
+            + (CASE WHEN has_night_scene THEN 8 ELSE 0 END)
+            + (CASE WHEN has_hanbok_scene THEN 16 ELSE 0 END)
+            + (CASE WHEN has_pet_scene THEN 32 ELSE 0 END)
+            + (CASE WHEN has_black_white_scene THEN 64 ELSE 0 END)
+        """
+    )
+
+    # 기존 패키지 가격으로 가격 범위 채우기
+    op.execute(
+        """
+        UPDATE product_studios SET
+            min_package_price = (
+                SELECT MIN(CASE WHEN p.discount_price > 0 THEN p.discount_price ELSE p.price END)
+                FROM product_studio_packages p
+                WHERE p.product_studio_id = product_studios.id AND p.is_deleted = false
+            ),
+            max_package_price = (
+                SELECT MAX(CASE WHEN p.discount_price > 0 THEN p.discount_price ELSE p.price END)
+                FROM product_studio_packages p
+                WHERE p.product_studio_id = product_studios.id AND p.is_deleted = false
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index(
+            "ix_product_studios_max_package_price_desc", table_name="product_studios"
+        )
+    op.drop_index(
+        op.f("ix_product_studios_min_package_price"), table_name="product_studios"
+    )
+    op.drop_index(op.f("ix_product_studios_scene_flags"), table_name="product_studios")
+    op.drop_column("product_studios", "max_package_price")
+    op.drop_column("product_studios", "min_package_price")
+    op.drop_column("product_studios", "scene_flags")
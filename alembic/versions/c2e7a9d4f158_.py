@@ -0,0 +1,82 @@
+"""add products.search_text with trigram index
+
+Revision ID: c2e7a9d4f158
+Revises: b8d4f1e6a273
+Create Date: 2026-10-19 18:42:13.508921
+
+"""
+
+import re
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e7a9d4f158"
+down_revision: Union[str, None] = "b8d4f1e6a273"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이 리비전 시점의 검색 문서 규칙 (utils/search_text.py 변경과 무관하게 고정)
+SEARCH_TEXT_COLUMNS = (
+    "name",
+    "hashtag",
+    "enterprise_name",
+    "sido",
+    "gugun",
+    "dong",
+    "address",
+    "subway_name",
+    "description",
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _build_search_text(*parts: str | None) -> str:
+    """검색 문서 생성 (빈 값 제외, 소문자, 연속 공백은 하나로)"""
+    text = " ".join(part for part in parts if part)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def upgrade() -> None:
+    op.add_column("products", sa.Column("search_text", sa.Text(), nullable=True))
+
+    # 기존 상품의 검색 문서 채우기
+    connection = op.get_bind()
+    products = sa.table(
+        "products",
+        sa.column("id", sa.Integer),
+        sa.column("search_text", sa.Text),
+        *(sa.column(column, sa.Text) for column in SEARCH_TEXT_COLUMNS),
+    )
+    rows = connection.execute(
+        sa.select(products.c.id, *(products.c[c] for c in SEARCH_TEXT_COLUMNS))
+    ).all()
+    if rows:
+        connection.execute(
+            products.update()
+            .where(products.c.id == sa.bindparam("product_id"))
+            .values(search_text=sa.bindparam("text")),
+            [
+                {"product_id": row[0], "text": _build_search_text(*row[1:])}
+                for row in rows
+            ],
+        )
+
+    if connection.dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_products_search_text",
+            "products",
+            ["search_text"],
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        )
+    else:
+        op.create_index("ix_products_search_text", "products", ["search_text"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_search_text", table_name="products")
+    op.drop_column("products", "search_text")
@@ -0,0 +1,57 @@
+"""add product_halls price envelope (min_price, max_price)
+
+Revision ID: c4f8a2d6e913
+Revises: b7d3e1a9c2f4
+Create Date: 2026-10-19 13:48:05.512904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f8a2d6e913"
+down_revision: Union[str, None] = "b7d3e1a9c2f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("product_halls", sa.Column("min_price", sa.Integer(), nullable=True))
+    op.add_column("product_halls", sa.Column("max_price", sa.Integer(), nullable=True))
+    op.create_index(
+        op.f("ix_product_halls_min_price"), "product_halls", ["min_price"]
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_product_halls_max_price_desc",
+            "product_halls",
+            [sa.text("max_price DESC NULLS LAST")],
+        )
+
+    # 기존 베뉴 가격으로 견적 범위 채우기
+    op.execute(
+        """
+        UPDATE product_halls SET
+            min_price = (
+                SELECT MIN(v.basic_price + v.guaranteed_min_count * v.food_cost_per_adult)
+                FROM product_hall_venues v
+                WHERE v.product_hall_id = product_halls.id AND v.is_deleted = false
+            ),
+            max_price = (
+                SELECT MAX(v.peak_season_price + v.guaranteed_min_count * v.food_cost_per_adult)
+                FROM product_hall_venues v
+                WHERE v.product_hall_id = product_halls.id AND v.is_deleted = false
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_product_halls_max_price_desc", table_name="product_halls")
+    op.drop_index(op.f("ix_product_halls_min_price"), table_name="product_halls")
+    op.drop_column("product_halls", "max_price")
+    op.drop_column("product_halls", "min_price")
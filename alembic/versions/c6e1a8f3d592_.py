@@ -0,0 +1,75 @@
+"""add product_hall_venues.image_urls
+
+Revision ID: c6e1a8f3d592
+Revises: b3d9f6a2c847
+Create Date: 2026-10-20 10:14:52.630917
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e1a8f3d592"
+down_revision: Union[str, None] = "b3d9f6a2c847"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+product_hall_venues = sa.table(
+    "product_hall_venues",
+    sa.column("id", sa.Integer),
+    sa.column("image_urls", sa.JSON),
+)
+product_images = sa.table(
+    "product_images",
+    sa.column("id", sa.Integer),
+    sa.column("product_venue_id", sa.Integer),
+    sa.column("image_url", sa.String),
+    sa.column("order", sa.Integer),
+    sa.column("is_deleted", sa.Boolean),
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "product_hall_venues", sa.Column("image_urls", sa.JSON(), nullable=True)
+    )
+
+    # 기존 베뉴의 전용 이미지 URL 채우기 (order 순)
+    connection = op.get_bind()
+    image_urls = {
+        venue_id: []
+        for venue_id in connection.execute(sa.select(product_hall_venues.c.id))
+        .scalars()
+        .all()
+    }
+    images = connection.execute(
+        sa.select(product_images.c.product_venue_id, product_images.c.image_url)
+        .where(
+            sa.and_(
+                product_images.c.product_venue_id.is_not(None),
+                product_images.c.is_deleted == sa.false(),
+            )
+        )
+        .order_by(product_images.c.order, product_images.c.id)
+    )
+    for venue_id, image_url in images:
+        if venue_id in image_urls:
+            image_urls[venue_id].append(image_url)
+
+    if image_urls:
+        connection.execute(
+            product_hall_venues.update()
+            .where(product_hall_venues.c.id == sa.bindparam("venue_id"))
+            .values(image_urls=sa.bindparam("venue_image_urls")),
+            [
+                {"venue_id": venue_id, "venue_image_urls": urls}
+                for venue_id, urls in image_urls.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("product_hall_venues", "image_urls")
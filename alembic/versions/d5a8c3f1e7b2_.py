@@ -0,0 +1,36 @@
+"""add unique (product_id, score_type) to product_scores
+
+Revision ID: d5a8c3f1e7b2
+Revises: c2e7a9d4f158
+Create Date: 2026-10-19 19:16:52.731046
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a8c3f1e7b2"
+down_revision: Union[str, None] = "c2e7a9d4f158"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 같은 (상품, 점수 타입) 이 여러 개면 가장 최근(id 가 큰) 점수만 남김
+    op.execute(
+        """
+        DELETE FROM product_scores
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM product_scores GROUP BY product_id, score_type
+        )
+        """
+    )
+    op.create_unique_constraint(
+        "unique_product_score_type", "product_scores", ["product_id", "score_type"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("unique_product_score_type", "product_scores", type_="unique")
@@ -0,0 +1,36 @@
+"""add product_hall_similarities
+
+Revision ID: d9a3c5e7f214
+Revises: c4f8a2d6e913
+Create Date: 2026-10-19 14:05:32.870145
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a3c5e7f214"
+down_revision: Union[str, None] = "c4f8a2d6e913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "product_hall_similarities",
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("similar_product_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("created_datetime", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.ForeignKeyConstraint(["similar_product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("product_id", "rank"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("product_hall_similarities")
@@ -0,0 +1,117 @@
+"""add product_hall_venues.amenity_images
+
+Revision ID: e2b6f8a1c537
+Revises: d9a3c5e7f214
+Create Date: 2026-10-19 14:31:18.044512
+
+"""
+
+from collections import defaultdict
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b6f8a1c537"
+down_revision: Union[str, None] = "d9a3c5e7f214"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이 리비전 시점의 편의시설 이미지 타입 (모델/유틸 변경과 무관하게 고정)
+AMENITY_IMAGE_TYPES = ("신부대기실", "폐백실", "연회장")
+
+product_halls = sa.table(
+    "product_halls",
+    sa.column("id", sa.Integer),
+    sa.column("product_id", sa.Integer),
+)
+product_hall_venues = sa.table(
+    "product_hall_venues",
+    sa.column("id", sa.Integer),
+    sa.column("product_hall_id", sa.Integer),
+    sa.column("amenity_images", sa.JSON),
+    sa.column("is_deleted", sa.Boolean),
+)
+product_images = sa.table(
+    "product_images",
+    sa.column("product_id", sa.Integer),
+    sa.column("product_venue_id", sa.Integer),
+    sa.column("image_type", sa.String),
+    sa.column("order", sa.Integer),
+    sa.column("image_url", sa.String),
+    sa.column("is_deleted", sa.Boolean),
+)
+
+
+def _resolve_amenity_images(common_images: list, venue_images: list) -> dict:
+    """베뉴 전용 이미지가 있는 타입은 공통 이미지를 대신함 (타입별 order 순)"""
+    by_type = defaultdict(list)
+    for image_type, order, image_url in venue_images:
+        by_type[image_type].append((order, image_url))
+
+    overridden = set(by_type)
+    for image_type, order, image_url in common_images:
+        if image_type not in overridden:
+            by_type[image_type].append((order, image_url))
+
+    return {
+        image_type: [image_url for _, image_url in sorted(by_type[image_type])]
+        for image_type in AMENITY_IMAGE_TYPES
+    }
+
+
+def upgrade() -> None:
+    op.add_column(
+        "product_hall_venues", sa.Column("amenity_images", sa.JSON(), nullable=True)
+    )
+
+    # 기존 베뉴의 편의시설 이미지 병합 결과 채우기
+    connection = op.get_bind()
+    venues = connection.execute(
+        sa.select(product_hall_venues.c.id, product_halls.c.product_id)
+        .join(product_halls, product_halls.c.id == product_hall_venues.c.product_hall_id)
+        .where(product_hall_venues.c.is_deleted == sa.false())
+    ).all()
+    if not venues:
+        return
+
+    common_images = defaultdict(list)
+    venue_images = defaultdict(list)
+    for product_id, venue_id, image_type, order, image_url in connection.execute(
+        sa.select(
+            product_images.c.product_id,
+            product_images.c.product_venue_id,
+            product_images.c.image_type,
+            product_images.c.order,
+            product_images.c.image_url,
+        ).where(
+            sa.and_(
+                product_images.c.image_type.in_(AMENITY_IMAGE_TYPES),
+                product_images.c.is_deleted == sa.false(),
+            )
+        )
+    ):
+        if venue_id is None:
+            common_images[product_id].append((image_type, order, image_url))
+        else:
+            venue_images[venue_id].append((image_type, order, image_url))
+
+    connection.execute(
+        product_hall_venues.update()
+        .where(product_hall_venues.c.id == sa.bindparam("venue_id"))
+        .values(amenity_images=sa.bindparam("resolved_images")),
+        [
+            {
+                "venue_id": venue_id,
+                "resolved_images": _resolve_amenity_images(
+                    common_images[product_id], venue_images[venue_id]
+                ),
+            }
+            for venue_id, product_id in venues
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("product_hall_venues", "amenity_images")
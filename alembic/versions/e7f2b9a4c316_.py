@@ -0,0 +1,51 @@
+"""add score percentiles and hall composite scores
+
+Revision ID: e7f2b9a4c316
+Revises: d5a8c3f1e7b2
+Create Date: 2026-10-19 19:48:27.094513
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f2b9a4c316"
+down_revision: Union[str, None] = "d5a8c3f1e7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("product_scores", sa.Column("percentile", sa.Float(), nullable=True))
+    op.create_index(
+        "ix_product_scores_score_type_value",
+        "product_scores",
+        ["score_type", "value"],
+    )
+    op.add_column(
+        "product_halls", sa.Column("composite_score", sa.Float(), nullable=True)
+    )
+    op.add_column(
+        "product_halls", sa.Column("composite_percentile", sa.Float(), nullable=True)
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_product_halls_composite_score_desc",
+            "product_halls",
+            [sa.text("composite_score DESC NULLS LAST")],
+        )
+    # 값은 scripts/build_score_percentiles.py 로 채운다
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index(
+            "ix_product_halls_composite_score_desc", table_name="product_halls"
+        )
+    op.drop_column("product_halls", "composite_percentile")
+    op.drop_column("product_halls", "composite_score")
+    op.drop_index("ix_product_scores_score_type_value", table_name="product_scores")
+    op.drop_column("product_scores", "percentile")
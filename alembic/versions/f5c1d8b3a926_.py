@@ -0,0 +1,34 @@
+"""add product_images width/height/placeholder/derivatives
+
+Revision ID: f5c1d8b3a926
+Revises: e2b6f8a1c537
+Create Date: 2026-10-19 16:02:47.318205
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5c1d8b3a926"
+down_revision: Union[str, None] = "e2b6f8a1c537"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("product_images", sa.Column("width", sa.Integer(), nullable=True))
+    op.add_column("product_images", sa.Column("height", sa.Integer(), nullable=True))
+    op.add_column(
+        "product_images", sa.Column("placeholder", sa.String(), nullable=True)
+    )
+    op.add_column("product_images", sa.Column("derivatives", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("product_images", "derivatives")
+    op.drop_column("product_images", "placeholder")
+    op.drop_column("product_images", "height")
+    op.drop_column("product_images", "width")
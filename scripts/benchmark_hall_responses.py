@@ -0,0 +1,205 @@
+"""
+웨딩홀 상세/목록 응답 직렬화 벤치마크
+
+기존 경로(JSONResponse + response_model 재검증)와
+ModelResponse 단일 직렬화 경로의 처리 시간을 비교한다.
+
+실행: PYTHONPATH=src ENVIRONMENT=test python scripts/benchmark_hall_responses.py
+"""
+
+import asyncio
+import time
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from core.responses import ModelResponse
+from schemes.product_halls import (
+    HallAIReviewRead,
+    HallAmenitiesRead,
+    HallBlogRead,
+    HallScoreComparison,
+    HallScoreSummary,
+    HallVenueAmenitiesRead,
+    HallVenueRead,
+    ProductHallListRead,
+    ProductHallRead,
+)
+
+ITERATIONS = 500
+VENUE_COUNT = 6
+LIST_SIZE = 100
+SCORE_TYPES = ["분위기", "위치", "주차", "식사", "서비스", "비용"]
+
+
+def build_hall_detail(product_id: int = 1) -> ProductHallRead:
+    """실제 상세 응답과 비슷한 크기의 ProductHallRead 생성"""
+    venues = []
+    for i in range(VENUE_COUNT):
+        urls = [
+            f"https://cdn.example.com/products/{product_id}/venue_{i}/{n}.webp"
+            for n in range(10)
+        ]
+        venues.append(
+            HallVenueRead(
+                id=i,
+                name=f"그랜드홀 {i}",
+                wedding_interval=60,
+                wedding_times="11:00,12:30,14:00,15:30,17:00",
+                wedding_type="분리",
+                hall_styles="밝음,화려함",
+                hall_types="호텔,컨벤션",
+                guaranteed_min_count=200,
+                min_capacity=150,
+                max_capacity=400,
+                basic_price=5_000_000,
+                peak_season_price=7_000_000,
+                ceiling_height=8,
+                virgin_road_length=25,
+                include_drink=True,
+                include_alcohol=False,
+                include_service_fee=True,
+                include_vat=True,
+                bride_room_entry_methods="전용 엘리베이터",
+                bride_room_makeup_room=True,
+                food_menu="코스",
+                food_cost_per_adult=88_000,
+                food_cost_per_child=44_000,
+                banquet_hall_running_time=90,
+                banquet_hall_max_capacity=500,
+                additional_info="추가 정보" * 10,
+                special_notes="특이사항" * 10,
+                amenities_info=HallVenueAmenitiesRead(
+                    has_bride_room=True,
+                    has_pyebaek_room=True,
+                    has_banquet_hall=True,
+                    bride_room_image_urls=urls,
+                    pyebaek_room_image_urls=urls,
+                    banquet_hall_image_urls=urls,
+                ),
+            )
+        )
+
+    return ProductHallRead(
+        id=product_id,
+        name="더 그랜드 웨딩홀",
+        hashtags=["호텔", "채플", "주차편리"],
+        subway_line="2호선",
+        subway_name="강남",
+        way_text="강남역 3번 출구 도보 5분",
+        park_limit=300,
+        park_free_hours=2,
+        sido="서울",
+        gugun="강남구",
+        dong="역삼동",
+        address="서울 강남구 테헤란로 1",
+        has_single_hall=False,
+        max_price=24_600_000,
+        min_price=22_600_000,
+        hall_amenities_info=HallAmenitiesRead(
+            elevator_count=4,
+            atm_count=1,
+            has_family_waiting_room=True,
+            has_pyebaek_room=True,
+        ),
+        venues=venues,
+        ai_reviews=[
+            HallAIReviewRead(review_type=t, content="리뷰 내용 " * 40)
+            for t in SCORE_TYPES
+        ],
+        ai_score_summary=HallScoreSummary(
+            overall_score=8.4,
+            overall_average=8.1,
+            score_comparisons=[
+                HallScoreComparison(
+                    score_type=t, hall_score=8.4, average=8.1, difference=0.3
+                )
+                for t in SCORE_TYPES
+            ],
+        ),
+        blogs=[
+            HallBlogRead(
+                title=f"블로그 후기 {n}",
+                description="후기 본문 요약 " * 20,
+                link_url=f"https://blog.example.com/{n}",
+                thumbnail_url=f"https://blog.example.com/{n}.jpg",
+            )
+            for n in range(10)
+        ],
+    )
+
+
+def build_hall_list() -> list[ProductHallListRead]:
+    """목록 응답 한 페이지 분량의 ProductHallListRead 생성"""
+    return [
+        ProductHallListRead(
+            id=i,
+            hashtags=["호텔", "채플"],
+            name=f"웨딩홀 {i}",
+            sido="서울",
+            gugun="강남구",
+            address=f"서울 강남구 테헤란로 {i}",
+            image_urls=[
+                f"https://cdn.example.com/products/{i}/common/{n}.webp"
+                for n in range(6)
+            ],
+        )
+        for i in range(LIST_SIZE)
+    ]
+
+
+async def render_default(field, content, response_class) -> bytes:
+    """FastAPI 기본 경로: response_model 재검증 후 응답 클래스로 렌더링"""
+    serialized = await serialize_response(
+        field=field, response_content=content, is_coroutine=True
+    )
+    return response_class(serialized).body
+
+
+def render_fast_path(content) -> bytes:
+    """ModelResponse 경로: 검증된 모델을 한 번만 직렬화"""
+    return ModelResponse(content).body
+
+
+async def measure(label: str, func, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        result = func(*args)
+        if asyncio.iscoroutine(result):
+            await result
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1_000_000
+    print(f"  {label:<40} {elapsed:>10.1f} µs/req")
+    return elapsed
+
+
+async def run_case(name: str, response_type, content):
+    field = create_model_field(
+        name=f"Response_{name}", type_=response_type, mode="serialization"
+    )
+    print(f"\n📊 {name} ({ITERATIONS}회 평균)")
+    baseline = await measure(
+        "JSONResponse + response_model 재검증",
+        render_default,
+        field,
+        content,
+        JSONResponse,
+    )
+    await measure(
+        "ORJSONResponse + response_model 재검증",
+        render_default,
+        field,
+        content,
+        ORJSONResponse,
+    )
+    fast = await measure("ModelResponse (단일 직렬화)", render_fast_path, content)
+    print(f"  → {baseline / fast:.1f}x 빠름")
+
+
+async def main():
+    await run_case("hall_detail", ProductHallRead, build_hall_detail())
+    await run_case("hall_list", list[ProductHallListRead], build_hall_list())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
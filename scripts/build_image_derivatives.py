@@ -0,0 +1,146 @@
+"""
+상품 이미지 반응형 파생 이미지 생성
+
+파생 이미지가 없는 product_images 를 id 순으로 훑으며 원본을 내려받아
+가로 크기별 WebP, 원본 크기, 블러 placeholder 를 만들고 저장소에 올린 뒤
+product_images 에 기록한다. 이미지 디코딩/리사이즈는 프로세스 풀에서 실행하고
+다운로드/업로드는 이벤트 루프에서 동시에 처리한다.
+
+실행: PYTHONPATH=src python scripts/build_image_derivatives.py [--storage local|s3]
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import aiohttp
+
+from core.db import async_session
+from crud import product_image as crud_image
+from utils.image_processing import DERIVATIVE_WIDTHS, build_derivatives
+from utils.image_storage import (
+    ImageStorage,
+    LocalImageStorage,
+    S3ImageStorage,
+    build_image_key,
+)
+
+AWS_S3_BUCKET = "serenade-prod-images"
+AWS_REGION = "ap-northeast-2"
+CLOUDFRONT_DOMAIN = "d8erw6l13w214.cloudfront.net"
+LOCAL_STORAGE_ROOT = "statics/images"
+
+MAX_CONCURRENT_DOWNLOADS = 10
+BATCH_SIZE = 200
+
+
+async def download_image(session: aiohttp.ClientSession, url: str) -> bytes | None:
+    try:
+        async with session.get(url) as response:
+            if response.status == 200:
+                return await response.read()
+            print(f"  ⚠️  HTTP {response.status}: {url}")
+    except Exception as e:
+        print(f"  ❌ 다운로드 실패: {url} - {e}")
+    return None
+
+
+async def process_image(
+    image: dict,
+    *,
+    http: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    pool: ProcessPoolExecutor,
+    storage: ImageStorage,
+) -> dict | None:
+    """이미지 한 장의 파생 이미지 생성 및 업로드 (실패 시 None)"""
+    async with semaphore:
+        image_data = await download_image(http, image["image_url"])
+    if image_data is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(
+            pool, build_derivatives, image_data, DERIVATIVE_WIDTHS
+        )
+    except Exception as e:
+        print(f"  ❌ 변환 실패: ID={image['id']} - {e}")
+        return None
+
+    derivatives = {}
+    for width, data in result.variants.items():
+        key = build_image_key(
+            image["id"],
+            image["product_id"],
+            image["product_venue_id"],
+            image["image_type"],
+            suffix=f"_w{width}",
+        )
+        derivatives[str(width)] = await asyncio.to_thread(storage.save, key, data)
+
+    return {
+        "image_id": image["id"],
+        "width": result.width,
+        "height": result.height,
+        "placeholder": result.placeholder,
+        "derivatives": derivatives,
+    }
+
+
+async def build_image_derivatives(storage: ImageStorage):
+    stats = {"success": 0, "failed": 0}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    timeout = aiohttp.ClientTimeout(connect=10, total=60)
+
+    with ProcessPoolExecutor() as pool:
+        async with async_session() as db, aiohttp.ClientSession(
+            timeout=timeout
+        ) as http:
+            after_id = 0
+            while True:
+                images = await crud_image.get_images_without_derivatives(
+                    db=db, after_id=after_id, limit=BATCH_SIZE
+                )
+                if not images:
+                    break
+                # 실패한 이미지는 derivatives 가 NULL 로 남으므로 다음 실행 때 재시도
+                after_id = images[-1]["id"]
+
+                results = await asyncio.gather(
+                    *(
+                        process_image(
+                            image,
+                            http=http,
+                            semaphore=semaphore,
+                            pool=pool,
+                            storage=storage,
+                        )
+                        for image in images
+                    )
+                )
+                rows = [row for row in results if row is not None]
+                await crud_image.update_derivatives(db=db, rows=rows)
+
+                stats["success"] += len(rows)
+                stats["failed"] += len(images) - len(rows)
+                print(f"📦 ~ID {after_id}: 성공 {len(rows)} / {len(images)}")
+
+    print(f"✅ 완료: 성공 {stats['success']}건, 실패 {stats['failed']}건")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상품 이미지 파생 이미지 생성")
+    parser.add_argument("--storage", choices=["local", "s3"], default="s3")
+    args = parser.parse_args()
+
+    if args.storage == "s3":
+        storage = S3ImageStorage(AWS_S3_BUCKET, AWS_REGION, CLOUDFRONT_DOMAIN)
+    else:
+        storage = LocalImageStorage(LOCAL_STORAGE_ROOT)
+
+    asyncio.run(build_image_derivatives(storage))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+웨딩홀 점수 백분위 순위와 종합 점수 재계산
+
+판매중인 웨딩홀의 점수 타입별 백분위 순위(product_scores.percentile)와
+종합 점수/백분위(product_halls.composite_score, composite_percentile)를 저장한다.
+점수 가져오기(/admin/scores/import, import_ai_scores.py) 후에는 자동으로 실행된다.
+
+실행: PYTHONPATH=src python scripts/build_score_percentiles.py
+"""
+
+import asyncio
+
+from core.db import async_session
+from core.score_percentiles import rebuild_score_percentiles
+
+
+async def main():
+    async with async_session() as session:
+        count = await rebuild_score_percentiles(session)
+    print(f"✅ 웨딩홀 {count}곳의 점수 백분위를 저장했습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
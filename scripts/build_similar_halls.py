@@ -0,0 +1,23 @@
+"""
+유사 웨딩홀(product_hall_similarities) 재계산
+
+점수/지역/견적 범위/베뉴 속성으로 웨딩홀 특성 벡터를 만들고
+코사인 유사도 상위 k개를 저장한다. 점수나 베뉴 데이터 갱신 후 주기적으로 실행.
+
+실행: PYTHONPATH=src python scripts/build_similar_halls.py
+"""
+
+import asyncio
+
+from core.db import async_session
+from core.similar_halls import rebuild_similar_halls
+
+
+async def main():
+    async with async_session() as session:
+        count = await rebuild_similar_halls(session)
+    print(f"✅ 유사 웨딩홀 {count}건을 저장했습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,12 +1,11 @@
 import random
 
-from sqlalchemy import text
 from sqlmodel import Session, create_engine, select
 
 from core.config import settings
-from models.product_scores import ProductScore
+from crud import product_score as crud_score
+from crud.crud_product_score import UPSERT_BATCH_SIZE
 from models.products import Product
-from utils.utils import utc_now
 
 # 데이터베이스 연결 설정
 target_database = (
@@ -77,65 +76,46 @@ def generate_correlated_scores() -> dict[str, float]:
 
 
 def populate_ai_scores():
-    """모든 웨딩홀에 AI 점수 데이터 추가"""
+    """모든 웨딩홀에 AI 점수 데이터 추가 (기존 점수는 덮어씀)"""
     engine = create_engine(target_database)
 
     with Session(engine) as session:
         try:
             # 카테고리 ID 1 (웨딩홀)인 모든 제품 조회
-            query = select(Product).where(
+            query = select(Product.id).where(
                 Product.product_category_id == 1, Product.is_deleted == False
             )
-            result = session.execute(query)
-            products = result.scalars().all()
-
-            print(f"총 {len(products)}개의 웨딩홀을 발견했습니다.")
-
-            # 기존 점수 데이터 삭제 (중복 방지)
-            print("기존 점수 데이터를 삭제하는 중...")
-            session.execute(
-                text(
-                    "DELETE FROM product_scores WHERE product_id IN (SELECT id FROM products WHERE product_category_id = 1)"
-                )
-            )
-
-            scores_created = 0
-
-            for product in products:
-                print(f"처리 중: {product.name}")
-
-                # 상관관계를 고려한 점수 세트 생성
-                scores = generate_correlated_scores()
-
-                # 각 점수 타입별로 ProductScore 생성
-                for score_type, score_value in scores.items():
-                    product_score = ProductScore(
-                        product_id=product.id,
-                        score_type=score_type,
-                        value=score_value,
-                        is_deleted=False,
-                        created_datetime=utc_now(),
-                        updated_datetime=utc_now(),
+            product_ids = session.execute(query).scalars().all()
+
+            print(f"총 {len(product_ids)}개의 웨딩홀을 발견했습니다.")
+
+            # 상관관계를 고려한 점수 세트 생성
+            rows = [
+                {"product_id": product_id, "score_type": score_type, "value": value}
+                for product_id in product_ids
+                for score_type, value in generate_correlated_scores().items()
+            ]
+
+            # (product_id, score_type) 기준 업서트 (기존 점수 삭제 불필요)
+            dialect_name = engine.dialect.name
+            for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                session.execute(
+                    crud_score.upsert_statement(
+                        dialect_name, rows[start : start + UPSERT_BATCH_SIZE]
                     )
+                )
+                print(f"진행상황: {min(start + UPSERT_BATCH_SIZE, len(rows))}개 점수 저장됨")
 
-                    session.add(product_score)
-                    scores_created += 1
-
-                # 중간중간 커밋 (메모리 효율성)
-                if scores_created % 50 == 0:
-                    session.commit()
-                    print(f"진행상황: {scores_created}개 점수 생성됨")
-
-            # 최종 커밋
             session.commit()
 
             print(f"\n✅ 완료!")
             print(
-                f"총 {len(products)}개 웨딩홀에 대해 {scores_created}개의 점수를 생성했습니다."
-            )
-            print(
-                f"웨딩홀당 평균 {scores_created/len(products):.1f}개의 점수가 생성되었습니다."
+                f"총 {len(product_ids)}개 웨딩홀에 대해 {len(rows)}개의 점수를 생성했습니다."
             )
+            if product_ids:
+                print(
+                    f"웨딩홀당 평균 {len(rows)/len(product_ids):.1f}개의 점수가 생성되었습니다."
+                )
 
         except Exception as e:
             session.rollback()
@@ -0,0 +1,79 @@
+"""
+상품 AI 점수 대량 가져오기
+
+CSV(product_id,score_type,value 헤더) 또는 JSON 배열 파일을 읽어 열 단위로 검증하고,
+유효한 점수를 (product_id, score_type) 기준으로 업서트한 뒤 점수 백분위와 유사 웨딩홀을 한 번 재계산한다.
+API 워커의 점수 행렬/통계는 주기적 갱신(CATALOGUE_INDEX_REFRESH_SECONDS)으로 반영된다.
+
+실행: PYTHONPATH=src python scripts/import_ai_scores.py scores.csv [--dry-run]
+"""
+
+import argparse
+import asyncio
+import json
+
+import numpy as np
+
+from core.db import async_session
+from core.score_percentiles import rebuild_score_percentiles
+from core.similar_halls import rebuild_similar_halls
+from crud import product_score as crud_score
+from utils.score_import import (
+    MAX_REPORTED_ERRORS,
+    read_score_csv,
+    read_score_items,
+    validate_score_batch,
+)
+
+
+def read_score_file(path: str):
+    """확장자에 따라 CSV(줄 단위 스트리밍) 또는 JSON 배열로 읽기"""
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        if path.endswith(".json"):
+            return read_score_items(json.load(file))
+        return read_score_csv(file)
+
+
+async def import_scores(path: str, dry_run: bool = False):
+    batch = read_score_file(path)
+    print(f"📄 {len(batch)}개 행을 읽었습니다.")
+
+    async with async_session() as session:
+        known_product_ids = await crud_score.get_existing_product_ids(
+            db=session, product_ids=np.unique(batch.product_ids).tolist()
+        )
+        valid, errors = validate_score_batch(
+            batch, known_product_ids=known_product_ids
+        )
+
+        for error in errors[:MAX_REPORTED_ERRORS]:
+            print(f"  ⚠️  {error['line']}행: {error['reason']}")
+        if len(errors) > MAX_REPORTED_ERRORS:
+            print(f"  ... 외 {len(errors) - MAX_REPORTED_ERRORS}건")
+        print(f"🔍 유효 {len(valid)}건, 제외 {len(errors)}건")
+
+        if dry_run or not len(valid):
+            return
+
+        imported = await crud_score.upsert_scores(db=session, rows=valid.rows())
+        await session.commit()
+        print(f"💾 {imported}개 점수를 저장했습니다.")
+
+        count = await rebuild_score_percentiles(session)
+        print(f"📊 웨딩홀 {count}곳의 점수 백분위를 다시 계산했습니다.")
+
+        count = await rebuild_similar_halls(session)
+        print(f"✅ 유사 웨딩홀 {count}건을 다시 계산했습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상품 AI 점수 대량 가져오기")
+    parser.add_argument("path", help="CSV 또는 JSON 파일 경로")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 하고 저장하지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(import_scores(args.path, dry_run=args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
-from datetime import datetime
-
 import psycopg2
 import requests
 from psycopg2.extras import RealDictCursor
 from sqlalchemy import create_engine
 
 from core.config import settings
+from models.product_halls import refresh_venue_amenity_images
+from models.product_images import ProductImage
+from utils.bulk_writer import BulkWriter
 
 PROD_PG_CONNECTION = {
     "host": settings.POSTGRES_SERVER,
@@ -45,62 +46,52 @@ def get_image_type_from_category(category_name):
 
 
 def insert_product_image(
-    cursor, product_id, image_url, image_type, title=None, order=0
-):
-    """이미지를 product_images 테이블에 저장"""
-    try:
-        # 중복 체크
-        cursor.execute(
-            """
-            SELECT id FROM product_images 
-            WHERE product_id = %s AND image_url = %s AND is_deleted = false
-            """,
-            (product_id, image_url),
-        )
-
-        existing = cursor.fetchone()
-        if existing:
-            # print(f"  ⚠️  이미지가 이미 존재합니다: {image_url}")
-            return existing["id"]
-
-        # 새 이미지 삽입
-        insert_query = """
-            INSERT INTO product_images 
-            (product_id, image_url, image_type, "order", is_deleted, created_datetime, updated_datetime)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
+    writer: BulkWriter,
+    existing: set[tuple[int, str]],
+    product_id,
+    image_url,
+    image_type,
+    title=None,
+    order=0,
+) -> bool:
+    """이미지를 product_images 저장 버퍼에 추가 (이미 있는 이미지면 False)"""
+    # 중복 체크 (미리 조회한 (product_id, image_url) 집합 사용)
+    if (product_id, image_url) in existing:
+        return False
+
+    existing.add((product_id, image_url))
+    writer.add(
+        {
+            "product_id": product_id,
+            "image_url": image_url,
+            "image_type": image_type,
+            "order": order,
+            "is_deleted": False,
+        }
+    )
+    return True
+
+
+def load_existing_images(cursor, product_ids: list[int]) -> set[tuple[int, str]]:
+    """대상 상품들의 기존 이미지 (product_id, image_url) 를 한 번에 조회"""
+    cursor.execute(
         """
-
-        current_time = datetime.now()
-
-        cursor.execute(
-            insert_query,
-            (
-                product_id,
-                image_url,
-                image_type,
-                order,
-                False,  # is_deleted
-                current_time,  # created_datetime
-                current_time,  # updated_datetime
-            ),
-        )
-
-        result = cursor.fetchone()
-        image_id = result["id"]
-
-        print(f"  ✅ 이미지 저장 완료: ID={image_id}, Type={image_type}")
-        return image_id
-
-    except Exception as e:
-        print(f"  ❌ 이미지 저장 실패: {e}")
-        return None
-
-
-def process_facility_images(cursor, product_id, hall_type_etc_list):
-    """부대시설 이미지 처리"""
+        SELECT product_id, image_url FROM product_images
+        WHERE product_id = ANY(%s) AND is_deleted = false
+        """,
+        (product_ids,),
+    )
+    return {(row["product_id"], row["image_url"]) for row in cursor.fetchall()}
+
+
+def process_facility_images(
+    writer: BulkWriter, existing: set, product_id, hall_type_etc_list
+) -> int:
+    """부대시설 이미지 처리 (새로 추가한 이미지 수 반환)"""
     print(f"  🏢 부대시설 이미지 처리 중...")
 
+    added = 0
+
     BASE_URL = "https://www.iwedding.co.kr"
 
     for hall_type_etc in hall_type_etc_list:
@@ -123,8 +114,9 @@ def process_facility_images(cursor, product_id, hall_type_etc_list):
             image_type = get_image_type_from_category(category)
 
             # 이미지 저장 (부대시설은 product_venue_id 없음)
-            insert_product_image(
-                cursor=cursor,
+            added += insert_product_image(
+                writer=writer,
+                existing=existing,
                 product_id=product_id,
                 image_url=image_url,
                 image_type=image_type,
@@ -132,6 +124,8 @@ def process_facility_images(cursor, product_id, hall_type_etc_list):
                 order=idx,
             )
 
+    return added
+
 
 if __name__ == "__main__":
     conn = connect_to_reference_postgres()
@@ -146,79 +140,82 @@ if __name__ == "__main__":
 
         API_URL = "https://com.ifamily.co.kr:6900/api/v1/detail/hall/"
 
+        # 대상 상품과 기존 이미지를 한 번에 조회
+        cursor.execute(
+            "SELECT id, name, enterprise_code FROM products WHERE enterprise_code = ANY(%s) AND is_deleted = false",
+            ([str(hall["enterprise_code"]) for hall in iw_halls],),
+        )
+        products_by_code = {row["enterprise_code"]: row for row in cursor.fetchall()}
+        existing = load_existing_images(
+            cursor, [product["id"] for product in products_by_code.values()]
+        )
+
         success_count = 0
         error_count = 0
-
-        for idx, hall in enumerate(iw_halls, 1):
-            enterprise_code = hall["enterprise_code"]
-            print(
-                f"\n[{idx}/{len(iw_halls)}] 🏛️  처리 중: enterprise_code = {enterprise_code}"
-            )
-
-            try:
-                # 제품 조회
-                cursor.execute(
-                    "SELECT id, name FROM products WHERE enterprise_code = %s AND is_deleted = false",
-                    (str(enterprise_code),),
-                )
-
-                product = cursor.fetchone()
-                if not product:
-                    print(f"  ❌ 제품을 찾을 수 없습니다: {enterprise_code}")
-                    error_count += 1
-                    continue
-
-                product_id = product["id"]
-                product_name = product["name"]
-                print(f"  📍 제품 발견: {product_name} (ID: {product_id})")
-
-                # API 호출
-                try:
-                    res = requests.get(API_URL + str(enterprise_code), timeout=10)
-                except requests.exceptions.RequestException as e:
-                    print(f"  ❌ API 호출 실패: {e}")
-                    error_count += 1
-                    continue
-
-                if res.status_code != 200:
-                    print(f"  ❌ API 응답 오류: {res.status_code}")
-                    error_count += 1
-                    continue
-
-                try:
-                    data = res.json()
-                except ValueError as e:
-                    print(f"  ❌ JSON 파싱 실패: {e}")
-                    error_count += 1
-                    continue
-
-                # 부대시설 데이터 추출
-                hall_type_etc_list = data.get("hallTypeEtcList", [])
-
-                print(f"  📊 데이터 요약:")
-                print(f"    - 부대시설: {len(hall_type_etc_list)}개")
-
-                # 이미지 저장 시작
-                images_saved = 0
-
-                # 부대시설 이미지 처리
-                if hall_type_etc_list:
-                    process_facility_images(cursor, product_id, hall_type_etc_list)
-                    images_saved += sum(
-                        len(hte.get("data", [])) for hte in hall_type_etc_list
+        product_ids = set()
+
+        # 이미지는 버퍼에 모아 COPY 로 일괄 저장
+        with target_engine.begin() as connection:
+            with BulkWriter(connection, ProductImage) as writer:
+                for idx, hall in enumerate(iw_halls, 1):
+                    enterprise_code = hall["enterprise_code"]
+                    print(
+                        f"\n[{idx}/{len(iw_halls)}] 🏛️  처리 중: enterprise_code = {enterprise_code}"
                     )
 
-                # 변경사항 커밋
-                conn.commit()
-
-                print(f"  ✅ 완료: 약 {images_saved}개 이미지 처리됨")
-                success_count += 1
-
-            except Exception as e:
-                print(f"  ❌ 처리 실패: {e}")
-                conn.rollback()
-                error_count += 1
-                continue
+                    # 제품 조회
+                    product = products_by_code.get(str(enterprise_code))
+                    if not product:
+                        print(f"  ❌ 제품을 찾을 수 없습니다: {enterprise_code}")
+                        error_count += 1
+                        continue
+
+                    product_id = product["id"]
+                    product_name = product["name"]
+                    print(f"  📍 제품 발견: {product_name} (ID: {product_id})")
+
+                    # API 호출
+                    try:
+                        res = requests.get(API_URL + str(enterprise_code), timeout=10)
+                    except requests.exceptions.RequestException as e:
+                        print(f"  ❌ API 호출 실패: {e}")
+                        error_count += 1
+                        continue
+
+                    if res.status_code != 200:
+                        print(f"  ❌ API 응답 오류: {res.status_code}")
+                        error_count += 1
+                        continue
+
+                    try:
+                        data = res.json()
+                    except ValueError as e:
+                        print(f"  ❌ JSON 파싱 실패: {e}")
+                        error_count += 1
+                        continue
+
+                    # 부대시설 데이터 추출
+                    hall_type_etc_list = data.get("hallTypeEtcList", [])
+
+                    print(f"  📊 데이터 요약:")
+                    print(f"    - 부대시설: {len(hall_type_etc_list)}개")
+
+                    # 부대시설 이미지 처리
+                    images_saved = 0
+                    if hall_type_etc_list:
+                        images_saved = process_facility_images(
+                            writer, existing, product_id, hall_type_etc_list
+                        )
+                        product_ids.add(product_id)
+
+                    print(f"  ✅ 완료: {images_saved}개 이미지 추가")
+                    success_count += 1
+
+            # COPY 는 ORM 이벤트를 거치지 않으므로 베뉴 편의시설 이미지를 직접 갱신
+            if product_ids:
+                refresh_venue_amenity_images(connection, product_ids=product_ids)
+
+        print(f"\n💾 저장된 이미지: {writer.written}개")
 
         # 최종 결과
         print(f"\n🎉 처리 완료!")
@@ -227,7 +224,6 @@ if __name__ == "__main__":
 
     except Exception as e:
         print(f"❌ 전체 프로세스 오류: {e}")
-        conn.rollback()
 
     finally:
         cursor.close()
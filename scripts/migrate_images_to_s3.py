@@ -1,16 +1,37 @@
+"""
+상품 이미지를 WebP 로 변환해 S3 로 이전하고 product_images.image_url 을 교체
+
+URL 을 바꾼 상품은 같은 트랜잭션에서 베뉴 이미지 컬럼
+(product_hall_venues.amenity_images, image_urls)도 다시 계산한다.
+
+중단되면 체크포인트 파일(마지막으로 반영한 이미지 id)에서 이어서 처리한다.
+
+실행: PYTHONPATH=src python scripts/migrate_images_to_s3.py [--reset]
+"""
+
+import argparse
 import asyncio
-import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Any
 
 import aiohttp
 import boto3
 import psycopg2
-from PIL import Image
 from botocore.exceptions import ClientError
 from psycopg2.extras import RealDictCursor
+from sqlalchemy import bindparam, update
+from sqlalchemy.engine import URL
+from sqlmodel import create_engine
 
 from core.config import settings
+from models.product_halls import refresh_venue_amenity_images
+from models.product_images import ProductImage
+from utils.image_processing import convert_to_webp
+from utils.image_storage import build_image_key
 
 # 설정값들
 AWS_S3_BUCKET = "serenade-prod-images"  # S3 버킷명
@@ -19,6 +40,12 @@ CLOUDFRONT_DOMAIN = "d8erw6l13w214.cloudfront.net"  # CloudFront 도메인 (배
 USE_CLOUDFRONT = True  # CloudFront 사용 여부
 MAX_CONCURRENT_DOWNLOADS = 10  # 동시 다운로드 수
 CHUNK_SIZE = 100  # 한 번에 처리할 이미지 수
+MAX_CONVERT_WORKERS = os.cpu_count() or 4  # WebP 변환 프로세스 수
+MAX_UPLOAD_WORKERS = 16  # S3 업로드 스레드 수
+CHECKPOINT_FILE = "migrate_images_to_s3.checkpoint.json"  # 재시작 지점 저장 파일
+STAGES = ("download", "convert", "upload", "db")
+# 이미 이전된 이미지 URL 패턴
+MIGRATED_URL_PATTERN = "https://serenade-prod%"
 
 
 # PostgreSQL 연결 정보 (환경변수에서 가져오기)
@@ -32,13 +59,63 @@ DB_CONFIG = {
 
 
 class ImageMigrator:
-    def __init__(self):
-        # S3 클라이언트 초기화
+    """
+    다운로드(이벤트 루프) -> WebP 변환(프로세스 풀) -> S3 업로드(스레드 풀) -> DB 반영(청크 단위 일괄)
+
+    청크의 DB 반영이 끝날 때마다 마지막 이미지 id 를 체크포인트 파일에 기록하므로
+    중단 후 다시 실행하면 그 다음 id 부터 이어서 처리한다.
+    """
+
+    def __init__(self, checkpoint_file: str = CHECKPOINT_FILE):
+        # S3 클라이언트 초기화 (boto3 클라이언트는 스레드 간 공유 가능)
         self.s3_client = boto3.client("s3", region_name=AWS_REGION)
         self.session = None
+        self.checkpoint_file = checkpoint_file
+        self.convert_pool = ProcessPoolExecutor(max_workers=MAX_CONVERT_WORKERS)
+        self.upload_pool = ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS)
+        # URL 반영과 베뉴 이미지 재계산을 한 트랜잭션으로 묶기 위한 엔진
+        # (values_plus_batch: UPDATE executemany 를 execute_batch 로 실행)
+        self.engine = create_engine(
+            URL.create(
+                "postgresql+psycopg2",
+                username=DB_CONFIG["user"],
+                password=DB_CONFIG["password"],
+                host=DB_CONFIG["host"],
+                port=DB_CONFIG["port"],
+                database=DB_CONFIG["database"],
+            ),
+            executemany_mode="values_plus_batch",
+        )
 
         # 통계용 변수들
         self.stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0, "errors": []}
+        # 단계별 처리 건수, 바이트, 누적 소요 시간(초)
+        self.stage_stats = {
+            stage: {"count": 0, "bytes": 0, "seconds": 0.0} for stage in STAGES
+        }
+
+    def record_stage(self, stage: str, started: float, size: int = 0, count: int = 1):
+        """단계별 처리량 기록"""
+        stat = self.stage_stats[stage]
+        stat["count"] += count
+        stat["bytes"] += size
+        stat["seconds"] += time.perf_counter() - started
+
+    def load_checkpoint(self) -> int:
+        """마지막으로 반영이 끝난 이미지 id (없으면 0)"""
+        if not os.path.exists(self.checkpoint_file):
+            return 0
+        with open(self.checkpoint_file, encoding="utf-8") as f:
+            return json.load(f).get("last_id", 0)
+
+    def save_checkpoint(self, last_id: int):
+        """청크 반영 후 체크포인트 기록 (임시 파일 교체로 원자적 저장)"""
+        tmp_file = f"{self.checkpoint_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"last_id": last_id, "updated_at": datetime.now().isoformat()}, f
+            )
+        os.replace(tmp_file, self.checkpoint_file)
 
     def get_db_connection(self):
         """PostgreSQL 연결"""
@@ -57,28 +134,7 @@ class ImageMigrator:
         image_type: str = None,
     ) -> str:
         """S3 키 생성 (경로 구조: product_id/venue_id/image_type_image_id.webp)"""
-        # 이미지 타입을 파일명에 포함
-        if image_type:
-            # 이미지 타입을 안전한 파일명으로 변환
-            safe_type = "".join(
-                c if c.isalnum() or c in "-_" else "_" for c in image_type
-            )
-            filename = f"{safe_type}_{image_id}.webp"
-        else:
-            filename = f"{image_id}.webp"
-
-        # 기본 경로: products/{product_id}
-        path_parts = ["products", str(product_id)]
-
-        # venue_id가 있으면 추가
-        if product_venue_id:
-            path_parts.append(f"venue_{product_venue_id}")
-        else:
-            path_parts.append("common")  # venue가 없는 공통 이미지
-
-        # 최종 경로 생성
-        path_parts.append(filename)
-        return "/".join(path_parts)
+        return build_image_key(image_id, product_id, product_venue_id, image_type)
 
     def generate_s3_url(self, s3_key: str) -> str:
         """S3 또는 CloudFront URL 생성"""
@@ -89,7 +145,7 @@ class ImageMigrator:
 
     async def download_image(
         self, session: aiohttp.ClientSession, url: str
-    ) -> Optional[bytes]:
+    ) -> bytes | None:
         """이미지 다운로드"""
         try:
             # 타임아웃 설정 (연결 10초, 읽기 30초)
@@ -109,33 +165,32 @@ class ImageMigrator:
             print(f"  ❌ 다운로드 실패: {url} - {e}")
             return None
 
-    def convert_to_webp(self, image_data: bytes, quality: int = 85) -> Optional[bytes]:
-        """이미지를 WebP로 변환"""
+    async def convert_to_webp(
+        self, image_data: bytes, quality: int = 85
+    ) -> bytes | None:
+        """이미지를 WebP로 변환 (CPU 작업이므로 프로세스 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
         try:
-            # PIL로 이미지 열기
-            with Image.open(io.BytesIO(image_data)) as img:
-                # RGBA를 RGB로 변환 (WebP 호환성을 위해)
-                if img.mode in ("RGBA", "LA", "P"):
-                    background = Image.new("RGB", img.size, (255, 255, 255))
-                    if img.mode == "P":
-                        img = img.convert("RGBA")
-                    if img.mode in ("RGBA", "LA"):
-                        background.paste(
-                            img, mask=img.split()[-1] if img.mode == "RGBA" else None
-                        )
-                    img = background
-                elif img.mode != "RGB":
-                    img = img.convert("RGB")
-
-                # WebP로 변환
-                output = io.BytesIO()
-                img.save(output, format="WEBP", quality=quality, optimize=True)
-                return output.getvalue()
-
+            return await loop.run_in_executor(
+                self.convert_pool, convert_to_webp, image_data, quality
+            )
         except Exception as e:
             print(f"  ❌ 이미지 변환 실패: {e}")
             return None
 
+    async def exists_in_s3(self, s3_key: str) -> bool:
+        """S3 에 이미 업로드된 키인지 확인 (스레드 풀에서 실행)"""
+
+        def head_object():
+            try:
+                self.s3_client.head_object(Bucket=AWS_S3_BUCKET, Key=s3_key)
+                return True
+            except ClientError:
+                return False
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.upload_pool, head_object)
+
     def upload_to_s3(self, s3_key: str, image_data: bytes) -> bool:
         """S3에 이미지 업로드"""
         try:
@@ -159,23 +214,33 @@ class ImageMigrator:
             print(f"  ❌ 업로드 오류: {e}")
             return False
 
-    def update_image_url_in_db(self, image_id: int, new_url: str):
-        """데이터베이스의 이미지 URL 업데이트"""
-        try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-
-            update_query = """
-                UPDATE product_images 
-                SET image_url = %s, updated_datetime = %s 
-                WHERE id = %s
-            """
-
-            cursor.execute(update_query, (new_url, datetime.now(), image_id))
-            conn.commit()
+    def update_image_urls_in_db(
+        self, updates: list[tuple], product_ids: set[int]
+    ) -> bool:
+        """
+        데이터베이스의 이미지 URL 일괄 업데이트 (updates: [(image_id, new_url)])
+        URL 을 바꾼 상품(product_ids)의 베뉴 이미지 컬럼도 같은 트랜잭션에서 재계산
+        """
+        if not updates:
+            return True
 
-            cursor.close()
-            conn.close()
+        try:
+            now = datetime.now()
+            with self.engine.begin() as connection:
+                connection.execute(
+                    update(ProductImage)
+                    .where(ProductImage.id == bindparam("image_id"))
+                    .values(
+                        image_url=bindparam("new_url"),
+                        updated_datetime=bindparam("now"),
+                    ),
+                    [
+                        {"image_id": image_id, "new_url": new_url, "now": now}
+                        for image_id, new_url in updates
+                    ],
+                )
+                # raw UPDATE 는 after_flush 리스너를 거치지 않으므로 직접 갱신
+                refresh_venue_amenity_images(connection, product_ids=product_ids)
             return True
 
         except Exception as e:
@@ -183,100 +248,116 @@ class ImageMigrator:
             return False
 
     async def process_image(
-        self, session: aiohttp.ClientSession, image_record: Dict[str, Any]
-    ) -> bool:
-        """단일 이미지 처리"""
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        image_record: dict[str, Any],
+    ) -> tuple | None:
+        """단일 이미지 처리 (DB 에 반영할 (image_id, s3_url) 반환, 실패 시 None)"""
         image_id = image_record["id"]
         product_id = image_record["product_id"]
         product_venue_id = image_record.get("product_venue_id")
         original_url = image_record["image_url"]
         image_type = image_record.get("image_type", "general")
 
-        print(
-            f"  📥 처리 중: ID={image_id}, Product={product_id}, Venue={product_venue_id}, Type={image_type}"
-        )
-        print(f"      원본: {original_url}")
-
         # S3 키 생성
         s3_key = self.generate_s3_key(
             image_id, product_id, product_venue_id, image_type
         )
         s3_url = self.generate_s3_url(s3_key)
 
-        print(f"      저장 경로: {s3_key}")
-
-        # S3에 이미 존재하는지 확인
-        try:
-            self.s3_client.head_object(Bucket=AWS_S3_BUCKET, Key=s3_key)
+        # S3에 이미 존재하면 DB URL만 업데이트
+        if await self.exists_in_s3(s3_key):
             print(f"  ⚠️  이미 존재함, 스킵: {s3_key}")
+            self.stats["skipped"] += 1
+            return image_id, s3_url
 
-            # DB URL만 업데이트
-            if self.update_image_url_in_db(image_id, s3_url):
-                self.stats["skipped"] += 1
-                return True
-            else:
-                self.stats["failed"] += 1
-                return False
-
-        except ClientError:
-            # 파일이 존재하지 않음, 계속 진행
-            pass
-
-        # 1. 이미지 다운로드
-        image_data = await self.download_image(session, original_url)
+        # 1. 이미지 다운로드 (동시 다운로드 수 제한)
+        async with semaphore:
+            started = time.perf_counter()
+            image_data = await self.download_image(session, original_url)
         if not image_data:
             self.stats["failed"] += 1
             self.stats["errors"].append(
                 f"다운로드 실패: ID={image_id}, URL={original_url}"
             )
-            return False
+            return None
+        self.record_stage("download", started, len(image_data))
 
         # 2. WebP로 변환
-        webp_data = self.convert_to_webp(image_data)
+        started = time.perf_counter()
+        webp_data = await self.convert_to_webp(image_data)
         if not webp_data:
             self.stats["failed"] += 1
             self.stats["errors"].append(f"변환 실패: ID={image_id}")
-            return False
+            return None
+        self.record_stage("convert", started, len(webp_data))
 
         # 3. S3 업로드
-        if not self.upload_to_s3(s3_key, webp_data):
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        uploaded = await loop.run_in_executor(
+            self.upload_pool, self.upload_to_s3, s3_key, webp_data
+        )
+        if not uploaded:
             self.stats["failed"] += 1
             self.stats["errors"].append(f"S3 업로드 실패: ID={image_id}, Key={s3_key}")
-            return False
-
-        # 4. DB URL 업데이트
-        if not self.update_image_url_in_db(image_id, s3_url):
-            self.stats["failed"] += 1
-            self.stats["errors"].append(f"DB 업데이트 실패: ID={image_id}")
-            return False
+            return None
+        self.record_stage("upload", started, len(webp_data))
 
-        print(f"  ✅ 완료: {s3_url}")
+        print(f"  ✅ 완료: ID={image_id} -> {s3_url}")
         self.stats["success"] += 1
-        return True
-
-    async def process_image_batch(self, image_records: List[Dict[str, Any]]):
-        """이미지 배치 처리"""
-        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_DOWNLOADS)
-        timeout = aiohttp.ClientTimeout(total=60)
+        return image_id, s3_url
 
-        async with aiohttp.ClientSession(
-            connector=connector, timeout=timeout
-        ) as session:
-            # 세마포어로 동시 다운로드 수 제한
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
-
-            async def process_with_semaphore(image_record):
-                async with semaphore:
-                    return await self.process_image(session, image_record)
+    async def process_image_batch(
+        self, session: aiohttp.ClientSession, image_records: list[dict[str, Any]]
+    ) -> list[int] | None:
+        """
+        이미지 배치 처리 후 성공한 이미지 URL 을 한 번에 DB 반영
+        실패한 이미지 id 목록 반환 (DB 반영 자체가 실패하면 None)
+        """
+        # 세마포어로 동시 다운로드 수 제한
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+        # 모든 이미지 병렬 처리
+        tasks = [
+            self.process_image(session, semaphore, record) for record in image_records
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        updates = []
+        product_ids = set()
+        failed_ids = []
+        for record, result in zip(image_records, results, strict=True):
+            if isinstance(result, Exception):
+                self.stats["failed"] += 1
+                self.stats["errors"].append(f"처리 오류: ID={record['id']} - {result}")
+                failed_ids.append(record["id"])
+            elif result:
+                updates.append(result)
+                product_ids.add(record["product_id"])
+            else:
+                failed_ids.append(record["id"])
 
-            # 모든 이미지 병렬 처리
-            tasks = [process_with_semaphore(record) for record in image_records]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        # 4. DB URL 일괄 업데이트 (블로킹 I/O 이므로 스레드에서 실행)
+        started = time.perf_counter()
+        if not await asyncio.to_thread(
+            self.update_image_urls_in_db, updates, product_ids
+        ):
+            self.stats["errors"].append(
+                f"DB 업데이트 실패: ID={updates[0][0]}~{updates[-1][0]}"
+            )
+            return None
+        self.record_stage("db", started, count=len(updates))
+        return failed_ids
 
     def get_image_records(
-        self, offset: int = 0, limit: int = CHUNK_SIZE
-    ) -> List[Dict[str, Any]]:
-        """DB에서 이미지 레코드 조회"""
+        self, after_id: int = 0, limit: int = CHUNK_SIZE
+    ) -> list[dict[str, Any]]:
+        """
+        DB에서 이미지 레코드 조회 (id 기준 keyset 페이지네이션)
+        처리한 이미지는 조건에서 빠지므로 OFFSET 대신 마지막 id 이후를 조회
+        """
         conn = self.get_db_connection()
         cursor = conn.cursor()
 
@@ -287,13 +368,14 @@ class ImageMigrator:
                 AND image_url IS NOT NULL 
                 AND image_url != ''
                 AND image_url NOT LIKE %(pattern)s
-                ORDER BY product_id, product_venue_id, image_type, id
-                LIMIT %(limit)s OFFSET %(offset)s
+                AND id > %(after_id)s
+                ORDER BY id
+                LIMIT %(limit)s
             """
 
         cursor.execute(
             query,
-            {"pattern": "https://serenade-prod%", "limit": limit, "offset": offset},
+            {"pattern": MIGRATED_URL_PATTERN, "limit": limit, "after_id": after_id},
         )
         records = cursor.fetchall()
 
@@ -302,8 +384,8 @@ class ImageMigrator:
 
         return [dict(record) for record in records]
 
-    def get_total_count(self) -> int:
-        """전체 이미지 수 조회"""
+    def get_total_count(self, after_id: int = 0) -> int:
+        """남은 처리 대상 이미지 수 조회"""
         conn = self.get_db_connection()
         cursor = conn.cursor()
 
@@ -313,9 +395,11 @@ class ImageMigrator:
             WHERE is_deleted = false 
             AND image_url IS NOT NULL 
             AND image_url != ''
+            AND image_url NOT LIKE %(pattern)s
+            AND id > %(after_id)s
         """
 
-        cursor.execute(query)
+        cursor.execute(query, {"pattern": MIGRATED_URL_PATTERN, "after_id": after_id})
         result = cursor.fetchone()
 
         cursor.close()
@@ -327,10 +411,18 @@ class ImageMigrator:
         """마이그레이션 실행"""
         print("🚀 이미지 마이그레이션 시작")
         print(f"📊 대상 버킷: {AWS_S3_BUCKET}")
-        print(f"🔧 설정: 동시처리={MAX_CONCURRENT_DOWNLOADS}, 배치크기={CHUNK_SIZE}")
+        print(
+            f"🔧 설정: 동시다운로드={MAX_CONCURRENT_DOWNLOADS}, "
+            f"변환프로세스={MAX_CONVERT_WORKERS}, 업로드스레드={MAX_UPLOAD_WORKERS}, "
+            f"배치크기={CHUNK_SIZE}"
+        )
+
+        last_id = self.load_checkpoint()
+        if last_id:
+            print(f"♻️  체크포인트에서 재시작: ID {last_id} 이후")
 
-        # 전체 이미지 수 확인
-        total_count = self.get_total_count()
+        # 남은 이미지 수 확인
+        total_count = self.get_total_count(last_id)
         self.stats["total"] = total_count
 
         print(f"📈 총 처리 대상: {total_count}개 이미지")
@@ -339,29 +431,60 @@ class ImageMigrator:
             print("❌ 처리할 이미지가 없습니다.")
             return
 
-        # 배치 단위로 처리
-        offset = 0
-        batch_num = 1
-
-        while offset < total_count:
-            print(f"\n📦 배치 {batch_num} 처리 중 (오프셋: {offset})")
-
-            # 배치 데이터 조회
-            image_records = self.get_image_records(offset, CHUNK_SIZE)
-
-            if not image_records:
-                break
-
-            # 배치 처리
-            await self.process_image_batch(image_records)
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_DOWNLOADS)
+        timeout = aiohttp.ClientTimeout(total=60)
 
-            # 진행률 출력
-            processed = min(offset + CHUNK_SIZE, total_count)
-            progress = (processed / total_count) * 100
-            print(f"📊 진행률: {processed}/{total_count} ({progress:.1f}%)")
+        self.started_at = time.perf_counter()
+        processed = 0
+        batch_num = 1
+        # 실패한 이미지가 나오면 체크포인트를 그 직전에 고정 (다음 실행에서 재시도)
+        checkpoint_held = False
 
-            offset += CHUNK_SIZE
-            batch_num += 1
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector, timeout=timeout
+            ) as session:
+                while True:
+                    print(f"\n📦 배치 {batch_num} 처리 중 (ID {last_id} 이후)")
+
+                    # 배치 데이터 조회
+                    image_records = self.get_image_records(last_id, CHUNK_SIZE)
+
+                    if not image_records:
+                        break
+
+                    # 배치 처리 (DB 반영에 실패하면 체크포인트를 남기고 중단)
+                    failed_ids = await self.process_image_batch(session, image_records)
+                    if failed_ids is None:
+                        print("🛑 DB 반영 실패로 중단합니다. 다시 실행하면 이어서 처리합니다.")
+                        break
+
+                    # 반영된 이미지는 조회 조건에서 빠지므로, 다시 실행하면
+                    # 고정된 체크포인트 이후에서 실패한 이미지만 다시 조회된다
+                    last_id = image_records[-1]["id"]
+                    if failed_ids and not checkpoint_held:
+                        self.save_checkpoint(min(failed_ids) - 1)
+                        checkpoint_held = True
+                    elif not checkpoint_held:
+                        self.save_checkpoint(last_id)
+
+                    # 진행률 출력
+                    processed += len(image_records)
+                    progress = (processed / total_count) * 100
+                    elapsed = time.perf_counter() - self.started_at
+                    print(
+                        f"📊 진행률: {processed}/{total_count} ({progress:.1f}%), "
+                        f"{processed / elapsed:.1f}개/초"
+                    )
+
+                    batch_num += 1
+        finally:
+            self.convert_pool.shutdown()
+            self.upload_pool.shutdown()
+            self.engine.dispose()
+
+        if checkpoint_held:
+            print("♻️  실패한 이미지가 있습니다. 다시 실행하면 실패한 이미지부터 재시도합니다.")
 
         # 최종 결과 출력
         self.print_final_stats()
@@ -390,12 +513,37 @@ class ImageMigrator:
             else 0
         )
         print(f"\n📈 성공률: {success_rate:.1f}%")
+        self.print_stage_stats()
+
+    def print_stage_stats(self):
+        """단계별 처리량 출력"""
+        elapsed = time.perf_counter() - getattr(self, "started_at", time.perf_counter())
+        print(f"\n⏱️  단계별 처리량 (전체 {elapsed:.1f}초)")
+        for stage, stat in self.stage_stats.items():
+            if not stat["count"]:
+                continue
+            mb = stat["bytes"] / 1024 / 1024
+            avg_ms = stat["seconds"] / stat["count"] * 1000
+            print(
+                f"  {stage:<8} {stat['count']:>7}건  {mb:>9.1f}MB  "
+                f"평균 {avg_ms:>7.1f}ms/건  {stat['count'] / max(elapsed, 1e-9):>7.1f}건/초"
+            )
 
 
 async def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="상품 이미지 S3 마이그레이션")
+    parser.add_argument(
+        "--reset", action="store_true", help="체크포인트를 지우고 처음부터 실행"
+    )
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE)
+    args = parser.parse_args()
+
+    if args.reset and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
     try:
-        migrator = ImageMigrator()
+        migrator = ImageMigrator(checkpoint_file=args.checkpoint)
         await migrator.run_migration()
 
     except KeyboardInterrupt:
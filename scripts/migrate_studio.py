@@ -1,15 +1,18 @@
 import re
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from sqlmodel import Session, create_engine
+from sqlmodel import create_engine
 
 from core.config import settings
 from models import ProductStudioPackage
 from models.product_studios import ProductStudio
 from models.products import Product
-from utils.utils import utc_now
+from utils.bulk_writer import BulkWriter
+from utils.search_text import SEARCH_TEXT_COLUMNS, build_search_text
+from utils.studio_packages import selling_price
+from utils.studio_scenes import pack_scene_flags
 
 PROD_PG_CONNECTION = {
     "host": settings.POSTGRES_SERVER,
@@ -19,6 +22,9 @@ PROD_PG_CONNECTION = {
     "port": settings.POSTGRES_PORT,
 }
 
+EXTRACT_CHUNK_SIZE = 200  # enterprises per set-based extraction
+EXTRACT_WORKERS = 4  # concurrent extraction connections
+
 target_env = "prod"
 target_database = (
     settings.DATABASE_URI.replace("postgresql+asyncpg", "postgresql")
@@ -98,14 +104,19 @@ def get_enterprise_data(conn):
     return enterprises
 
 
-def get_product_detail(conn, product_id, enterprise_code):
-    """Get detailed information for a specific product."""
+def fetch_product_details(conn, enterprise_codes: list[str]) -> dict[str, list[dict]]:
+    """
+    Get detailed product information for many enterprises at once.
+
+    Runs one set-based query per source table instead of five queries per product,
+    and returns enterprise_code -> product details (ordered by product no).
+    """
     cursor = conn.cursor(cursor_factory=RealDictCursor)
 
-    # Get product details
+    # Get product details (one detail row per product, as the old fetchone did)
     cursor.execute(
         """
-    SELECT 
+    SELECT DISTINCT ON (p.enterprise_code, p.no)
         p.no, 
         p.enterprise_code, 
         p.name, 
@@ -126,72 +137,102 @@ def get_product_detail(conn, product_id, enterprise_code):
     LEFT JOIN 
         reference.iw_studio_product_details pd ON p.no = pd.product_no
     WHERE 
-        p.no = %s AND p.enterprise_code = %s
+        p.enterprise_code = ANY(%s)
+    ORDER BY
+        p.enterprise_code, p.no, pd.ctid
     """,
-        (product_id, enterprise_code),
+        (enterprise_codes,),
     )
-
-    product = cursor.fetchone()
-    if not product:
-        return None
+    products = cursor.fetchall()
+    for product in products:
+        product["product_info"] = []
+        product["options"] = []
+        product["addcosts"] = []
+        product["tag"] = []
+
+    # 상품 번호로 하위 데이터를 붙임 (같은 번호가 여러 업체에 있을 수 있음)
+    products_by_no: dict = {}
+    for product in products:
+        products_by_no.setdefault(product["no"], []).append(product)
+    product_nos = list(products_by_no)
+
+    def attach(key: str, query: str):
+        cursor.execute(query, (product_nos,))
+        for row in cursor.fetchall():
+            product_no = row.pop("product_no")
+            for product in products_by_no.get(product_no, []):
+                product[key].append(row)
 
     # Get product info
-    cursor.execute(
+    attach(
+        "product_info",
         """
-    SELECT title, value, description
+    SELECT product_no, title, value, description
     FROM reference.iw_studio_product_info
-    WHERE product_no = %s
+    WHERE product_no = ANY(%s)
     """,
-        (product_id,),
     )
-    product_info = cursor.fetchall()
 
     # Get add options
-    cursor.execute(
+    attach(
+        "options",
         """
-    SELECT option_name, option_detail_name, price
+    SELECT ao.product_no, option_name, option_detail_name, price
     FROM reference.iw_studio_add_options ao
     JOIN reference.iw_studio_option_details od 
         ON ao.product_no = od.product_no AND ao.option_no = od.option_no
-    WHERE ao.product_no = %s
+    WHERE ao.product_no = ANY(%s)
     """,
-        (product_id,),
     )
-    options = cursor.fetchall()
 
     # Get addcost items
-    cursor.execute(
+    attach(
+        "addcosts",
         """
-    SELECT name, comment, price, required
+    SELECT product_no, name, comment, price, required
     FROM reference.iw_studio_addcost
-    WHERE product_no = %s
+    WHERE product_no = ANY(%s)
     """,
-        (product_id,),
     )
-    addcosts = cursor.fetchall()
 
     # Get tags
-    cursor.execute(
+    attach(
+        "tag",
         """
-    SELECT no, tag_type, tag, item_value_no, tag_regdate
+    SELECT product_no, no, tag_type, tag, item_value_no, tag_regdate
     FROM reference.iw_studio_tags
-    WHERE product_no = %s
+    WHERE product_no = ANY(%s)
     """,
-        (product_id,),
     )
-    tags = cursor.fetchall()
-
-    # Combine all data
-    product["product_info"] = product_info
-    product["options"] = options
-    product["addcosts"] = addcosts
-    product["tag"] = tags
 
     cursor.close()
-    return product
 
+    details: dict[str, list[dict]] = {}
+    for product in products:
+        details.setdefault(product["enterprise_code"], []).append(product)
+    return details
 
-def extract_location_info(address: str) -> Dict[str, str]:
+
+def extract_enterprise_chunk(enterprises: list[dict]) -> list[tuple]:
+    """Extract (enterprise, product details) for a chunk on its own connection."""
+    conn = connect_to_source_db()
+    if not conn:
+        raise RuntimeError("Failed to connect to source database")
+
+    try:
+        details = fetch_product_details(
+            conn, [enterprise["enterprise_code"] for enterprise in enterprises]
+        )
+    finally:
+        conn.close()
+
+    return [
+        (enterprise, details.get(enterprise["enterprise_code"], []))
+        for enterprise in enterprises
+    ]
+
+
+def extract_location_info(address: str) -> dict[str, str]:
     """Extract sido, gugun, and dong from address."""
     # Example address: "서울시 강남구 봉은사로 47길 53"
     location = {"sido": "", "gugun": "", "dong": "", "full_address": address}
@@ -213,7 +254,7 @@ def extract_location_info(address: str) -> Dict[str, str]:
     return location
 
 
-def parse_product_info(product_info: List[Dict]) -> Dict:
+def parse_product_info(product_info: list[dict]) -> dict:
     """Parse product info into structured data."""
     info = {}
 
@@ -278,7 +319,7 @@ def parse_product_info(product_info: List[Dict]) -> Dict:
     return info
 
 
-def parse_studio_scenes(tags: List[Dict]) -> Dict[str, bool]:
+def parse_studio_scenes(tags: list[dict]) -> dict[str, bool]:
     """Parse tags to determine available scenes."""
     scenes = {
         "has_garden_scene": False,
@@ -310,7 +351,7 @@ def parse_studio_scenes(tags: List[Dict]) -> Dict[str, bool]:
     return scenes
 
 
-def has_hair_makeup(addcosts: List[Dict]) -> bool:
+def has_hair_makeup(addcosts: list[dict]) -> bool:
     """Check if hair makeup is available."""
     for item in addcosts:
         name = item.get("name", "").lower()
@@ -319,7 +360,7 @@ def has_hair_makeup(addcosts: List[Dict]) -> bool:
     return False
 
 
-def format_additional_info(product_data: Dict) -> str:
+def format_additional_info(product_data: dict) -> str:
     """Format additional information about the product."""
     info_parts = []
 
@@ -358,145 +399,167 @@ def format_additional_info(product_data: Dict) -> str:
     return "\n".join(info_parts) if info_parts else None
 
 
-def create_product_from_enterprise(conn, enterprise_data, engine):
-    """Create a product entry from enterprise data and return its ID."""
-    with Session(engine) as session:
-        # Extract location information
-        location = extract_location_info(enterprise_data.get("addr", ""))
+def build_product_row(enterprise_data, details: list[dict]) -> dict:
+    """Build a products row from enterprise data and its product details."""
+    # Extract location information
+    location = extract_location_info(enterprise_data.get("addr", ""))
+
+    # Determine category ID
+    category_id = 2
+
+    # Find business hours from the first product if available
+    business_hours = None
+    description = ""
+    thumbnail_url = None
+    if details:
+        main_product = details[0]
+        for info in main_product.get("product_info", []):
+            if "title" in info and "스케줄" in info["title"]:
+                business_hours = info.get("value")
+
+        # If enterprise has products, use product info from the first/main product
+        description = main_product.get("cmt", "")
+        thumbnail_url = main_product.get("thumb")
+
+    row = {
+        "product_category_id": category_id,
+        "name": enterprise_data.get("enterprise_name", ""),
+        "description": description,
+        "hashtag": None,
+        "direct_link": f"https://www.iwedding.co.kr/center/web/brand_detail/{enterprise_data.get('enterprise_code')}",
+        "thumbnail_url": thumbnail_url,
+        "logo_url": enterprise_data.get("logo", ""),
+        "enterprise_name": enterprise_data.get("enterprise_name", ""),
+        "enterprise_code": enterprise_data.get("enterprise_code", ""),
+        "tel": enterprise_data.get("phone", ""),
+        "fax_tel": "",
+        "sido": location.get("sido", ""),
+        "gugun": location.get("gugun", ""),
+        "dong": location.get("dong", None),
+        "address": location.get("full_address", ""),
+        "lat": 0.0,
+        "lng": 0.0,
+        "subway_line": None,
+        "subway_name": None,
+        "subway_exit": None,
+        "park_limit": 0,
+        "park_free_hours": 0,
+        "way_text": None,
+        "holiday": enterprise_data.get("holiday"),
+        "business_hours": business_hours,
+        "available": True,
+        "is_deleted": False,
+    }
+    # Core inserts skip the ORM listener that keeps search_text in sync
+    row["search_text"] = build_search_text(
+        *(row[column] for column in SEARCH_TEXT_COLUMNS)
+    )
+    return row
+
+
+def build_studio_row(studio_data) -> dict:
+    """Build a product_studios row (without product_id) from product data."""
+    # Parse scenes from tags
+    scenes = parse_studio_scenes(studio_data.get("tag", []))
+
+    row = {
+        # Studio capabilities
+        "has_garden_scene": scenes.get("has_garden_scene", False),
+        "has_road_scene": scenes.get("has_road_scene", False),
+        "has_rooftop_scene": scenes.get("has_rooftop_scene", False),
+        "has_night_scene": scenes.get("has_night_scene", False),
+        "has_hanbok_scene": scenes.get("has_hanbok_scene", False),
+        "has_pet_scene": scenes.get("has_pet_scene", False),
+        "has_black_white_scene": scenes.get("has_black_white_scene", False),
+        # Additional services
+        "hair_makeup_available": has_hair_makeup(studio_data.get("addcosts", [])),
+        # System fields
+        "is_deleted": False,
+    }
+    # Core inserts skip the ORM listener that keeps scene_flags in sync
+    row["scene_flags"] = pack_scene_flags(row)
+    return row
+
+
+def package_price(package_row) -> int:
+    """Selling price of a package (discount price when set)."""
+    return selling_price(package_row["price"], package_row["discount_price"])
+
+
+def build_package_row(product_data) -> dict:
+    """Build a product_studio_packages row (without product_studio_id)."""
+    # Parse product info
+    product_info = parse_product_info(product_data.get("product_info", []))
+
+    return {
+        "name": product_data.get("name", ""),
+        "description": product_data.get("cmt", ""),
+        "original_price": product_data.get("product_price"),
+        "price": product_data.get("price", 0),
+        "discount_price": product_data.get("event_price"),
+        # Package components
+        "album_count": product_info.get("album_count", 0),
+        "album_page_count": product_info.get("album_page_count", 0),
+        "frame_count": product_info.get("frame_count", 0),
+        "include_original_data": product_info.get("include_original_data", False),
+        "include_edited_data": product_info.get("include_edited_data", False),
+        # Outfit info
+        "outfit_count": product_info.get("outfit_count", 0),
+        "dress_count": product_info.get("dress_count", 0),
+        "casual_count": product_info.get("casual_count", 0),
+        # Additional info
+        "shooting_duration": product_info.get("shooting_duration", 0),
+        "additional_info": format_additional_info(product_data),
+        # Save original ID for reference
+        "original_id": product_data.get("no"),
+        "is_deleted": False,
+    }
 
-        # Determine category ID
-        category_id = 2
 
-        # Find business hours and holiday from the first product if available
-        business_hours = None
-        if enterprise_data.get("products") and len(enterprise_data["products"]) > 0:
-            first_product_id = enterprise_data["products"][0]["no"]
-            first_product = get_product_detail(
-                conn, first_product_id, enterprise_data["enterprise_code"]
-            )
-            if first_product and "product_info" in first_product:
-                for info in first_product["product_info"]:
-                    if "title" in info and "스케줄" in info["title"]:
-                        business_hours = info.get("value")
-
-        # Create product
-        product = Product(
-            product_category_id=category_id,
-            name=enterprise_data.get("enterprise_name", ""),
-            description="",  # Will be updated below
-            hashtag=None,
-            direct_link=f"https://www.iwedding.co.kr/center/web/brand_detail/{enterprise_data.get('enterprise_code')}",
-            thumbnail_url=None,  # Will be updated below
-            logo_url=enterprise_data.get("logo", ""),
-            enterprise_name=enterprise_data.get("enterprise_name", ""),
-            enterprise_code=enterprise_data.get("enterprise_code", ""),
-            tel=enterprise_data.get("phone", ""),
-            fax_tel="",
-            sido=location.get("sido", ""),
-            gugun=location.get("gugun", ""),
-            dong=location.get("dong", None),
-            address=location.get("full_address", ""),
-            lat=0.0,
-            lng=0.0,
-            subway_line=None,
-            subway_name=None,
-            subway_exit=None,
-            park_limit=0,
-            park_free_hours=0,
-            way_text=None,
-            holiday=enterprise_data.get("holiday"),
-            business_hours=business_hours,
-            available=True,
-            is_deleted=False,
-            created_datetime=utc_now(),
-            updated_datetime=utc_now(),
-        )
+def write_studios(connection, studios: list[tuple]):
+    """
+    Bulk-write (product row, [package details]) pairs.
 
-        session.add(product)
-        session.commit()
-        session.refresh(product)
-
-        # If enterprise has products, update product info from the first/main product
-        if enterprise_data.get("products"):
-            main_product = enterprise_data["products"][0]
-
-            product.description = main_product.get("cmt", "")
-            product.thumbnail_url = main_product.get("thumb")
-
-            session.add(product)
-            session.commit()
-
-        return product.id
-
-
-def create_product_studio(product_id, studio_data, engine):
-    """Create a product_studio entry and return its ID."""
-    with Session(engine) as session:
-        # Parse scenes from tags
-        scenes = parse_studio_scenes(studio_data.get("tag", []))
-
-        # Create product_studio
-        product_studio = ProductStudio(
-            product_id=product_id,
-            # Studio capabilities
-            has_garden_scene=scenes.get("has_garden_scene", False),
-            has_road_scene=scenes.get("has_road_scene", False),
-            has_rooftop_scene=scenes.get("has_rooftop_scene", False),
-            has_night_scene=scenes.get("has_night_scene", False),
-            has_hanbok_scene=scenes.get("has_hanbok_scene", False),
-            has_pet_scene=scenes.get("has_pet_scene", False),
-            has_black_white_scene=scenes.get("has_black_white_scene", False),
-            # Additional services
-            hair_makeup_available=has_hair_makeup(studio_data.get("addcosts", [])),
-            # System fields
-            is_deleted=False,
-            created_datetime=utc_now(),
-            updated_datetime=utc_now(),
-        )
+    Products, studios and packages are written table by table so each table is a
+    few multi-row statements; generated ids are mapped back by enterprise code.
+    """
+    with BulkWriter(connection, Product, returning=True) as products:
+        for product_row, _ in studios:
+            products.add(product_row, key=product_row["enterprise_code"])
+
+    with BulkWriter(connection, ProductStudio, returning=True) as product_studios:
+        for product_row, details in studios:
+            if not details:
+                continue
+            code = product_row["enterprise_code"]
+            prices = [package_price(build_package_row(detail)) for detail in details]
+            # Use the first product as base for the studio details
+            product_studios.add(
+                {
+                    **build_studio_row(details[0]),
+                    "product_id": products.ids[code],
+                    "min_package_price": min(prices),
+                    "max_package_price": max(prices),
+                },
+                key=code,
+            )
 
-        session.add(product_studio)
-        session.commit()
-        session.refresh(product_studio)
-
-        return product_studio.id
-
-
-def create_studio_package(studio_id, product_data, engine):
-    """Create a studio_package entry from product data."""
-    with Session(engine) as session:
-        # Parse product info
-        product_info = parse_product_info(product_data.get("product_info", []))
-
-        # Create studio package
-        package = ProductStudioPackage(
-            product_studio_id=studio_id,
-            name=product_data.get("name", ""),
-            description=product_data.get("cmt", ""),
-            original_price=product_data.get("product_price"),
-            price=product_data.get("price", 0),
-            discount_price=product_data.get("event_price"),
-            # Package components
-            album_count=product_info.get("album_count", 0),
-            album_page_count=product_info.get("album_page_count", 0),
-            frame_count=product_info.get("frame_count", 0),
-            include_original_data=product_info.get("include_original_data", False),
-            include_edited_data=product_info.get("include_edited_data", False),
-            # Outfit info
-            outfit_count=product_info.get("outfit_count", 0),
-            dress_count=product_info.get("dress_count", 0),
-            casual_count=product_info.get("casual_count", 0),
-            # Additional info
-            shooting_duration=product_info.get("shooting_duration", 0),
-            additional_info=format_additional_info(product_data),
-            # Save original ID for reference
-            original_id=product_data.get("no"),
-            is_deleted=False,
-            created_datetime=utc_now(),
-            updated_datetime=utc_now(),
-        )
+    with BulkWriter(connection, ProductStudioPackage) as packages:
+        for product_row, details in studios:
+            for product_detail in details:
+                packages.add(
+                    {
+                        **build_package_row(product_detail),
+                        "product_studio_id": product_studios.ids[
+                            product_row["enterprise_code"]
+                        ],
+                    }
+                )
 
-        session.add(package)
-        session.commit()
+    print(
+        f"Written {products.written} products, {product_studios.written} studios, "
+        f"{packages.written} packages"
+    )
 
 
 def migrate_enterprise_to_product_and_packages(conn, engine):
@@ -521,52 +584,30 @@ def migrate_enterprise_to_product_and_packages(conn, engine):
     """
     )
     enterprises = cursor.fetchall()
-
-    for enterprise in enterprises:
-        enterprise_code = enterprise["enterprise_code"]
-        print(f"Processing enterprise: {enterprise['enterprise_name']}")
-
-        # 1. Create Product for this enterprise
-        product_id = create_product_from_enterprise(conn, enterprise, engine)
-
-        # 2. Get all products for this enterprise
-        cursor.execute(
-            """
-        SELECT 
-            p.no as product_no
-        FROM 
-            reference.iw_studio_products p
-        WHERE 
-            p.enterprise_code = %s
-        """,
-            (enterprise_code,),
-        )
-        products = cursor.fetchall()
-
-        if not products:
-            print(f"No products found for enterprise: {enterprise['enterprise_name']}")
-            continue
-
-        # 3. Get base studio information from the products
-        # Use the first product as base for the studio details
-        first_product = get_product_detail(
-            conn, products[0]["product_no"], enterprise_code
-        )
-
-        # 4. Create ProductStudio
-        studio_id = create_product_studio(product_id, first_product, engine)
-
-        # 5. Create StudioPackage for each product
-        for product_data in products:
-            product_detail = get_product_detail(
-                conn, product_data["product_no"], enterprise_code
-            )
-            if product_detail:
-                create_studio_package(studio_id, product_detail, engine)
-                print(f"Created package: {product_detail.get('name')}")
-
     cursor.close()
 
+    # Extract product details in chunks, a bounded number of chunks at a time
+    chunks = [
+        enterprises[start : start + EXTRACT_CHUNK_SIZE]
+        for start in range(0, len(enterprises), EXTRACT_CHUNK_SIZE)
+    ]
+    studios = []
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+        for extracted in pool.map(extract_enterprise_chunk, chunks):
+            for enterprise, details in extracted:
+                print(
+                    f"Processing enterprise: {enterprise['enterprise_name']} ({len(details)} products)"
+                )
+                if not details:
+                    print(
+                        f"No products found for enterprise: {enterprise['enterprise_name']}"
+                    )
+                studios.append((build_product_row(enterprise, details), details))
+
+    # Write products, studios and packages in bulk
+    with engine.begin() as connection:
+        write_studios(connection, studios)
+
 
 def main():
     # Connect to source database
@@ -6,6 +6,7 @@ CSV 파일의 웨딩홀 데이터를 기존 데이터베이스에 반영합니
 import csv
 import logging
 import re
+from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
 
 from sqlalchemy import create_engine
@@ -88,61 +89,63 @@ def parse_boolean_amenity(amenity_str: str) -> bool:
     return amenity_str == "있음"
 
 
+@dataclass
+class VenueLookup:
+    """웨딩홀 매칭용 (상품, 웨딩홀, 첫 번째 venue) 목록과 코드/이름 인덱스"""
+
+    entries: list[tuple[Product, ProductHall, ProductHallVenue]]
+    by_code: dict[str, tuple[Product, ProductHall, ProductHallVenue]]
+    by_name: dict[str, tuple[Product, ProductHall, ProductHallVenue]]
+
+
+def load_venue_lookup(session: Session) -> VenueLookup:
+    """
+    웨딩홀 매칭용 (상품, 웨딩홀, 첫 번째 venue) 목록을 한 번에 로드
+    CSV row 마다 상품/웨딩홀/venue 를 각각 조회하지 않도록 미리 읽어 두고,
+    코드/정확한 이름 매칭은 dict 로 찾도록 인덱스를 만든다 (먼저 나온 상품 우선).
+    """
+    rows = session.exec(
+        select(Product, ProductHall, ProductHallVenue)
+        .join(ProductHall, ProductHall.product_id == Product.id)
+        .join(ProductHallVenue, ProductHallVenue.product_hall_id == ProductHall.id)
+        .order_by(Product.id, ProductHallVenue.id)
+    ).all()
+
+    # 상품별 첫 번째 venue 만 사용 (대부분의 홀은 하나의 주요 venue를 가짐)
+    by_product = {}
+    for product, hall, venue in rows:
+        by_product.setdefault(product.id, (product, hall, venue))
+
+    lookup = VenueLookup(entries=list(by_product.values()), by_code={}, by_name={})
+    for entry in lookup.entries:
+        product = entry[0]
+        lookup.by_code.setdefault(product.enterprise_code, entry)
+        lookup.by_name.setdefault(product.name, entry)
+    return lookup
+
+
 def find_matching_venue(
-    session: Session, hall_name: str, code: str
+    lookup: VenueLookup,
+    hall_name: str,
+    code: str,
 ) -> Optional[tuple[ProductHallVenue, ProductHall]]:
     """웨딩홀 이름과 코드로 매칭되는 venue와 product_hall 찾기"""
 
     # 1. 코드로 직접 매칭 시도
-    if code:
-        # Product 테이블에서 enterprise_code 찾기
-        product_stmt = select(Product).where(Product.enterprise_code == code)
-        product_result = session.exec(product_stmt).first()
-
-        if product_result:
-            # 해당 product의 product_hall 찾기
-            hall_stmt = select(ProductHall).where(
-                ProductHall.product_id == product_result.id
-            )
-            hall_result = session.exec(hall_stmt).first()
-
-            if hall_result:
-                # 첫 번째 venue 반환 (대부분의 홀은 하나의 주요 venue를 가짐)
-                venue_stmt = (
-                    select(ProductHallVenue)
-                    .where(ProductHallVenue.product_hall_id == hall_result.id)
-                    .limit(1)
-                )
-                venue_result = session.exec(venue_stmt).first()
-                if venue_result:
-                    return venue_result, hall_result
-
-    # 2. 이름으로 매칭 시도
+    # 2. 정확한 이름 매치
+    entry = (code and lookup.by_code.get(code)) or (
+        hall_name and lookup.by_name.get(hall_name)
+    )
+    if entry:
+        _, hall, venue = entry
+        return venue, hall
+
+    # 3. 부분 이름 매치 시도 (대소문자 무시, 이 경우만 전체 목록을 훑음)
     if hall_name:
-        # 정확한 이름 매치
-        product_stmt = select(Product).where(Product.name == hall_name)
-        product_result = session.exec(product_stmt).first()
-
-        if not product_result:
-            # 부분 이름 매치 시도
-            product_stmt = select(Product).where(Product.name.ilike(f"%{hall_name}%"))
-            product_result = session.exec(product_stmt).first()
-
-        if product_result:
-            hall_stmt = select(ProductHall).where(
-                ProductHall.product_id == product_result.id
-            )
-            hall_result = session.exec(hall_stmt).first()
-
-            if hall_result:
-                venue_stmt = (
-                    select(ProductHallVenue)
-                    .where(ProductHallVenue.product_hall_id == hall_result.id)
-                    .limit(1)
-                )
-                venue_result = session.exec(venue_stmt).first()
-                if venue_result:
-                    return venue_result, hall_result
+        lowered = hall_name.lower()
+        for product, hall, venue in lookup.entries:
+            if lowered in product.name.lower():
+                return venue, hall
 
     return None
 
@@ -226,6 +229,7 @@ def process_mvp1_csv_data(csv_file_path: str = "MVP1 Wedding Hall Data.csv"):
         not_found = []
 
         logger.info("MVP1 웨딩홀 데이터 업데이트 시작...")
+        lookup = load_venue_lookup(session)
 
         # CSV 파일 읽기
         try:
@@ -240,7 +244,7 @@ def process_mvp1_csv_data(csv_file_path: str = "MVP1 Wedding Hall Data.csv"):
                     logger.info(f"\n처리 중: {hall_name} (코드: {hall_code})")
 
                     # 매칭되는 venue와 product_hall 찾기
-                    result = find_matching_venue(session, hall_name, hall_code)
+                    result = find_matching_venue(lookup, hall_name, hall_code)
 
                     if result:
                         venue, product_hall = result
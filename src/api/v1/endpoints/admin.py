@@ -1,12 +1,14 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import Body, Path, status
+import numpy as np
+from fastapi import BackgroundTasks, Body, Path, Request, status
 from fastapi import Depends, HTTPException, Query, APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.v1.deps import get_current_admin
 from core.db import get_session
+from core.score_rebuild import rebuild_score_derived_tables
 from crud import (
     category as crud_category,
     checklist as crud_checklist,
@@ -17,6 +19,7 @@ from crud import (
     news_category as crud_news_category,
     news_item as crud_news_item,
 )
+from crud import product_score as crud_score
 from crud import recommended_hall as crud_recommended_hall
 from models import User
 from schemes.checklists import (
@@ -37,12 +40,19 @@ from schemes.news import (
     NewsItemUpdate,
     NewsItemRead,
 )
+from schemes.product_scores import ScoreImportResult
 from schemes.suggest_halls import (
     RecommendedHallRead,
     RecommendedHallCreate,
     RecommendedHallUpdate,
     RecommendedHallOrderUpdate,
 )
+from utils.score_import import (
+    MAX_REPORTED_ERRORS,
+    read_score_csv,
+    read_score_items,
+    validate_score_batch,
+)
 
 router = APIRouter()
 
@@ -573,3 +583,54 @@ async def delete_recommended_hall(
     return ResponseWithStatusMessage(
         status="success", message="Recommendation removed successfully"
     )
+
+
+@router.post(
+    "/scores/import",
+    response_model=ScoreImportResult,
+    dependencies=[Depends(get_current_admin)],
+)
+async def import_scores(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    상품 점수 대량 가져오기 (JSON 배열 또는 text/csv)
+    항목: product_id, score_type, value (CSV 는 같은 이름의 헤더 필요)
+
+    전체 묶음을 열 단위로 검증하고 유효한 점수만 (product_id, score_type) 기준으로
+    업서트한 뒤 응답한다. 점수에서 파생된 테이블(백분위, 유사 웨딩홀)은 응답 후
+    백그라운드 작업에서 다시 계산하고, 워커별 점수 행렬과 통계 캐시는 각 워커의
+    주기적 갱신(요약값 비교, TTL)으로 반영된다.
+    """
+    if request.headers.get("content-type", "").startswith("text/csv"):
+        body = (await request.body()).decode("utf-8-sig", errors="replace")
+        batch = read_score_csv(body.splitlines())
+    else:
+        try:
+            items = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array")
+        batch = read_score_items(items)
+
+    known_product_ids = await crud_score.get_existing_product_ids(
+        db=session, product_ids=np.unique(batch.product_ids).tolist()
+    )
+    valid, errors = validate_score_batch(batch, known_product_ids=known_product_ids)
+
+    imported = await crud_score.upsert_scores(db=session, rows=valid.rows())
+    await session.commit()
+
+    if imported:
+        crud_score.invalidate_statistics_cache()
+        background_tasks.add_task(rebuild_score_derived_tables)
+
+    return ScoreImportResult(
+        received=len(batch),
+        imported=imported,
+        rejected=len(errors),
+        errors=errors[:MAX_REPORTED_ERRORS],
+    )
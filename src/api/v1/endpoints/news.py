@@ -2,8 +2,15 @@ from fastapi import APIRouter, Depends, Query, Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db import get_session
+from core.responses import ModelResponse
 from crud import news_category as crud_news_category, news_item as crud_news_item
-from schemes.news import NewsCategoryRead, NewsItemRead
+from schemes.news import (
+    NewsCategoryRead,
+    NewsCategoryReadList,
+    NewsItemRead,
+    NewsItemReadList,
+)
+from utils.utils import nest_columns
 
 router = APIRouter()
 
@@ -13,19 +20,8 @@ async def list_news_categories(
     session: AsyncSession = Depends(get_session),
 ):
     """뉴스 카테고리 목록 조회"""
-    categories = await crud_news_category.get_categories(db=session)
-
-    result = []
-    for category in categories:
-        result.append(
-            NewsCategoryRead(
-                id=category.id,
-                display_name=category.display_name,
-                created_datetime=category.created_datetime,
-            )
-        )
-
-    return result
+    rows = await crud_news_category.get_category_rows(db=session)
+    return ModelResponse(NewsCategoryReadList.validate_python(rows))
 
 
 @router.get("/categories/{category_id}", response_model=NewsCategoryRead)
@@ -56,36 +52,11 @@ async def list_news_items(
     session: AsyncSession = Depends(get_session),
 ):
     """뉴스 아이템 목록 조회"""
-    if category_id:
-        news_items = await crud_news_item.get_by_category(
-            db=session, category_id=category_id, skip=skip, limit=limit
-        )
-    else:
-        news_items = await crud_news_item.get_latest_news(
-            db=session, skip=skip, limit=limit
-        )
-
-    result = []
-    for news_item in news_items:
-        news_read = NewsItemRead(
-            id=news_item.id,
-            news_category_id=news_item.news_category_id,
-            title=news_item.title,
-            link_url=news_item.link_url,
-            post_date=news_item.post_date,
-            created_datetime=news_item.created_datetime,
-        )
-
-        if news_item.news_category:
-            news_read.news_category = NewsCategoryRead(
-                id=news_item.news_category.id,
-                display_name=news_item.news_category.display_name,
-                created_datetime=news_item.news_category.created_datetime,
-            )
-
-        result.append(news_read)
-
-    return result
+    rows = await crud_news_item.get_news_rows(
+        db=session, category_id=category_id, skip=skip, limit=limit
+    )
+    news_items = NewsItemReadList.validate_python([nest_columns(row) for row in rows])
+    return ModelResponse(news_items)
 
 
 @router.get("/{news_id}", response_model=NewsItemRead)
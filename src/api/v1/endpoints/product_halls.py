@@ -4,14 +4,36 @@ from fastapi import APIRouter, Query, Depends, Path, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db import get_session
+from core.enums import HallSortEnum, SeasonEnum
+from core.hall_geo_index import hall_geo_index
+from core.hall_score_index import hall_score_index
+from core.responses import ModelResponse
 from crud import product as crud_product
 from crud import product_ai_review as crud_review
 from crud import product_hall as crud_hall
+from crud import product_hall_similarity as crud_similarity
 from crud import product_image as crud_image
 from crud import product_score as crud_score
+from models import Product, ProductAIReview
 from schemes.product_halls import (
+    HallAIReviewRead,
+    HallScoreSummary,
+    HallRankingRequest,
+    ProductHallRankedRead,
+    ProductHallRankedReadList,
+    ProductHallAffordableRead,
+    ProductHallAffordableReadList,
     ProductHallListRead,
+    ProductHallListReadList,
+    ProductHallNearbyRead,
+    ProductHallNearbyReadList,
     ProductHallSearchRead,
+    ProductHallSearchReadList,
+    ProductHallSimilarRead,
+    ProductHallSimilarReadList,
+    ProductHallTopRead,
+    ProductHallTopReadList,
+    ProductHallImage,
     ProductHallRead,
     HallVenueRead,
     HallVenueAmenitiesRead,
@@ -19,6 +41,12 @@ from schemes.product_halls import (
 
 router = APIRouter()
 
+# 상세 응답 필드 (fields 파라미터로 선택 가능)
+HALL_DETAIL_FIELDS = frozenset(ProductHallRead.model_fields)
+
+# 점수 요약을 요청하지 않았을 때 채우는 빈 값 (응답에는 포함되지 않음)
+EMPTY_SCORE_SUMMARY = HallScoreSummary(overall_average=0.0, score_comparisons=[])
+
 
 @router.get("", response_model=list[ProductHallListRead])
 async def list_wedding_halls(
@@ -31,10 +59,13 @@ async def list_wedding_halls(
     food_menus: list[str] = Query(None),
     hall_types: list[str] = Query(None),
     hall_styles: list[str] = Query(None),
+    min_price: int = Query(None, ge=0, description="최소 견적 (원)"),
+    max_price: int = Query(None, ge=0, description="최대 견적 (원)"),
+    sort: HallSortEnum = Query(HallSortEnum.default),
     session: AsyncSession = Depends(get_session),
 ):
     """웨딩홀 목록 조회"""
-    halls = await crud_hall.filter_halls(
+    rows = await crud_hall.filter_hall_rows(
         db=session,
         skip=offset,
         limit=limit,
@@ -45,30 +76,21 @@ async def list_wedding_halls(
         food_menus=food_menus,
         hall_types=hall_types,
         hall_styles=hall_styles,
+        min_price=min_price,
+        max_price=max_price,
+        sort=sort,
     )
 
-    response_data = []
-    for hall in halls:
-        product = await crud_product.get_with_details(
-            db=session, product_id=hall.product_id, load_images=True
-        )
-
-        if product:
-            image_urls = [img.image_url for img in product.images][:6]
-
-            response_data.append(
-                ProductHallListRead(
-                    id=product.id,
-                    hashtags=product.hashtag.split(",") if product.hashtag else [],
-                    name=product.name,
-                    sido=product.sido,
-                    gugun=product.gugun,
-                    address=product.address,
-                    image_urls=image_urls,
-                )
-            )
+    product_ids = [row["id"] for row in rows]
+    card_images = await crud_image.get_card_images_for_products(
+        db=session, product_ids=product_ids, limit_per_product=6
+    )
 
-    return response_data
+    # 카드 row 와 이미지를 합쳐 한 번의 검증으로 변환
+    hall_list = ProductHallListReadList.validate_python(
+        [{**row, **_card_images(card_images, row["id"])} for row in rows]
+    )
+    return ModelResponse(hall_list)
 
 
 @router.get("/count", response_model=dict)
@@ -80,6 +102,8 @@ async def get_wedding_halls_count(
     food_menus: list[str] = Query(None),
     hall_types: list[str] = Query(None),
     hall_styles: list[str] = Query(None),
+    min_price: int = Query(None, ge=0, description="최소 견적 (원)"),
+    max_price: int = Query(None, ge=0, description="최대 견적 (원)"),
     session: AsyncSession = Depends(get_session),
 ):
     """웨딩홀 개수 조회 (필터 적용)"""
@@ -94,11 +118,229 @@ async def get_wedding_halls_count(
         food_menus=food_menus,
         hall_types=hall_types,
         hall_styles=hall_styles,
+        min_price=min_price,
+        max_price=max_price,
     )
 
     return {"count": count}
 
 
+@router.get("/nearby", response_model=list[ProductHallNearbyRead])
+async def list_nearby_wedding_halls(
+    lat: float = Query(None, ge=-90, le=90),
+    lng: float = Query(None, ge=-180, le=180),
+    station: str = Query(None, description="지하철역 이름 (lat/lng 대신 사용)"),
+    radius_km: float = Query(3.0, gt=0, le=50),
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    sidos: list[str] = Query(None),
+    guguns: list[str] = Query(None),
+    guest_counts: list[str] = Query(None),
+    wedding_types: list[str] = Query(None),
+    food_menus: list[str] = Query(None),
+    hall_types: list[str] = Query(None),
+    hall_styles: list[str] = Query(None),
+    session: AsyncSession = Depends(get_session),
+):
+    """근처 웨딩홀 조회 (거리순, 기존 필터와 함께 사용 가능)"""
+    lat, lng = await _resolve_center(session, lat=lat, lng=lng, station=station)
+    filters = {
+        "sidos": sidos,
+        "guguns": guguns,
+        "guest_counts": guest_counts,
+        "wedding_types": wedding_types,
+        "food_menus": food_menus,
+        "hall_types": hall_types,
+        "hall_styles": hall_styles,
+    }
+
+    if not hall_geo_index.ready:
+        # 인덱스 구성 전에는 DB 공간 검색 사용
+        rows = await crud_hall.get_nearby_hall_rows(
+            db=session,
+            lat=lat,
+            lng=lng,
+            radius_km=radius_km,
+            skip=offset,
+            limit=limit,
+            **filters,
+        )
+        return await _nearby_response(session, rows)
+
+    ids, distances = hall_geo_index.index.within(lat, lng, radius_km)
+    if any(filters.values()):
+        # 반경 내 후보 전체에 필터를 적용한 뒤 페이지 절단
+        rows = await _hydrate_by_distance(session, ids, distances, filters)
+        rows = rows[offset : offset + limit]
+    else:
+        # 인덱스 구성 후 삭제/판매 중지된 웨딩홀은 hydrate 에서 빠지므로
+        # 페이지 끝까지 채워질 때까지 다음 후보를 더 가져온 뒤 절단
+        rows, start = [], 0
+        while len(rows) < offset + limit and start < len(ids):
+            end = start + offset + limit - len(rows)
+            rows += await _hydrate_by_distance(
+                session, ids[start:end], distances[start:end], filters
+            )
+            start = end
+        rows = rows[offset : offset + limit]
+
+    return await _nearby_response(session, rows)
+
+
+@router.get("/nearest", response_model=list[ProductHallNearbyRead])
+async def list_nearest_wedding_halls(
+    lat: float = Query(None, ge=-90, le=90),
+    lng: float = Query(None, ge=-180, le=180),
+    station: str = Query(None, description="지하철역 이름 (lat/lng 대신 사용)"),
+    k: int = Query(10, ge=1, le=50),
+    session: AsyncSession = Depends(get_session),
+):
+    """가장 가까운 웨딩홀 k개 조회 (인메모리 인덱스)"""
+    lat, lng = await _resolve_center(session, lat=lat, lng=lng, station=station)
+
+    if not hall_geo_index.ready:
+        raise HTTPException(status_code=503, detail="Geo index is not ready")
+
+    ids, distances = hall_geo_index.index.nearest(lat, lng, k)
+    rows = await _hydrate_by_distance(session, ids, distances, {})
+    return await _nearby_response(session, rows)
+
+
+async def _resolve_center(
+    session: AsyncSession, *, lat: float | None, lng: float | None, station: str | None
+) -> tuple[float, float]:
+    """lat/lng 또는 지하철역 이름으로 검색 기준 좌표 결정"""
+    if lat is not None and lng is not None:
+        return lat, lng
+
+    if not station:
+        raise HTTPException(status_code=400, detail="lat/lng or station is required")
+
+    center = await crud_product.get_station_center(db=session, station=station)
+    if center is None:
+        raise HTTPException(status_code=404, detail="Station not found")
+    return center
+
+
+async def _hydrate_by_distance(
+    session: AsyncSession, ids, distances, filters: dict
+) -> list[dict]:
+    """인덱스 검색 결과(id, 거리)를 카드 컬럼으로 hydrate (거리순 유지)"""
+    distance_by_id = dict(zip(ids.tolist(), distances.tolist(), strict=True))
+    rows = await crud_hall.get_card_rows_by_product_ids(
+        db=session, product_ids=list(distance_by_id), **filters
+    )
+    return [{**row, "distance_km": distance_by_id[row["id"]]} for row in rows]
+
+
+async def _nearby_response(session: AsyncSession, rows: list[dict]) -> ModelResponse:
+    card_images = await crud_image.get_card_images_for_products(
+        db=session, product_ids=[row["id"] for row in rows], limit_per_product=6
+    )
+    halls = ProductHallNearbyReadList.validate_python(
+        [{**row, **_card_images(card_images, row["id"])} for row in rows]
+    )
+    return ModelResponse(halls)
+
+
+@router.get("/affordable", response_model=list[ProductHallAffordableRead])
+async def list_affordable_wedding_halls(
+    guest_count: int = Query(..., ge=1, le=2000, description="예상 하객 수"),
+    budget: int = Query(None, ge=0, description="웨딩홀 예산 (원)"),
+    season: SeasonEnum = Query(SeasonEnum.basic, description="비수기/성수기 대관료"),
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    sidos: list[str] = Query(None),
+    guguns: list[str] = Query(None),
+    guest_counts: list[str] = Query(None),
+    wedding_types: list[str] = Query(None),
+    food_menus: list[str] = Query(None),
+    hall_types: list[str] = Query(None),
+    hall_styles: list[str] = Query(None),
+    session: AsyncSession = Depends(get_session),
+):
+    """예산 내 웨딩홀 조회 (하객 수 기준 예상 견적 오름차순)"""
+    rows = await crud_hall.get_affordable_hall_rows(
+        db=session,
+        guest_count=guest_count,
+        budget=budget,
+        season=season,
+        skip=offset,
+        limit=limit,
+        sidos=sidos,
+        guguns=guguns,
+        guest_counts=guest_counts,
+        wedding_types=wedding_types,
+        food_menus=food_menus,
+        hall_types=hall_types,
+        hall_styles=hall_styles,
+    )
+
+    card_images = await crud_image.get_card_images_for_products(
+        db=session, product_ids=[row["id"] for row in rows], limit_per_product=6
+    )
+    halls = ProductHallAffordableReadList.validate_python(
+        [{**row, **_card_images(card_images, row["id"])} for row in rows]
+    )
+    return ModelResponse(halls)
+
+
+@router.post("/ranking", response_model=list[ProductHallRankedRead])
+async def rank_wedding_halls(
+    ranking_in: HallRankingRequest,
+    session: AsyncSession = Depends(get_session),
+):
+    """점수 타입별 가중치로 계산한 맞춤 웨딩홀 순위 (인메모리 점수 행렬)"""
+    if not hall_score_index.ready:
+        raise HTTPException(status_code=503, detail="Score index is not ready")
+
+    try:
+        ids, scores = hall_score_index.matrix.top_k(
+            ranking_in.weights, ranking_in.limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    score_by_id = dict(zip(ids.tolist(), scores.tolist(), strict=True))
+    rows = await crud_hall.get_card_rows_by_product_ids(
+        db=session, product_ids=list(score_by_id)
+    )
+    card_images = await crud_image.get_card_images_for_products(
+        db=session, product_ids=list(score_by_id), limit_per_product=6
+    )
+    halls = ProductHallRankedReadList.validate_python(
+        [
+            {
+                **row,
+                "weighted_score": round(score_by_id[row["id"]], 2),
+                **_card_images(card_images, row["id"]),
+            }
+            for row in rows
+        ]
+    )
+    return ModelResponse(halls)
+
+
+@router.get("/top", response_model=list[ProductHallTopRead])
+async def list_top_wedding_halls(
+    score_type: str = Query(None, description="점수 타입 (생략 시 종합 점수)"),
+    limit: int = Query(10, ge=1, le=50),
+    session: AsyncSession = Depends(get_session),
+):
+    """점수 순위 상위 웨딩홀 (배치 작업으로 저장된 백분위 포함)"""
+    rows = await crud_hall.get_top_hall_rows(
+        db=session, score_type=score_type, limit=limit
+    )
+
+    card_images = await crud_image.get_card_images_for_products(
+        db=session, product_ids=[row["id"] for row in rows], limit_per_product=6
+    )
+    halls = ProductHallTopReadList.validate_python(
+        [{**row, **_card_images(card_images, row["id"])} for row in rows]
+    )
+    return ModelResponse(halls)
+
+
 @router.get("/search", response_model=list[ProductHallSearchRead])
 async def search_wedding_halls(
     q: str = Query(...),
@@ -107,90 +349,242 @@ async def search_wedding_halls(
     session: AsyncSession = Depends(get_session),
 ):
     """웨딩홀 검색"""
-    products = await crud_product.search_products(
+    rows = await crud_product.search_product_rows(
         db=session, search_term=q, skip=offset, limit=limit
     )
+    return ModelResponse(ProductHallSearchReadList.validate_python(rows))
+
+
+@router.get("/compare", response_model=list[ProductHallRead])
+async def compare_wedding_halls(
+    ids: list[int] = Query(..., min_length=2, max_length=5, description="비교할 상품 ID"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    웨딩홀 비교 (2~5개)
+    웨딩홀 수와 관계없이 상품/베뉴/이미지/AI 리뷰/점수를 일정한 횟수의 쿼리로 로드
+    """
+    product_ids = list(dict.fromkeys(ids))
+    products = await crud_product.get_halls_with_details(
+        db=session, product_ids=product_ids
+    )
+    products_by_id = {
+        product.id: product for product in products if product.product_hall
+    }
 
-    return [
-        ProductHallSearchRead(
-            id=product.id,
-            name=product.name,
-            sido=product.sido,
-            gugun=product.gugun,
-            address=product.address,
-            thumbnail_url=product.thumbnail_url or "",
-            subway_line=product.subway_line,
-            subway_name=product.subway_name,
+    missing_ids = [
+        product_id for product_id in product_ids if product_id not in products_by_id
+    ]
+    if missing_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Product not found: {', '.join(map(str, missing_ids))}",
         )
-        for product in products
+
+    ai_reviews = await crud_review.get_by_products(db=session, product_ids=product_ids)
+    score_summaries = await crud_score.get_hall_score_comparisons(
+        db=session, product_ids=product_ids
+    )
+
+    halls = [
+        _build_hall_read(
+            products_by_id[product_id],
+            ai_reviews=ai_reviews[product_id],
+            score_summary=score_summaries[product_id],
+        )
+        for product_id in product_ids
     ]
+    return ModelResponse(halls)
 
 
 @router.get("/{product_id}", response_model=ProductHallRead)
 async def get_wedding_hall(
     product_id: int = Path(...),
+    fields: str = Query(
+        None,
+        description="응답 필드 (쉼표 구분, 예: name,address,min_price). 생략 시 전체",
+    ),
     session: AsyncSession = Depends(get_session),
 ):
-    """웨딩홀 상세 조회"""
+    """
+    웨딩홀 상세 조회
+    fields 를 지정하면 요청한 필드만 응답하며, 필요 없는 관계/쿼리는 실행하지 않는다
+    """
+    requested = _parse_detail_fields(fields)
+
     product = await crud_product.get_with_images_and_hall_using_joins(
-        db=session, product_id=product_id
+        db=session,
+        product_id=product_id,
+        venues=bool(requested & {"venues", "has_single_hall"}),
+        blogs="blogs" in requested,
     )
 
     if not product or not product.product_hall:
         raise HTTPException(status_code=404, detail="Product not found")
 
     # AI 리뷰 가져오기
-    ai_reviews = await crud_review.get_by_product(db=session, product_id=product_id)
+    ai_reviews = []
+    if "ai_reviews" in requested:
+        ai_reviews = await crud_review.get_by_product(
+            db=session, product_id=product_id
+        )
 
     # 점수 비교 정보 가져오기
-    score_summary = await crud_score.get_hall_score_comparison(
-        db=session, product_id=product_id
+    score_summary = None
+    if "ai_score_summary" in requested:
+        score_summary = await crud_score.get_hall_score_comparison(
+            db=session, product_id=product_id
+        )
+
+    hall_read = _build_hall_read(
+        product,
+        fields=requested,
+        ai_reviews=ai_reviews,
+        score_summary=score_summary,
     )
 
-    # venue 이미지 정보 가져오기
-    venue_ids = [venue.id for venue in product.product_hall.product_hall_venues]
-    venue_images_map = await crud_image.get_venue_amenities_images_for_venues(
-        db=session, product_id=product_id, venue_ids=venue_ids
+    # 생성 시점에 이미 검증되었으므로 response_model 재검증 없이 직렬화
+    return ModelResponse(
+        hall_read, include=None if requested == HALL_DETAIL_FIELDS else requested
     )
 
-    max_price = 0
-    min_price = sys.maxsize
-    venues_data = []
 
-    for venue in product.product_hall.product_hall_venues:
-        # 가격 계산
-        max_price = max(
-            venue.peak_season_price
-            + venue.guaranteed_min_count * venue.food_cost_per_adult,
-            max_price,
-        )
-        min_price = min(
-            venue.basic_price + venue.guaranteed_min_count * venue.food_cost_per_adult,
-            min_price,
-        )
+@router.get("/{product_id}/venues", response_model=list[HallVenueRead])
+async def list_wedding_hall_venues(
+    product_id: int = Path(...),
+    session: AsyncSession = Depends(get_session),
+):
+    """웨딩홀 베뉴 목록 (편의시설 이미지 포함)"""
+    product = await crud_product.get_with_images_and_hall_using_joins(
+        db=session, product_id=product_id, blogs=False
+    )
 
-        # venue 이미지 정보 가져오기
-        venue_images = venue_images_map.get(venue.id, [])
+    if not product or not product.product_hall:
+        raise HTTPException(status_code=404, detail="Product not found")
 
-        # 이미지 타입별로 URL 분류
-        bride_room_images = [
-            img.image_url for img in venue_images if img.image_type == "신부대기실"
-        ]
-        pyebaek_room_images = [
-            img.image_url for img in venue_images if img.image_type == "폐백실"
-        ]
-        banquet_hall_images = [
-            img.image_url for img in venue_images if img.image_type == "연회장"
+    return ModelResponse(_build_venues(product))
+
+
+@router.get("/{product_id}/images", response_model=list[ProductHallImage])
+async def list_wedding_hall_images(
+    product_id: int = Path(...),
+    session: AsyncSession = Depends(get_session),
+):
+    """웨딩홀 이미지 목록 (노출 순서)"""
+    if not await crud_hall.exists_by_product(db=session, product_id=product_id):
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    images = await crud_image.get_by_product(db=session, product_id=product_id)
+    return ModelResponse(
+        [
+            ProductHallImage(
+                image_type=image.image_type,
+                image_url=image.image_url,
+                width=image.width,
+                height=image.height,
+                placeholder=image.placeholder,
+                derivatives=image.derivatives,
+            )
+            for image in images
         ]
+    )
+
+
+@router.get("/{product_id}/reviews", response_model=list[HallAIReviewRead])
+async def list_wedding_hall_reviews(
+    product_id: int = Path(...),
+    session: AsyncSession = Depends(get_session),
+):
+    """웨딩홀 AI 리뷰 목록"""
+    if not await crud_hall.exists_by_product(db=session, product_id=product_id):
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    ai_reviews = await crud_review.get_by_product(db=session, product_id=product_id)
+    return ModelResponse(
+        [HallAIReviewRead.model_validate(review) for review in ai_reviews]
+    )
+
+
+def _card_images(card_images: dict[int, list[dict]], product_id: int) -> dict:
+    """카드 이미지 필드 (기존 image_urls 와 반응형 images 를 함께 채움)"""
+    images = card_images.get(product_id, [])
+    return {"image_urls": [image["url"] for image in images], "images": images}
+
+
+def _parse_detail_fields(fields: str | None) -> set[str]:
+    """fields 파라미터를 응답 필드 집합으로 변환 (id 는 항상 포함)"""
+    if not fields:
+        return HALL_DETAIL_FIELDS
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - HALL_DETAIL_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested | {"id"}
+
+
+def _build_hall_read(
+    product: Product,
+    *,
+    fields: set[str] = HALL_DETAIL_FIELDS,
+    ai_reviews: list[ProductAIReview],
+    score_summary: HallScoreSummary | None,
+) -> ProductHallRead:
+    """
+    로드된 상품/베뉴 데이터로 웨딩홀 상세 응답 구성
+    fields 에 없는 관계는 로드되지 않았으므로 접근하지 않고 빈 값으로 채운다
+    """
+    return ProductHallRead(
+        id=product.id,
+        name=product.name,
+        hashtags=product.hashtag.split(",") if product.hashtag else [],
+        subway_line=product.subway_line,
+        subway_name=product.subway_name,
+        way_text=product.way_text,
+        park_limit=product.park_limit or 0,
+        park_free_hours=product.park_free_hours or 0,
+        sido=product.sido,
+        gugun=product.gugun,
+        dong=product.dong or "",
+        address=product.address,
+        has_single_hall=(
+            len(product.product_hall.product_hall_venues) == 1
+            if fields & {"venues", "has_single_hall"}
+            else False
+        ),
+        # 견적 범위는 베뉴 변경 시 저장된 값 사용 (베뉴가 없으면 기존과 같은 기본값)
+        max_price=product.product_hall.max_price or 0,
+        min_price=(
+            product.product_hall.min_price
+            if product.product_hall.min_price is not None
+            else sys.maxsize
+        ),
+        hall_amenities_info=product.product_hall,
+        venues=_build_venues(product) if "venues" in fields else [],
+        ai_reviews=ai_reviews,
+        ai_score_summary=score_summary or EMPTY_SCORE_SUMMARY,
+        blogs=product.blogs if "blogs" in fields else [],
+    )
+
+
+def _build_venues(product: Product) -> list[HallVenueRead]:
+    """베뉴와 미리 계산된 편의시설/베뉴 이미지로 베뉴 응답 목록 구성"""
+    venues_data = []
+
+    for venue in product.product_hall.product_hall_venues:
+        # 타입별 편의시설 이미지 (베뉴/이미지 변경 시 미리 병합된 값)
+        amenity_images = venue.amenity_images or {}
 
         # amenities 정보 구성
         amenities_info = HallVenueAmenitiesRead(
             has_bride_room=venue.has_bride_room,
             has_pyebaek_room=venue.has_pyebaek_room,
             has_banquet_hall=venue.has_banquet_hall,
-            bride_room_image_urls=bride_room_images,
-            pyebaek_room_image_urls=pyebaek_room_images,
-            banquet_hall_image_urls=banquet_hall_images,
+            bride_room_image_urls=amenity_images.get("신부대기실", []),
+            pyebaek_room_image_urls=amenity_images.get("폐백실", []),
+            banquet_hall_image_urls=amenity_images.get("연회장", []),
         )
 
         # venue 데이터 구성
@@ -223,29 +617,28 @@ async def get_wedding_hall(
             additional_info=venue.additional_info,
             special_notes=venue.special_notes,
             amenities_info=amenities_info,
-            images=venue.images,
+            image_urls=venue.image_urls or [],
         )
         venues_data.append(venue_data)
 
-    return ProductHallRead(
-        id=product.id,
-        name=product.name,
-        hashtags=product.hashtag.split(",") if product.hashtag else [],
-        subway_line=product.subway_line,
-        subway_name=product.subway_name,
-        way_text=product.way_text,
-        park_limit=product.park_limit or 0,
-        park_free_hours=product.park_free_hours or 0,
-        sido=product.sido,
-        gugun=product.gugun,
-        dong=product.dong or "",
-        address=product.address,
-        has_single_hall=len(product.product_hall.product_hall_venues) == 1,
-        max_price=max_price,
-        min_price=min_price,
-        hall_amenities_info=product.product_hall,
-        venues=venues_data,
-        ai_reviews=ai_reviews,
-        ai_score_summary=score_summary,
-        blogs=product.blogs,
+    return venues_data
+
+
+@router.get("/{product_id}/similar", response_model=list[ProductHallSimilarRead])
+async def list_similar_wedding_halls(
+    product_id: int = Path(...),
+    limit: int = Query(10, ge=1, le=20),
+    session: AsyncSession = Depends(get_session),
+):
+    """유사 웨딩홀 조회 (배치 작업으로 미리 계산된 목록)"""
+    rows = await crud_similarity.get_similar_hall_rows(
+        db=session, product_id=product_id, limit=limit
+    )
+
+    card_images = await crud_image.get_card_images_for_products(
+        db=session, product_ids=[row["id"] for row in rows], limit_per_product=6
+    )
+    halls = ProductHallSimilarReadList.validate_python(
+        [{**row, **_card_images(card_images, row["id"])} for row in rows]
     )
+    return ModelResponse(halls)
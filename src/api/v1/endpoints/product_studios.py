@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Query, Depends, Path, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import get_session
+from core.enums import StudioSceneEnum, StudioSortEnum
+from core.responses import ModelResponse
+from crud import product_studio as crud_studio
+from schemes.product_studios import (
+    ProductStudioListRead,
+    ProductStudioListReadList,
+    ProductStudioRead,
+    StudioPackageRead,
+)
+from utils.studio_packages import selling_price
+
+router = APIRouter()
+
+
+@router.get("", response_model=list[ProductStudioListRead])
+async def list_studios(
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    scenes: list[StudioSceneEnum] = Query(None, description="모두 포함해야 하는 촬영 씬"),
+    hair_makeup: bool = Query(None, description="헤어/메이크업 가능 여부"),
+    sidos: list[str] = Query(None),
+    guguns: list[str] = Query(None),
+    min_price: int = Query(None, ge=0, description="최소 패키지 가격 (원)"),
+    max_price: int = Query(None, ge=0, description="최대 패키지 가격 (원)"),
+    sort: StudioSortEnum = Query(StudioSortEnum.default),
+    session: AsyncSession = Depends(get_session),
+):
+    """스튜디오 목록 조회"""
+    rows = await crud_studio.filter_studio_rows(
+        db=session,
+        skip=offset,
+        limit=limit,
+        scenes=scenes,
+        hair_makeup=hair_makeup,
+        sidos=sidos,
+        guguns=guguns,
+        min_price=min_price,
+        max_price=max_price,
+        sort=sort,
+    )
+    studios = ProductStudioListReadList.validate_python(
+        [{**row, "scenes": row["scene_flags"]} for row in rows]
+    )
+    return ModelResponse(studios)
+
+
+@router.get("/count", response_model=dict)
+async def get_studios_count(
+    scenes: list[StudioSceneEnum] = Query(None, description="모두 포함해야 하는 촬영 씬"),
+    hair_makeup: bool = Query(None, description="헤어/메이크업 가능 여부"),
+    sidos: list[str] = Query(None),
+    guguns: list[str] = Query(None),
+    min_price: int = Query(None, ge=0, description="최소 패키지 가격 (원)"),
+    max_price: int = Query(None, ge=0, description="최대 패키지 가격 (원)"),
+    session: AsyncSession = Depends(get_session),
+):
+    """스튜디오 개수 조회 (필터 적용)"""
+    count = await crud_studio.count_filtered_studios(
+        db=session,
+        scenes=scenes,
+        hair_makeup=hair_makeup,
+        sidos=sidos,
+        guguns=guguns,
+        min_price=min_price,
+        max_price=max_price,
+    )
+
+    return {"count": count}
+
+
+@router.get("/{product_id}", response_model=ProductStudioRead)
+async def get_studio(
+    product_id: int = Path(...),
+    session: AsyncSession = Depends(get_session),
+):
+    """스튜디오 상세 조회 (패키지 판매가 순)"""
+    studio = await crud_studio.get_with_packages(db=session, product_id=product_id)
+    if not studio:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    product = studio.product
+    packages = sorted(
+        studio.studio_packages,
+        key=lambda package: (
+            selling_price(package.price, package.discount_price),
+            package.id,
+        ),
+    )
+    return ModelResponse(
+        ProductStudioRead(
+            id=product.id,
+            name=product.name,
+            sido=product.sido,
+            gugun=product.gugun,
+            address=product.address,
+            thumbnail_url=product.thumbnail_url,
+            scenes=studio.scene_flags,
+            hair_makeup_available=studio.hair_makeup_available,
+            min_package_price=studio.min_package_price,
+            max_package_price=studio.max_package_price,
+            description=product.description,
+            tel=product.tel,
+            holiday=product.holiday,
+            business_hours=product.business_hours,
+            packages=[StudioPackageRead.model_validate(p) for p in packages],
+        )
+    )
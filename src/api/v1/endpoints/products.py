@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Query, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import get_session
+from core.responses import ModelResponse
+from crud import product as crud_product
+from schemes.products import ProductSearchResponse
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=ProductSearchResponse)
+async def search_products(
+    q: str = Query(..., min_length=1),
+    categories: list[int] = Query(None, description="상품 카테고리 ID"),
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    카테고리 통합 상품 검색
+    결과 목록과 카테고리별 결과 수(facets)를 같은 검색 조건의 쿼리 두 번으로 조회
+    """
+    facets = await crud_product.get_search_facets(db=session, search_term=q)
+    total = sum(
+        facet["count"]
+        for facet in facets
+        if not categories or facet["category_id"] in categories
+    )
+
+    items = []
+    if total > offset:
+        items = await crud_product.search_catalogue_rows(
+            db=session,
+            search_term=q,
+            category_ids=categories,
+            skip=offset,
+            limit=limit,
+        )
+
+    return ModelResponse(
+        ProductSearchResponse.model_validate(
+            {"total": total, "facets": facets, "items": items}
+        )
+    )
@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db import get_session
+from core.responses import ModelResponse
 from crud import recommended_hall as crud_recommended_hall
-from schemes.product_halls import ProductHallSearchRead
+from schemes.product_halls import ProductHallSearchRead, ProductHallSearchReadList
 
 router = APIRouter()
 
@@ -21,24 +22,9 @@ async def get_recommended_halls(
     - 추천 순서대로 정렬되어 반환
     """
 
-    recommendations = await crud_recommended_hall.get_active_recommendations(
+    rows = await crud_recommended_hall.get_active_recommendation_rows(
         db=session, skip=skip, limit=limit
     )
 
-    # ProductHallSearchRead 형태로 변환하여 반환
-    result = []
-    for rec in recommendations:
-        if rec.product_hall and rec.product_hall.product:
-            hall_data = ProductHallSearchRead(
-                id=rec.product_hall.product.id,
-                name=rec.product_hall.product.name,
-                sido=rec.product_hall.product.sido,
-                gugun=rec.product_hall.product.gugun,
-                address=rec.product_hall.product.address,
-                thumbnail_url=rec.product_hall.product.thumbnail_url or "",
-                subway_line=rec.product_hall.product.subway_line,
-                subway_name=rec.product_hall.product.subway_name,
-            )
-            result.append(hall_data)
-
-    return result
+    # 필요한 컬럼만 조회한 row 를 ProductHallSearchRead 로 한 번에 변환
+    return ModelResponse(ProductHallSearchReadList.validate_python(rows))
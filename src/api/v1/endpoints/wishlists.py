@@ -1,59 +1,85 @@
-from fastapi import Depends, HTTPException, APIRouter
+from fastapi import Depends, HTTPException, Query, APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from api.v1.deps import get_current_user
 from core.db import get_session
+from core.responses import ModelResponse
 from crud import product as crud_product
 from crud import user_wishlist as crud_wishlist
 from models import User
 from schemes.common import ResponseWithStatusMessage
-from schemes.user_wishlist import WishlistCreate
+from schemes.user_wishlist import (
+    WishlistContainsRequest,
+    WishlistContainsResponse,
+    WishlistCreate,
+    WishlistPage,
+    WishlistResponse,
+)
 
 router = APIRouter()
 
 
-@router.get("", status_code=status.HTTP_200_OK, response_model=list)
+@router.get("", status_code=status.HTTP_200_OK, response_model=WishlistPage)
 async def list_wishlist(
+    cursor: int = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """내 위시리스트 조회 (상품 카드 포함, 최신순 커서 페이지네이션)"""
+    rows = await crud_wishlist.get_card_rows_by_user(
+        db=session, user_id=current_user.id, cursor=cursor, limit=limit + 1
+    )
+
+    # 한 건 더 조회해서 다음 페이지 여부 판단
+    next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+    return ModelResponse(
+        WishlistPage.model_validate({"items": rows[:limit], "next_cursor": next_cursor})
+    )
+
+
+@router.post(
+    "/contains",
+    status_code=status.HTTP_200_OK,
+    response_model=WishlistContainsResponse,
+)
+async def check_wishlist_contains(
+    contains_request: WishlistContainsRequest,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
-    """내 위시리스트 조회"""
-    wishlists = await crud_wishlist.get_by_user(db=session, user_id=current_user.id)
-    return wishlists
+    """목록 화면 찜 표시용: 요청한 상품 중 위시리스트에 담긴 상품 id"""
+    product_ids = await crud_wishlist.get_wished_product_ids(
+        db=session,
+        user_id=current_user.id,
+        product_ids=list(set(contains_request.product_ids)),
+    )
+    return WishlistContainsResponse(product_ids=sorted(product_ids))
 
 
-@router.post("", status_code=status.HTTP_201_CREATED, response_model=dict)
+@router.post(
+    "", status_code=status.HTTP_201_CREATED, response_model=WishlistResponse
+)
 async def add_to_wishlist(
     wishlist_create: WishlistCreate,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ):
-    """위시리스트 추가"""
-    # 상품 존재 확인
+    """위시리스트 추가 (INSERT 한 번, 중복 탭은 부분 유일 인덱스가 막음)"""
+    wishlist = await crud_wishlist.add(
+        db=session, user_id=current_user.id, obj_in=wishlist_create
+    )
+    await session.commit()
+
+    if wishlist:
+        return WishlistResponse.model_validate(wishlist)
 
+    # 추가되지 않은 경우에만 원인 확인
     product = await crud_product.get(db=session, id=wishlist_create.product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-
-    # 이미 위시리스트에 있는지 확인
-    existing_wishlist = await crud_wishlist.get_by_user_and_product(
-        db=session, user_id=current_user.id, product_id=wishlist_create.product_id
-    )
-
-    if existing_wishlist:
-        raise HTTPException(status_code=400, detail="Product already in wishlist")
-
-    # 위시리스트 생성
-    wishlist = await crud_wishlist.create(
-        db=session,
-        obj_in={
-            "user_id": current_user.id,
-            "product_id": wishlist_create.product_id,
-            "memo": wishlist_create.memo,
-        },
-    )
-    return wishlist
+    raise HTTPException(status_code=400, detail="Product already in wishlist")
 
 
 @router.delete(
@@ -6,6 +6,8 @@ from api.v1.endpoints import (
     product_categories,
     checklists,
     product_halls,
+    product_studios,
+    products,
     wishlists,
     admin,
     user_budgets,
@@ -33,6 +35,10 @@ api_router.include_router(
 api_router.include_router(
     product_halls.router, prefix="/wedding-halls", tags=["wedding-halls"]
 )
+api_router.include_router(products.router, prefix="/products", tags=["products"])
+api_router.include_router(
+    product_studios.router, prefix="/product-studios", tags=["product-studios"]
+)
 api_router.include_router(suggest.router, prefix="/suggest", tags=["suggest"])
 api_router.include_router(wishlists.router, prefix="/wishlists", tags=["wishlist"])
 
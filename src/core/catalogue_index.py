@@ -0,0 +1,39 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+
+from core.config import settings
+from core.hall_geo_index import refresh_hall_geo_index
+from core.hall_score_index import refresh_hall_score_index
+
+# 워커별 인메모리 카탈로그 인덱스 갱신 함수 (force 인자로 강제 재구성)
+CATALOGUE_INDEX_REFRESHERS: dict[str, Callable[..., Awaitable[None]]] = {
+    "hall geo index": refresh_hall_geo_index,
+    "hall score index": refresh_hall_score_index,
+}
+
+
+async def build_catalogue_indexes() -> None:
+    """시작 시 모든 인덱스 구성 (실패한 인덱스는 DB 조회로 대체됨)"""
+    for name, refresh in CATALOGUE_INDEX_REFRESHERS.items():
+        try:
+            await refresh(force=True)
+            print(f"✅ {name.capitalize()} built")
+        except Exception as e:
+            print(f"⚠️ {name.capitalize()} build failed: {e}")
+
+
+async def run_catalogue_index_refresher() -> None:
+    """설정된 주기마다 카탈로그 변경을 확인하여 인덱스 갱신"""
+    interval = settings.CATALOGUE_INDEX_REFRESH_SECONDS
+    if interval <= 0:
+        return
+
+    while True:
+        await asyncio.sleep(interval)
+        for name, refresh in CATALOGUE_INDEX_REFRESHERS.items():
+            try:
+                await refresh()
+            except Exception as e:
+                logger.warning(f"{name.capitalize()} refresh failed: {e}")
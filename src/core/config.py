@@ -22,6 +22,9 @@ class BaseAppSettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 3  # 3 days
     ENVIRONMENT: Literal["test", "local", "production"]
 
+    # 인메모리 웨딩홀 인덱스 갱신 주기 (초, 0 이면 주기 갱신 안 함)
+    CATALOGUE_INDEX_REFRESH_SECONDS: int = 300
+
 
 class LocalSettings(BaseAppSettings):
     model_config = SettingsConfigDict(env_file=ROOT_DIR / ".env.local")
@@ -30,3 +30,30 @@ class CategoryTypeEnum(str, Enum):
 class GenderEnum(str, Enum):
     male = "male"
     female = "female"
+
+
+class HallSortEnum(str, Enum):
+    default = "default"
+    price_asc = "price_asc"
+    price_desc = "price_desc"
+
+
+class SeasonEnum(str, Enum):
+    basic = "basic"
+    peak = "peak"
+
+
+class StudioSceneEnum(str, Enum):
+    garden = "garden"
+    road = "road"
+    rooftop = "rooftop"
+    night = "night"
+    hanbok = "hanbok"
+    pet = "pet"
+    black_white = "black_white"
+
+
+class StudioSortEnum(str, Enum):
+    default = "default"
+    price_asc = "price_asc"
+    price_desc = "price_desc"
@@ -0,0 +1,58 @@
+import asyncio
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import async_session
+from crud import product_hall as crud_hall
+from utils.geo_index import GeoGridIndex
+
+
+class HallGeoIndex:
+    """
+    워커 프로세스별 웨딩홀 좌표 인메모리 인덱스
+
+    시작 시 한 번 구성하고, 좌표 카탈로그 요약값이 바뀌었을 때만 다시 만든다.
+    검색은 DB 를 거치지 않으며 결과 id 만 DB 에서 hydrate 한다.
+    """
+
+    def __init__(self):
+        self._index: GeoGridIndex | None = None
+        self._signature: tuple | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._index is not None
+
+    @property
+    def index(self) -> GeoGridIndex:
+        if self._index is None:
+            raise RuntimeError("Hall geo index is not built yet")
+        return self._index
+
+    async def refresh(self, db: AsyncSession, *, force: bool = False) -> bool:
+        """카탈로그가 바뀐 경우 인덱스 재구성 (재구성 여부 반환)"""
+        async with self._lock:
+            signature = await crud_hall.get_coordinates_signature(db)
+            if not force and self._index is not None and signature == self._signature:
+                return False
+
+            rows = await crud_hall.get_hall_coordinates(db)
+            ids = [row[0] for row in rows]
+            lats = [row[1] for row in rows]
+            lngs = [row[2] for row in rows]
+
+            # 참조 교체는 원자적이므로 진행 중인 검색은 이전 인덱스를 계속 사용
+            self._index = GeoGridIndex(ids, lats, lngs)
+            self._signature = signature
+            logger.info(f"Hall geo index built with {len(ids)} halls")
+            return True
+
+
+hall_geo_index = HallGeoIndex()
+
+
+async def refresh_hall_geo_index(force: bool = False) -> None:
+    async with async_session() as session:
+        await hall_geo_index.refresh(session, force=force)
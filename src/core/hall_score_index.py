@@ -0,0 +1,60 @@
+import asyncio
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import async_session
+from crud import product_score as crud_score
+from utils.score_matrix import ScoreMatrix
+
+
+class HallScoreIndex:
+    """
+    워커 프로세스별 웨딩홀 점수 행렬
+
+    점수 카탈로그 요약값이 바뀌었을 때만 다시 만들며,
+    가중치 순위 계산은 DB 를 거치지 않는다.
+    """
+
+    def __init__(self):
+        self._matrix: ScoreMatrix | None = None
+        self._signature: tuple | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._matrix is not None
+
+    @property
+    def matrix(self) -> ScoreMatrix:
+        if self._matrix is None:
+            raise RuntimeError("Hall score index is not built yet")
+        return self._matrix
+
+    async def refresh(self, db: AsyncSession, *, force: bool = False) -> bool:
+        """점수가 바뀐 경우 행렬 재구성 (재구성 여부 반환)"""
+        async with self._lock:
+            signature = await crud_score.get_hall_scores_signature(db)
+            if not force and self._matrix is not None and signature == self._signature:
+                return False
+
+            rows = await crud_score.get_hall_score_rows(db)
+            self._matrix = ScoreMatrix(
+                [row[0] for row in rows],
+                [row[1] for row in rows],
+                [row[2] for row in rows],
+            )
+            self._signature = signature
+            logger.info(
+                f"Hall score index built with {self._matrix.size} halls"
+                f" x {len(self._matrix.score_types)} score types"
+            )
+            return True
+
+
+hall_score_index = HallScoreIndex()
+
+
+async def refresh_hall_score_index(force: bool = False) -> None:
+    async with async_session() as session:
+        await hall_score_index.refresh(session, force=force)
@@ -0,0 +1,23 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class ModelResponse(JSONResponse):
+    """
+    이미 검증된 pydantic 모델(또는 모델 리스트)을 한 번만 직렬화하는 응답
+
+    엔드포인트에서 Response 객체를 직접 반환하면 FastAPI는 response_model
+    재검증과 jsonable_encoder 변환을 건너뛴다. 모델은 pydantic-core
+    직렬화기로 바로 bytes 로 변환된다. (response_model 은 문서화용으로 유지)
+
+    include 를 지정하면 해당 필드만 직렬화한다. (sparse fieldset 응답)
+    """
+
+    def __init__(self, content: Any, *, include: set[str] | None = None, **kwargs):
+        self.include = include
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, include=self.include)
@@ -0,0 +1,65 @@
+import numpy as np
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud import product_hall as crud_hall
+from crud import product_score as crud_score
+from utils.score_percentiles import composite_scores, percentile_ranks
+
+
+def _round_or_none(value: float, digits: int) -> float | None:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+async def rebuild_score_percentiles(db: AsyncSession) -> int:
+    """
+    판매중인 웨딩홀의 점수 타입별 백분위 순위와 종합 점수(및 그 백분위)를
+    웨딩홀 x 점수 타입 행렬 한 번으로 계산해 저장 (점수가 있는 웨딩홀 수 반환)
+    """
+    rows = await crud_score.get_hall_score_rows(db)
+
+    product_ids, row_index = np.unique(
+        np.asarray([row[0] for row in rows], dtype=np.int64), return_inverse=True
+    )
+    score_types, column_index = np.unique(
+        np.asarray([row[1] for row in rows], dtype=object), return_inverse=True
+    )
+    values = np.full((len(product_ids), len(score_types)), np.nan)
+    values[row_index, column_index] = [row[2] for row in rows]
+
+    percentiles = percentile_ranks(values)
+    composite = composite_scores(values)
+    composite_percentiles = percentile_ranks(composite[:, None])[:, 0]
+
+    present_rows, present_columns = np.nonzero(~np.isnan(values))
+    await crud_score.replace_percentiles(
+        db,
+        rows=[
+            {
+                "product_id": int(product_ids[i]),
+                "score_type": str(score_types[j]),
+                "percentile": round(float(percentiles[i, j]), 1),
+            }
+            for i, j in zip(
+                present_rows.tolist(), present_columns.tolist(), strict=True
+            )
+        ],
+    )
+    await crud_hall.replace_composite_scores(
+        db,
+        rows=[
+            {
+                "product_id": int(product_id),
+                "composite_score": _round_or_none(composite[i], 2),
+                "composite_percentile": _round_or_none(composite_percentiles[i], 1),
+            }
+            for i, product_id in enumerate(product_ids.tolist())
+        ],
+    )
+    await db.commit()
+
+    logger.info(
+        f"Score percentiles rebuilt for {len(product_ids)} halls"
+        f" x {len(score_types)} score types"
+    )
+    return len(product_ids)
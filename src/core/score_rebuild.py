@@ -0,0 +1,18 @@
+from loguru import logger
+
+from core.db import async_session
+from core.score_percentiles import rebuild_score_percentiles
+from core.similar_halls import rebuild_similar_halls
+
+
+async def rebuild_score_derived_tables() -> None:
+    """
+    점수에서 파생된 테이블(점수 백분위/종합 점수, 유사 웨딩홀) 재계산
+    요청이 끝난 뒤 백그라운드 작업으로 실행되므로 별도 세션을 연다
+    """
+    try:
+        async with async_session() as session:
+            await rebuild_score_percentiles(session)
+            await rebuild_similar_halls(session)
+    except Exception as e:
+        logger.warning(f"Score derived tables rebuild failed: {e}")
@@ -0,0 +1,80 @@
+from collections import defaultdict
+
+import numpy as np
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud import product_hall as crud_hall
+from crud import product_hall_similarity as crud_similarity
+from crud import product_score as crud_score
+from utils.hall_similarity import build_feature_matrix, top_k_cosine
+from utils.utils import utc_now
+
+# 웨딩홀별로 저장할 유사 웨딩홀 수
+SIMILAR_HALLS_K = 20
+
+
+def _csv_tokens(value: str | None, prefix: str) -> set[str]:
+    if not value:
+        return set()
+    return {f"{prefix}:{token.strip()}" for token in value.split(",") if token.strip()}
+
+
+async def rebuild_similar_halls(db: AsyncSession, *, k: int = SIMILAR_HALLS_K) -> int:
+    """
+    전체 웨딩홀의 특성 벡터를 만들어 유사 웨딩홀 상위 k개를 다시 계산하고 저장
+    (저장된 행 수 반환)
+    """
+    halls = await crud_hall.get_hall_profile_rows(db)
+    product_ids = [hall[0] for hall in halls]
+    positions = {product_id: i for i, product_id in enumerate(product_ids)}
+
+    # 점수: 웨딩홀 x 점수 타입 (결측 NaN)
+    score_rows = await crud_score.get_hall_score_rows(db)
+    score_types = sorted({row[1] for row in score_rows})
+    score_columns = {score_type: i for i, score_type in enumerate(score_types)}
+    scores = np.full((len(product_ids), len(score_types)), np.nan)
+    for product_id, score_type, value in score_rows:
+        if product_id in positions:
+            scores[positions[product_id], score_columns[score_type]] = value
+
+    # 베뉴 속성 토큰
+    venue_tokens: dict[int, set[str]] = defaultdict(set)
+    for product_id, hall_types, hall_styles, food_menu in (
+        await crud_hall.get_venue_attribute_rows(db)
+    ):
+        venue_tokens[product_id] |= (
+            _csv_tokens(hall_types, "type")
+            | _csv_tokens(hall_styles, "style")
+            | _csv_tokens(food_menu, "food")
+        )
+
+    features = build_feature_matrix(
+        scores=scores,
+        sidos=[hall[1] for hall in halls],
+        guguns=[hall[2] for hall in halls],
+        prices=np.array(
+            [[hall[3], hall[4]] for hall in halls], dtype=np.float64
+        ).reshape(-1, 2),
+        venue_tokens=[venue_tokens[product_id] for product_id in product_ids],
+    )
+    neighbours, similarities = top_k_cosine(features, k)
+
+    now = utc_now()
+    rows = [
+        {
+            "product_id": product_ids[i],
+            "rank": rank + 1,
+            "similar_product_id": product_ids[j],
+            "score": round(float(similarity), 4),
+            "created_datetime": now,
+        }
+        for i in range(len(product_ids))
+        for rank, (j, similarity) in enumerate(
+            zip(neighbours[i], similarities[i], strict=True)
+        )
+    ]
+
+    await crud_similarity.replace_all(db, rows=rows)
+    logger.info(f"Similar halls rebuilt for {len(product_ids)} halls ({len(rows)} rows)")
+    return len(rows)
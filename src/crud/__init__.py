@@ -3,8 +3,10 @@ from models.categories import Category
 from models.checklists import Checklist
 from models.product_ai_review import ProductAIReview
 from models.product_categories import ProductCategory
+from models.product_hall_similarities import ProductHallSimilarity
 from models.product_halls import ProductHall
 from models.product_scores import ProductScore
+from models.product_studios import ProductStudio
 from models.products import Product
 from models.suggest_halls import RecommendedHall
 from models.user_spents import UserSpent
@@ -18,8 +20,10 @@ from .crud_product import CRUDProduct
 from .crud_product_ai_review import CRUDProductAIReview
 from .crud_product_category import CRUDProductCategory
 from .crud_product_hall import CRUDProductHall
+from .crud_product_hall_similarity import CRUDProductHallSimilarity
 from .crud_product_image import CRUDProductImage
 from .crud_product_score import CRUDProductScore
+from .crud_product_studio import CRUDProductStudio
 from .crud_suggest_halls import CRUDRecommendedHall
 from .crud_user import CRUDUser
 from .crud_user_spents import CRUDUserSpent
@@ -30,10 +34,12 @@ product = CRUDProduct(Product)
 checklist = CRUDChecklist(Checklist)
 category = CRUDCategory(Category)
 product_hall = CRUDProductHall(ProductHall)
+product_hall_similarity = CRUDProductHallSimilarity(ProductHallSimilarity)
 product_category = CRUDProductCategory(ProductCategory)
 user_wishlist = CRUDUserWishlist(UserWishlist)
 product_ai_review = CRUDProductAIReview(ProductAIReview)
 product_score = CRUDProductScore(ProductScore)
+product_studio = CRUDProductStudio(ProductStudio)
 user_spent = CRUDUserSpent(UserSpent)
 product_image = CRUDProductImage(ProductImage)
 magazine = CRUDMagazine(Magazine)
@@ -30,6 +30,20 @@ class CRUDNewsCategory(
         result = await db.stream(query)
         return await result.scalars().all()
 
+    async def get_category_rows(self, db: AsyncSession) -> Sequence[RowMapping]:
+        """목록 응답에 필요한 컬럼만 조회"""
+        query = (
+            select(
+                NewsCategory.id,
+                NewsCategory.display_name,
+                NewsCategory.created_datetime,
+            )
+            .where(NewsCategory.is_deleted == False)
+            .order_by(NewsCategory.created_datetime.desc())
+        )
+        result = await db.stream(query)
+        return await result.mappings().all()
+
 
 class CRUDNewsItem(CRUDBase[NewsItem, NewsItemCreate, NewsItemUpdate, int]):
     async def get_by_category(
@@ -66,3 +80,39 @@ class CRUDNewsItem(CRUDBase[NewsItem, NewsItemCreate, NewsItemUpdate, int]):
         )
         result = await db.stream(query)
         return await result.scalars().all()
+
+    async def get_news_rows(
+        self,
+        db: AsyncSession,
+        category_id: int | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[RowMapping]:
+        """
+        목록 응답에 필요한 컬럼만 조회 (카테고리는 news_category__* 로 포함)
+        ORM 엔티티 대신 RowMapping 을 반환하여 identity map 비용을 피함
+        """
+        query = (
+            select(
+                NewsItem.id,
+                NewsItem.news_category_id,
+                NewsItem.title,
+                NewsItem.link_url,
+                NewsItem.post_date,
+                NewsItem.created_datetime,
+                NewsCategory.id.label("news_category__id"),
+                NewsCategory.display_name.label("news_category__display_name"),
+                NewsCategory.created_datetime.label(
+                    "news_category__created_datetime"
+                ),
+            )
+            .outerjoin(NewsCategory, NewsCategory.id == NewsItem.news_category_id)
+            .where(NewsItem.is_deleted == False)
+        )
+
+        if category_id:
+            query = query.where(NewsItem.news_category_id == category_id)
+
+        query = query.order_by(NewsItem.post_date.desc()).offset(skip).limit(limit)
+        result = await db.stream(query)
+        return await result.mappings().all()
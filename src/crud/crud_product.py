@@ -1,15 +1,26 @@
 from collections.abc import Sequence
 
-from sqlalchemy import and_, select, or_, BinaryExpression
+from sqlalchemy import (
+    and_,
+    case,
+    select,
+    or_,
+    func,
+    BinaryExpression,
+    ColumnElement,
+    RowMapping,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, with_loader_criteria
 from sqlalchemy.sql.expression import Select
 
+from models.product_categories import ProductCategory
 from models.product_hall_venues import ProductHallVenue
 from models.product_halls import ProductHall
 from models.product_images import ProductImage
 from models.products import Product
 from schemes.products import ProductCreate, ProductUpdate
+from utils.search_text import search_pattern
 from .base import CRUDBase
 
 
@@ -33,29 +44,155 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate, int]):
         result = await db.stream(query)
         return await result.scalars().all()
 
+    @staticmethod
+    def _search_condition(search_term: str) -> ColumnElement[bool]:
+        """상품 검색 조건 (이름, 설명, 주소, 해시태그)"""
+        return and_(
+            or_(
+                Product.name.ilike(f"%{search_term}%"),
+                Product.description.ilike(f"%{search_term}%"),
+                Product.address.ilike(f"%{search_term}%"),
+                Product.hashtag.ilike(f"%{search_term}%"),
+            ),
+            Product.is_deleted == False,
+            Product.available == True,
+        )
+
     async def search_products(
         self, db: AsyncSession, *, search_term: str, skip: int = 0, limit: int = 100
     ) -> Sequence[Product]:
         """Search products by name or other fields"""
         query: Select[tuple[Product]] = (
             select(Product)
+            .where(self._search_condition(search_term))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.stream(query)
+        return await result.scalars().all()
+
+    async def search_product_rows(
+        self, db: AsyncSession, *, search_term: str, skip: int = 0, limit: int = 100
+    ) -> Sequence[RowMapping]:
+        """
+        search_products 와 같은 조건으로 검색 카드 컬럼만 조회
+        description 은 WHERE 에서만 사용하고 결과로 가져오지 않음
+        """
+        query = (
+            select(
+                Product.id,
+                Product.name,
+                Product.sido,
+                Product.gugun,
+                Product.address,
+                func.coalesce(Product.thumbnail_url, "").label("thumbnail_url"),
+                Product.subway_line,
+                Product.subway_name,
+            )
+            .where(self._search_condition(search_term))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.stream(query)
+        return await result.mappings().all()
+
+    @staticmethod
+    def _catalogue_search_query(*columns, search_term: str) -> Select:
+        """
+        카테고리 통합 검색 기본 쿼리
+        search_text 부분 일치 조건 하나로 모든 카테고리를 검색 (trigram GIN 인덱스)
+        """
+        pattern = search_pattern(search_term)
+        return (
+            select(*columns)
+            .select_from(Product)
+            .join(
+                ProductCategory,
+                and_(
+                    ProductCategory.id == Product.product_category_id,
+                    ProductCategory.is_deleted == False,
+                ),
+            )
             .where(
                 and_(
-                    or_(
-                        Product.name.ilike(f"%{search_term}%"),
-                        Product.description.ilike(f"%{search_term}%"),
-                        Product.address.ilike(f"%{search_term}%"),
-                        Product.hashtag.ilike(f"%{search_term}%"),
-                    ),
+                    Product.search_text.like(pattern, escape="\\"),
                     Product.is_deleted == False,
                     Product.available == True,
                 )
             )
-            .offset(skip)
-            .limit(limit)
         )
+
+    async def search_catalogue_rows(
+        self,
+        db: AsyncSession,
+        *,
+        search_term: str,
+        category_ids: list[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[RowMapping]:
+        """카테고리 통합 검색 카드 컬럼 조회 (이름이 일치하는 상품 우선)"""
+        query = self._catalogue_search_query(
+            Product.id,
+            Product.product_category_id.label("category_id"),
+            ProductCategory.type.label("category_type"),
+            Product.name,
+            Product.sido,
+            Product.gugun,
+            Product.address,
+            func.coalesce(Product.thumbnail_url, "").label("thumbnail_url"),
+            search_term=search_term,
+        )
+        if category_ids:
+            query = query.where(Product.product_category_id.in_(category_ids))
+
+        name_match = case(
+            (Product.name.ilike(search_pattern(search_term), escape="\\"), 0),
+            else_=1,
+        )
+        query = query.order_by(name_match, Product.id).offset(skip).limit(limit)
+
         result = await db.stream(query)
-        return await result.scalars().all()
+        return await result.mappings().all()
+
+    async def get_search_facets(
+        self, db: AsyncSession, *, search_term: str
+    ) -> Sequence[RowMapping]:
+        """카테고리 통합 검색의 카테고리별 결과 수 (카테고리 노출 순서)"""
+        query = (
+            self._catalogue_search_query(
+                ProductCategory.id.label("category_id"),
+                ProductCategory.name,
+                ProductCategory.display_name,
+                ProductCategory.type,
+                func.count(Product.id).label("count"),
+                search_term=search_term,
+            )
+            .group_by(ProductCategory.id)
+            .order_by(ProductCategory.order, ProductCategory.id)
+        )
+        result = await db.stream(query)
+        return await result.mappings().all()
+
+    async def get_station_center(
+        self, db: AsyncSession, *, station: str
+    ) -> tuple[float, float] | None:
+        """
+        지하철역 이름으로 기준 좌표 추정
+        별도 역 좌표 테이블이 없으므로 해당 역을 이용하는 상품 좌표의 평균을 사용
+        """
+        query = select(func.avg(Product.lat), func.avg(Product.lng)).where(
+            and_(
+                Product.subway_name == station,
+                Product.geohash.is_not(None),
+                Product.is_deleted == False,
+            )
+        )
+        result = await db.stream(query)
+        lat, lng = await result.one()
+        if lat is None or lng is None:
+            return None
+        return float(lat), float(lng)
 
     async def get_with_details(
         self,
@@ -104,12 +241,38 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate, int]):
         result = await db.stream(query)
         return await result.scalar_one_or_none()
 
+    def _hall_detail_options(self, *, venues: bool = True, blogs: bool = True) -> list:
+        """
+        웨딩홀 상세 응답에 필요한 관계 로딩 옵션 (필요한 관계만 선택)
+        베뉴 이미지는 베뉴 컬럼(amenity_images, image_urls)에 미리 저장되어 있어 로드하지 않음
+        """
+        hall_loader = selectinload(Product.product_hall)
+        if not venues:
+            options = [hall_loader]
+        else:
+            options = [
+                with_loader_criteria(
+                    ProductHallVenue, ProductHallVenue.is_deleted == False
+                ),
+                hall_loader.selectinload(ProductHall.product_hall_venues),
+            ]
+
+        if blogs:
+            options.append(selectinload(Product.blogs))
+        return options
+
     async def get_with_images_and_hall_using_joins(
-        self, db: AsyncSession, *, product_id: int
+        self,
+        db: AsyncSession,
+        *,
+        product_id: int,
+        venues: bool = True,
+        blogs: bool = True,
     ) -> Product | None:
         """
         Get product with images and hall data using explicit joins
         This is the most optimized approach for complex queries
+        venues / blogs 가 False 면 해당 관계는 로드하지 않음
         """
         query: Select[tuple[Product]] = (
             select(Product)
@@ -121,17 +284,32 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate, int]):
                 )
             )
             .options(
-                with_loader_criteria(ProductImage, ProductImage.is_deleted == False),
-                with_loader_criteria(
-                    ProductHallVenue, ProductHallVenue.is_deleted == False
-                ),
-                selectinload(Product.images),
-                selectinload(Product.blogs),
-                selectinload(Product.product_hall)
-                .selectinload(ProductHall.product_hall_venues)
-                .selectinload(ProductHallVenue.images),
+                *self._hall_detail_options(venues=venues, blogs=blogs)
             )
         )
 
         result = await db.stream(query)
         return await result.scalar_one_or_none()
+
+    async def get_halls_with_details(
+        self, db: AsyncSession, *, product_ids: list[int]
+    ) -> list[Product]:
+        """
+        여러 웨딩홀 상세 데이터를 한 번에 로드
+        get_with_images_and_hall_using_joins 와 같은 옵션이며, 웨딩홀 수와 관계없이
+        관계별 selectin 쿼리 한 번씩만 실행된다
+        """
+        query: Select[tuple[Product]] = (
+            select(Product)
+            .where(
+                and_(
+                    Product.id.in_(product_ids),
+                    Product.is_deleted == False,
+                    Product.available == True,
+                )
+            )
+            .options(*self._hall_detail_options())
+        )
+
+        result = await db.stream(query)
+        return await result.scalars().all()
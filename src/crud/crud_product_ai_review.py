@@ -1,3 +1,4 @@
+from collections import defaultdict
 
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +21,23 @@ class CRUDProductAIReview(CRUDBase[ProductAIReview, dict, dict, int]):
         result = await db.stream(query)
         return await result.scalars().all()
 
+    async def get_by_products(
+        self, db: AsyncSession, *, product_ids: list[int]
+    ) -> dict[int, list[ProductAIReview]]:
+        """여러 상품의 AI 리뷰를 한 번에 조회하여 상품별로 그룹핑"""
+        query = select(ProductAIReview).where(
+            and_(
+                ProductAIReview.product_id.in_(product_ids),
+                ProductAIReview.is_deleted == False,
+            )
+        )
+        result = await db.stream(query)
+
+        reviews = defaultdict(list)
+        for review in await result.scalars().all():
+            reviews[review.product_id].append(review)
+        return reviews
+
     async def get_by_product_and_type(
         self, db: AsyncSession, *, product_id: int, review_type: str
     ) -> ProductAIReview | None:
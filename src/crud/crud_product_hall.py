@@ -1,15 +1,44 @@
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import and_, select, or_, func
+from sqlalchemy import (
+    and_,
+    bindparam,
+    case,
+    select,
+    or_,
+    func,
+    exists,
+    update,
+    ColumnElement,
+    Row,
+    RowMapping,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import contains_eager, with_loader_criteria
+from sqlalchemy.sql.expression import Select
 
+from core.enums import HallSortEnum, SeasonEnum
 from models.product_hall_venues import ProductHallVenue
 from models.product_halls import ProductHall
+from models.product_scores import ProductScore
 from models.products import Product
+from utils.geo import bounding_box, geohash_prefixes, haversine_km, EARTH_RADIUS_KM
 from utils.utils import parse_guest_count_range
 from .base import CRUDBase
 
+# 목록 카드(ProductHallListRead)에 필요한 컬럼
+HALL_CARD_COLUMNS = (
+    Product.id,
+    Product.hashtag.label("hashtags"),
+    Product.name,
+    Product.sido,
+    Product.gugun,
+    Product.address,
+    ProductHall.composite_score,
+    ProductHall.composite_percentile,
+)
+
 
 class CRUDProductHall(CRUDBase[ProductHall, dict[str, Any], dict[str, Any], int]):
     async def get_by_product(
@@ -52,9 +81,83 @@ class CRUDProductHall(CRUDBase[ProductHall, dict[str, Any], dict[str, Any], int]
         result = await db.stream(query)
         return await result.unique().scalar_one_or_none()
 
-    async def filter_halls(
+    def _venue_conditions(
         self,
-        db: AsyncSession,
+        *,
+        guest_counts: list[str] = None,
+        wedding_types: list[str] = None,
+        food_menus: list[str] = None,
+        hall_types: list[str] = None,
+        hall_styles: list[str] = None,
+    ) -> list[ColumnElement[bool]]:
+        """베뉴 관련 필터 조건 생성"""
+        conditions = []
+
+        if guest_counts:
+            guest_count_filters = []
+            for count_range in guest_counts:
+                min_count, max_count = parse_guest_count_range(count_range)
+
+                if min_count is not None and max_count is not None:
+                    guest_count_filters.append(
+                        and_(
+                            ProductHallVenue.guaranteed_min_count >= min_count,
+                            ProductHallVenue.guaranteed_min_count <= max_count,
+                        )
+                    )
+                elif min_count is not None:
+                    guest_count_filters.append(
+                        ProductHallVenue.guaranteed_min_count >= min_count
+                    )
+                elif max_count is not None:
+                    guest_count_filters.append(
+                        ProductHallVenue.guaranteed_min_count <= max_count
+                    )
+
+            if guest_count_filters:
+                conditions.append(or_(*guest_count_filters))
+
+        if wedding_types:
+            conditions.append(ProductHallVenue.wedding_type.in_(wedding_types))
+
+        if food_menus:
+            conditions.append(ProductHallVenue.food_menu.in_(food_menus))
+
+        if hall_types:
+            conditions.append(
+                or_(
+                    *[
+                        self._csv_contains(ProductHallVenue.hall_types, hall_type)
+                        for hall_type in hall_types
+                    ]
+                )
+            )
+
+        if hall_styles:
+            conditions.append(
+                or_(
+                    *[
+                        self._csv_contains(ProductHallVenue.hall_styles, hall_style)
+                        for hall_style in hall_styles
+                    ]
+                )
+            )
+
+        return conditions
+
+    @staticmethod
+    def _csv_contains(column, value: str) -> ColumnElement[bool]:
+        """쉼표로 구분된 문자열 컬럼에 값이 포함되어 있는지 확인"""
+        return or_(
+            column == value,
+            column.like(f"{value},%"),
+            column.like(f"%,{value},%"),
+            column.like(f"%,{value}"),
+        )
+
+    def apply_filters(
+        self,
+        query: Select,
         *,
         sidos: list[str] = None,
         guguns: list[str] = None,
@@ -63,25 +166,19 @@ class CRUDProductHall(CRUDBase[ProductHall, dict[str, Any], dict[str, Any], int]
         food_menus: list[str] = None,
         hall_types: list[str] = None,
         hall_styles: list[str] = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> list[ProductHall]:
+        min_price: int = None,
+        max_price: int = None,
+    ) -> Select:
         """
-        Filter product halls with various criteria
-        Optimized using explicit joins and efficient filtering
+        ProductHall 과 Product 가 조인된 쿼리에 웨딩홀 필터 조건 적용
+        베뉴 조건은 EXISTS 서브쿼리로 처리하여 조인 중복(DISTINCT) 없이 필터링
+        가격 조건은 저장된 견적 범위가 [min_price, max_price] 와 겹치는 웨딩홀
         """
-        query = (
-            select(ProductHall)
-            .join(
-                Product,
-                and_(
-                    Product.id == ProductHall.product_id,
-                    Product.is_deleted == False,
-                    Product.available == True,
-                ),
-            )
-            .where(ProductHall.is_deleted == False)
-        )
+        if min_price is not None:
+            query = query.where(ProductHall.max_price >= min_price)
+
+        if max_price is not None:
+            query = query.where(ProductHall.min_price <= max_price)
 
         if sidos:
             sido_likes = [Product.sido.like(f"%{sido}%") for sido in sidos]
@@ -91,78 +188,128 @@ class CRUDProductHall(CRUDBase[ProductHall, dict[str, Any], dict[str, Any], int]
             gugun_likes = [Product.gugun.like(f"%{gugun}%") for gugun in guguns]
             query = query.where(or_(*gugun_likes))
 
-        # 베뉴 관련 필터가 있는 경우 조인
-        if any([guest_counts, wedding_types, food_menus, hall_types, hall_styles]):
-            query = query.join(
-                ProductHallVenue,
-                and_(
-                    ProductHall.id == ProductHallVenue.product_hall_id,
-                    ProductHallVenue.is_deleted == False,
-                ),
+        venue_conditions = self._venue_conditions(
+            guest_counts=guest_counts,
+            wedding_types=wedding_types,
+            food_menus=food_menus,
+            hall_types=hall_types,
+            hall_styles=hall_styles,
+        )
+        if venue_conditions:
+            # 하나의 베뉴가 모든 조건을 만족해야 함 (기존 조인 방식과 동일한 의미)
+            query = query.where(
+                exists().where(
+                    and_(
+                        ProductHallVenue.product_hall_id == ProductHall.id,
+                        ProductHallVenue.is_deleted == False,
+                        *venue_conditions,
+                    )
+                )
             )
 
-            if guest_counts:
-                guest_count_filters = []
-                for count_range in guest_counts:
-                    min_count, max_count = parse_guest_count_range(count_range)
-
-                    if min_count is not None and max_count is not None:
-                        guest_count_filters.append(
-                            and_(
-                                ProductHallVenue.guaranteed_min_count >= min_count,
-                                ProductHallVenue.guaranteed_min_count <= max_count,
-                            )
-                        )
-                    elif min_count is not None:
-                        guest_count_filters.append(
-                            ProductHallVenue.guaranteed_min_count >= min_count
-                        )
-                    elif max_count is not None:
-                        guest_count_filters.append(
-                            ProductHallVenue.guaranteed_min_count <= max_count
-                        )
+        return query
 
-                if guest_count_filters:
-                    query = query.where(or_(*guest_count_filters))
+    def _base_query(self, *columns) -> Select:
+        """삭제되지 않은 판매중 상품의 웨딩홀 기본 쿼리"""
+        return (
+            select(*columns)
+            .select_from(ProductHall)
+            .join(
+                Product,
+                and_(
+                    Product.id == ProductHall.product_id,
+                    Product.is_deleted == False,
+                    Product.available == True,
+                ),
+            )
+            .where(ProductHall.is_deleted == False)
+        )
 
-            if wedding_types:
-                query = query.where(ProductHallVenue.wedding_type.in_(wedding_types))
+    async def exists_by_product(self, db: AsyncSession, *, product_id: int) -> bool:
+        """판매중인 웨딩홀 상품인지 확인"""
+        query = self._base_query(ProductHall.id).where(Product.id == product_id)
+        result = await db.stream(query)
+        return await result.scalar_one_or_none() is not None
 
-            if food_menus:
-                query = query.where(ProductHallVenue.food_menu.in_(food_menus))
+    async def filter_halls(
+        self,
+        db: AsyncSession,
+        *,
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        guest_counts: list[str] = None,
+        wedding_types: list[str] = None,
+        food_menus: list[str] = None,
+        hall_types: list[str] = None,
+        hall_styles: list[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ProductHall]:
+        """
+        Filter product halls with various criteria
+        Optimized using explicit joins and efficient filtering
+        """
+        query = self.apply_filters(
+            self._base_query(ProductHall),
+            sidos=sidos,
+            guguns=guguns,
+            guest_counts=guest_counts,
+            wedding_types=wedding_types,
+            food_menus=food_menus,
+            hall_types=hall_types,
+            hall_styles=hall_styles,
+        )
+        query = query.order_by(ProductHall.id).offset(skip).limit(limit)
 
-            if hall_types:
-                hall_type_filters = []
-                for hall_type in hall_types:
-                    hall_type_filters.append(
-                        or_(
-                            ProductHallVenue.hall_types == hall_type,
-                            ProductHallVenue.hall_types.like(f"{hall_type},%"),
-                            ProductHallVenue.hall_types.like(f"%,{hall_type},%"),
-                            ProductHallVenue.hall_types.like(f"%,{hall_type}"),
-                        )
-                    )
-                if hall_type_filters:
-                    query = query.where(or_(*hall_type_filters))
-
-            if hall_styles:
-                hall_style_filters = []
-                for hall_style in hall_styles:
-                    hall_style_filters.append(
-                        or_(
-                            ProductHallVenue.hall_styles == hall_style,
-                            ProductHallVenue.hall_styles.like(f"{hall_style},%"),
-                            ProductHallVenue.hall_styles.like(f"%,{hall_style},%"),
-                            ProductHallVenue.hall_styles.like(f"%,{hall_style}"),
-                        )
-                    )
-                if hall_style_filters:
-                    query = query.where(or_(*hall_style_filters))
+        result = await db.stream(query)
+        return await result.scalars().all()
 
-        query = query.distinct().offset(skip).limit(limit)
+    async def filter_hall_rows(
+        self,
+        db: AsyncSession,
+        *,
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        guest_counts: list[str] = None,
+        wedding_types: list[str] = None,
+        food_menus: list[str] = None,
+        hall_types: list[str] = None,
+        hall_styles: list[str] = None,
+        min_price: int = None,
+        max_price: int = None,
+        sort: HallSortEnum = HallSortEnum.default,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[RowMapping]:
+        """
+        filter_halls 와 같은 조건으로 목록 카드 컬럼만 조회
+        description 등 큰 컬럼을 읽지 않고 ORM 엔티티도 만들지 않음
+        가격 정렬은 product_halls 의 견적 범위 인덱스를 사용 (가격 미등록 웨딩홀은 뒤로)
+        """
+        query = self.apply_filters(
+            self._base_query(*HALL_CARD_COLUMNS),
+            sidos=sidos,
+            guguns=guguns,
+            guest_counts=guest_counts,
+            wedding_types=wedding_types,
+            food_menus=food_menus,
+            hall_types=hall_types,
+            hall_styles=hall_styles,
+            min_price=min_price,
+            max_price=max_price,
+        )
+        query = query.order_by(*self._sort_order(sort)).offset(skip).limit(limit)
 
         result = await db.stream(query)
-        return await result.scalars().all()
+        return await result.mappings().all()
+
+    @staticmethod
+    def _sort_order(sort: HallSortEnum) -> tuple:
+        if sort == HallSortEnum.price_asc:
+            return ProductHall.min_price.asc().nulls_last(), ProductHall.id
+        if sort == HallSortEnum.price_desc:
+            return ProductHall.max_price.desc().nulls_last(), ProductHall.id
+        return (ProductHall.id,)
 
     async def count_filtered_halls(
         self,
@@ -175,99 +322,354 @@ class CRUDProductHall(CRUDBase[ProductHall, dict[str, Any], dict[str, Any], int]
         food_menus: list[str] = None,
         hall_types: list[str] = None,
         hall_styles: list[str] = None,
+        min_price: int = None,
+        max_price: int = None,
     ) -> int:
         """
         Filter product halls count with various criteria
         Same filtering logic as filter_halls but returns count only
         """
-        query = (
-            select(func.count(ProductHall.id.distinct()))
-            .join(
-                Product,
-                and_(
-                    Product.id == ProductHall.product_id,
-                    Product.is_deleted == False,
-                    Product.available == True,
-                ),
-            )
-            .where(ProductHall.is_deleted == False)
+        query = self.apply_filters(
+            self._base_query(func.count(ProductHall.id)),
+            sidos=sidos,
+            guguns=guguns,
+            guest_counts=guest_counts,
+            wedding_types=wedding_types,
+            food_menus=food_menus,
+            hall_types=hall_types,
+            hall_styles=hall_styles,
+            min_price=min_price,
+            max_price=max_price,
         )
 
-        if sidos:
-            sido_likes = [Product.sido.like(f"%{sido}%") for sido in sidos]
-            query = query.where(or_(*sido_likes))
+        result = await db.stream(query)
+        return await result.scalar_one() or 0
 
-        if guguns:
-            gugun_likes = [Product.gugun.like(f"%{gugun}%") for gugun in guguns]
-            query = query.where(or_(*gugun_likes))
+    def _estimated_cost_expression(
+        self, *, guest_count: int, season: SeasonEnum
+    ) -> ColumnElement[int]:
+        """베뉴 예상 견적: 대관료 + 성인 식대 * max(하객 수, 최소 보증 인원)"""
+        rental_price = (
+            ProductHallVenue.peak_season_price
+            if season == SeasonEnum.peak
+            else ProductHallVenue.basic_price
+        )
+        billed_guests = case(
+            (
+                ProductHallVenue.guaranteed_min_count > guest_count,
+                ProductHallVenue.guaranteed_min_count,
+            ),
+            else_=guest_count,
+        )
+        return rental_price + ProductHallVenue.food_cost_per_adult * billed_guests
 
-        # 베뉴 관련 필터가 있는 경우 조인
-        if any([guest_counts, wedding_types, food_menus, hall_types, hall_styles]):
-            query = query.join(
-                ProductHallVenue,
+    async def get_affordable_hall_rows(
+        self,
+        db: AsyncSession,
+        *,
+        guest_count: int,
+        budget: int = None,
+        season: SeasonEnum = SeasonEnum.basic,
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        guest_counts: list[str] = None,
+        wedding_types: list[str] = None,
+        food_menus: list[str] = None,
+        hall_types: list[str] = None,
+        hall_styles: list[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[RowMapping]:
+        """
+        하객 수 기준 웨딩홀별 최저 예상 견적을 한 번의 쿼리로 계산하여 예산 내 웨딩홀 조회
+        (estimated_cost 포함, 예상 견적 오름차순)
+
+        베뉴 필터는 견적 집계 서브쿼리에 적용되어, 조건을 만족하는 베뉴의 견적만 비교한다.
+        최대 수용 인원이 등록된(0 보다 큰) 베뉴는 하객 수를 수용할 수 있어야 한다.
+        """
+        estimated_cost = self._estimated_cost_expression(
+            guest_count=guest_count, season=season
+        )
+        venue_costs = (
+            select(
+                ProductHallVenue.product_hall_id,
+                func.min(estimated_cost).label("estimated_cost"),
+            )
+            .where(
                 and_(
-                    ProductHall.id == ProductHallVenue.product_hall_id,
                     ProductHallVenue.is_deleted == False,
-                ),
+                    or_(
+                        ProductHallVenue.max_capacity == 0,
+                        ProductHallVenue.max_capacity >= guest_count,
+                    ),
+                    *self._venue_conditions(
+                        guest_counts=guest_counts,
+                        wedding_types=wedding_types,
+                        food_menus=food_menus,
+                        hall_types=hall_types,
+                        hall_styles=hall_styles,
+                    ),
+                )
             )
+            .group_by(ProductHallVenue.product_hall_id)
+            .subquery()
+        )
 
-            if guest_counts:
-                guest_count_filters = []
-                for count_range in guest_counts:
-                    min_count, max_count = parse_guest_count_range(count_range)
-
-                    if min_count is not None and max_count is not None:
-                        guest_count_filters.append(
-                            and_(
-                                ProductHallVenue.guaranteed_min_count >= min_count,
-                                ProductHallVenue.guaranteed_min_count <= max_count,
-                            )
-                        )
-                    elif min_count is not None:
-                        guest_count_filters.append(
-                            ProductHallVenue.guaranteed_min_count >= min_count
-                        )
-                    elif max_count is not None:
-                        guest_count_filters.append(
-                            ProductHallVenue.guaranteed_min_count <= max_count
-                        )
+        query = self.apply_filters(
+            self._base_query(*HALL_CARD_COLUMNS, venue_costs.c.estimated_cost).join(
+                venue_costs, venue_costs.c.product_hall_id == ProductHall.id
+            ),
+            sidos=sidos,
+            guguns=guguns,
+        )
+        if budget is not None:
+            query = query.where(venue_costs.c.estimated_cost <= budget)
 
-                if guest_count_filters:
-                    query = query.where(or_(*guest_count_filters))
+        query = (
+            query.order_by(venue_costs.c.estimated_cost, ProductHall.id)
+            .offset(skip)
+            .limit(limit)
+        )
 
-            if wedding_types:
-                query = query.where(ProductHallVenue.wedding_type.in_(wedding_types))
+        result = await db.stream(query)
+        return await result.mappings().all()
 
-            if food_menus:
-                query = query.where(ProductHallVenue.food_menu.in_(food_menus))
+    async def get_top_hall_rows(
+        self, db: AsyncSession, *, score_type: str = None, limit: int = 10
+    ) -> Sequence[RowMapping]:
+        """
+        점수 순위 상위 웨딩홀 카드 컬럼 조회 (score, percentile 포함)
+        score_type 이 있으면 해당 점수 타입의 (score_type, value) 인덱스 순서로,
+        없으면 종합 점수 인덱스 순서로 조회한다
+        """
+        if score_type:
+            query = (
+                self._base_query(
+                    *HALL_CARD_COLUMNS,
+                    ProductScore.value.label("score"),
+                    ProductScore.percentile,
+                )
+                .join(
+                    ProductScore,
+                    and_(
+                        ProductScore.product_id == Product.id,
+                        ProductScore.score_type == score_type,
+                        ProductScore.is_deleted == False,
+                    ),
+                )
+                .order_by(ProductScore.value.desc(), Product.id)
+            )
+        else:
+            query = (
+                self._base_query(
+                    *HALL_CARD_COLUMNS,
+                    ProductHall.composite_score.label("score"),
+                    ProductHall.composite_percentile.label("percentile"),
+                )
+                .where(ProductHall.composite_score.is_not(None))
+                .order_by(ProductHall.composite_score.desc().nulls_last(), Product.id)
+            )
 
-            if hall_types:
-                hall_type_filters = []
-                for hall_type in hall_types:
-                    hall_type_filters.append(
-                        or_(
-                            ProductHallVenue.hall_types == hall_type,
-                            ProductHallVenue.hall_types.like(f"{hall_type},%"),
-                            ProductHallVenue.hall_types.like(f"%,{hall_type},%"),
-                            ProductHallVenue.hall_types.like(f"%,{hall_type}"),
-                        )
-                    )
-                if hall_type_filters:
-                    query = query.where(or_(*hall_type_filters))
-
-            if hall_styles:
-                hall_style_filters = []
-                for hall_style in hall_styles:
-                    hall_style_filters.append(
-                        or_(
-                            ProductHallVenue.hall_styles == hall_style,
-                            ProductHallVenue.hall_styles.like(f"{hall_style},%"),
-                            ProductHallVenue.hall_styles.like(f"%,{hall_style},%"),
-                            ProductHallVenue.hall_styles.like(f"%,{hall_style}"),
-                        )
-                    )
-                if hall_style_filters:
-                    query = query.where(or_(*hall_style_filters))
+        result = await db.stream(query.limit(limit))
+        return await result.mappings().all()
 
+    async def get_nearby_hall_rows(
+        self,
+        db: AsyncSession,
+        *,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        guest_counts: list[str] = None,
+        wedding_types: list[str] = None,
+        food_menus: list[str] = None,
+        hall_types: list[str] = None,
+        hall_styles: list[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """
+        반경 내 웨딩홀 카드 컬럼을 거리순으로 조회 (distance_km 포함)
+
+        1. geohash prefix + 위경도 사각형으로 인덱스 기반 후보 축소
+        2. haversine 거리로 정확히 필터링/정렬
+           PostgreSQL 은 SQL 에서, 그 외(SQLite 테스트 등)는 Python 에서 계산
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+        prefixes = geohash_prefixes(lat, lng, radius_km)
+
+        query = self._base_query(*HALL_CARD_COLUMNS).where(
+            and_(
+                or_(*[Product.geohash.like(f"{prefix}%") for prefix in prefixes]),
+                Product.lat.between(min_lat, max_lat),
+                Product.lng.between(min_lng, max_lng),
+            )
+        )
+        query = self.apply_filters(
+            query,
+            sidos=sidos,
+            guguns=guguns,
+            guest_counts=guest_counts,
+            wedding_types=wedding_types,
+            food_menus=food_menus,
+            hall_types=hall_types,
+            hall_styles=hall_styles,
+        )
+
+        if db.get_bind().dialect.name == "postgresql":
+            distance = self._haversine_expression(lat, lng)
+            query = (
+                query.add_columns(distance.label("distance_km"))
+                .where(distance <= radius_km)
+                .order_by(distance, ProductHall.id)
+                .offset(skip)
+                .limit(limit)
+            )
+            result = await db.stream(query)
+            return [dict(row) for row in await result.mappings().all()]
+
+        query = query.add_columns(Product.lat, Product.lng)
         result = await db.stream(query)
-        return await result.scalar_one() or 0
+
+        nearby = []
+        async for row in result.mappings():
+            distance_km = haversine_km(lat, lng, row["lat"], row["lng"])
+            if distance_km <= radius_km:
+                hall = {key: row[key] for key in row.keys() if key not in ("lat", "lng")}
+                hall["distance_km"] = distance_km
+                nearby.append(hall)
+
+        nearby.sort(key=lambda hall: (hall["distance_km"], hall["id"]))
+        return nearby[skip : skip + limit]
+
+    @staticmethod
+    def _haversine_expression(lat: float, lng: float) -> ColumnElement[float]:
+        """Product 좌표와 기준점 사이 haversine 거리(km) SQL 식"""
+        d_lat = func.radians(Product.lat - lat) * 0.5
+        d_lng = func.radians(Product.lng - lng) * 0.5
+        a = func.power(func.sin(d_lat), 2) + func.cos(
+            func.radians(lat)
+        ) * func.cos(func.radians(Product.lat)) * func.power(func.sin(d_lng), 2)
+        return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(1.0, a)))
+
+    async def get_hall_profile_rows(self, db: AsyncSession) -> Sequence[Row]:
+        """유사 웨딩홀 계산용 (product_id, sido, gugun, min_price, max_price) 전체 조회"""
+        query = self._base_query(
+            Product.id,
+            Product.sido,
+            Product.gugun,
+            ProductHall.min_price,
+            ProductHall.max_price,
+        ).order_by(Product.id)
+        result = await db.stream(query)
+        return await result.all()
+
+    async def get_venue_attribute_rows(self, db: AsyncSession) -> Sequence[Row]:
+        """유사 웨딩홀 계산용 베뉴 (product_id, hall_types, hall_styles, food_menu) 조회"""
+        query = self._base_query(
+            Product.id,
+            ProductHallVenue.hall_types,
+            ProductHallVenue.hall_styles,
+            ProductHallVenue.food_menu,
+        ).join(
+            ProductHallVenue,
+            and_(
+                ProductHallVenue.product_hall_id == ProductHall.id,
+                ProductHallVenue.is_deleted == False,
+            ),
+        )
+        result = await db.stream(query)
+        return await result.all()
+
+    async def replace_composite_scores(
+        self, db: AsyncSession, *, rows: list[dict[str, Any]]
+    ) -> None:
+        """
+        웨딩홀 종합 점수/백분위 전체 교체 (기존 값은 NULL 로 초기화, 커밋은 호출한 쪽에서)
+        rows: {"product_id", "composite_score", "composite_percentile"}
+        """
+        connection = await db.connection()
+        await connection.execute(
+            update(ProductHall).values(composite_score=None, composite_percentile=None)
+        )
+        if not rows:
+            return
+
+        await connection.execute(
+            update(ProductHall)
+            .where(ProductHall.product_id == bindparam("hall_product_id"))
+            .values(
+                composite_score=bindparam("hall_composite_score"),
+                composite_percentile=bindparam("hall_composite_percentile"),
+            ),
+            [
+                {
+                    "hall_product_id": row["product_id"],
+                    "hall_composite_score": row["composite_score"],
+                    "hall_composite_percentile": row["composite_percentile"],
+                }
+                for row in rows
+            ],
+        )
+
+    def _coordinate_condition(self) -> ColumnElement[bool]:
+        """좌표가 설정된 상품만 (geohash 는 좌표가 있을 때만 채워짐)"""
+        return Product.geohash.is_not(None)
+
+    async def get_hall_coordinates(self, db: AsyncSession) -> Sequence[Row]:
+        """인메모리 공간 인덱스 구성을 위한 (product_id, lat, lng) 전체 조회"""
+        query = self._base_query(Product.id, Product.lat, Product.lng).where(
+            self._coordinate_condition()
+        )
+        result = await db.stream(query)
+        return await result.all()
+
+    async def get_coordinates_signature(self, db: AsyncSession) -> tuple:
+        """
+        좌표 카탈로그 변경 감지용 요약값
+        (개수, 최대 id, 위도 합, 경도 합) 이 바뀌면 인덱스를 다시 만든다
+        """
+        query = self._base_query(
+            func.count(Product.id),
+            func.max(Product.id),
+            func.sum(Product.lat),
+            func.sum(Product.lng),
+        ).where(self._coordinate_condition())
+        result = await db.stream(query)
+        return tuple(await result.one())
+
+    async def get_card_rows_by_product_ids(
+        self,
+        db: AsyncSession,
+        *,
+        product_ids: list[int],
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        guest_counts: list[str] = None,
+        wedding_types: list[str] = None,
+        food_menus: list[str] = None,
+        hall_types: list[str] = None,
+        hall_styles: list[str] = None,
+    ) -> list[RowMapping]:
+        """
+        상품 id 목록의 카드 컬럼을 필터 적용하여 조회 (product_ids 순서 유지)
+        인메모리 인덱스 결과를 PK 조회로 hydrate 할 때 사용
+        """
+        if not product_ids:
+            return []
+
+        query = self.apply_filters(
+            self._base_query(*HALL_CARD_COLUMNS).where(Product.id.in_(product_ids)),
+            sidos=sidos,
+            guguns=guguns,
+            guest_counts=guest_counts,
+            wedding_types=wedding_types,
+            food_menus=food_menus,
+            hall_types=hall_types,
+            hall_styles=hall_styles,
+        )
+        result = await db.stream(query)
+        rows = {row["id"]: row for row in await result.mappings().all()}
+        return [rows[product_id] for product_id in product_ids if product_id in rows]
@@ -0,0 +1,51 @@
+from collections.abc import Sequence
+
+from sqlalchemy import and_, delete, insert, select, RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.product_hall_similarities import ProductHallSimilarity
+from models.product_halls import ProductHall
+from models.products import Product
+from .base import CRUDBase
+from .crud_product_hall import HALL_CARD_COLUMNS
+
+
+class CRUDProductHallSimilarity(CRUDBase[ProductHallSimilarity, dict, dict, int]):
+    async def get_similar_hall_rows(
+        self, db: AsyncSession, *, product_id: int, limit: int = 10
+    ) -> Sequence[RowMapping]:
+        """
+        유사 웨딩홀 카드 컬럼을 유사도 순으로 조회 (similarity 포함)
+        (product_id, rank) 기본키 범위 조회이며 판매중인 웨딩홀만 반환
+        """
+        query = (
+            select(*HALL_CARD_COLUMNS, ProductHallSimilarity.score.label("similarity"))
+            .select_from(ProductHallSimilarity)
+            .join(
+                Product,
+                and_(
+                    Product.id == ProductHallSimilarity.similar_product_id,
+                    Product.is_deleted == False,
+                    Product.available == True,
+                ),
+            )
+            .join(
+                ProductHall,
+                and_(
+                    ProductHall.product_id == Product.id,
+                    ProductHall.is_deleted == False,
+                ),
+            )
+            .where(ProductHallSimilarity.product_id == product_id)
+            .order_by(ProductHallSimilarity.rank)
+            .limit(limit)
+        )
+        result = await db.stream(query)
+        return await result.mappings().all()
+
+    async def replace_all(self, db: AsyncSession, *, rows: list[dict]) -> None:
+        """유사 웨딩홀 전체를 한 트랜잭션에서 교체"""
+        await db.execute(delete(ProductHallSimilarity))
+        if rows:
+            await db.execute(insert(ProductHallSimilarity), rows)
+        await db.commit()
@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, func, update, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.product_images import ProductImage
@@ -60,73 +60,106 @@ class CRUDProductImage(CRUDBase[ProductImage, dict[str, Any], dict[str, Any], in
         result = await db.stream(query)
         return await result.scalars().all()
 
-    async def get_venue_amenities_images_for_venues(
-        self, db: AsyncSession, *, product_id: int, venue_ids: list[int]
-    ) -> dict[int, list[ProductImage]]:
+    async def get_card_images_for_products(
+        self, db: AsyncSession, *, product_ids: list[int], limit_per_product: int = 6
+    ) -> dict[int, list[dict[str, Any]]]:
         """
-        특정 venue들의 이미지와 공통 이미지를 가져와서 venue별로 그룹핑
-        venue_id가 None인 이미지는 모든 venue에 공통으로 적용
+        여러 상품의 카드 이미지(URL, 크기, placeholder, 파생 이미지)를
+        상품별 상위 N개까지 한 번에 조회
+        ROW_NUMBER 윈도우로 상품별 개수를 DB 에서 제한
         """
-        # 1. venue별 전용 이미지 조회
-        venue_specific_query = (
-            select(ProductImage)
+        if not product_ids:
+            return {}
+
+        ranked = (
+            select(
+                ProductImage.product_id,
+                ProductImage.image_url.label("url"),
+                ProductImage.width,
+                ProductImage.height,
+                ProductImage.placeholder,
+                ProductImage.derivatives,
+                func.row_number()
+                .over(
+                    partition_by=ProductImage.product_id,
+                    order_by=(ProductImage.order, ProductImage.id),
+                )
+                .label("rank"),
+            )
             .where(
                 and_(
-                    ProductImage.product_id == product_id,
-                    ProductImage.product_venue_id.in_(venue_ids),
-                    ProductImage.image_type.in_(["신부대기실", "폐백실", "연회장"]),
+                    ProductImage.product_id.in_(product_ids),
                     ProductImage.is_deleted == False,
                 )
             )
-            .order_by(
-                ProductImage.product_venue_id,
-                ProductImage.image_type,
-                ProductImage.order,
+            .subquery()
+        )
+        query = (
+            select(
+                ranked.c.product_id,
+                ranked.c.url,
+                ranked.c.width,
+                ranked.c.height,
+                ranked.c.placeholder,
+                ranked.c.derivatives,
             )
+            .where(ranked.c.rank <= limit_per_product)
+            .order_by(ranked.c.product_id, ranked.c.rank)
         )
 
-        venue_specific_result = await db.stream(venue_specific_query)
-        venue_specific_images = await venue_specific_result.scalars().all()
+        result = await db.stream(query)
+        images: dict[int, list[dict[str, Any]]] = {}
+        async for row in result.mappings():
+            image = dict(row)
+            images.setdefault(image.pop("product_id"), []).append(image)
+        return images
 
-        # 2. 공통 이미지 조회 (product_venue_id가 None인 것들)
-        common_query = (
-            select(ProductImage)
+    async def get_images_without_derivatives(
+        self, db: AsyncSession, *, after_id: int = 0, limit: int = 500
+    ) -> list[dict[str, Any]]:
+        """파생 이미지가 아직 없는 이미지 목록 (id 기준 keyset 페이지네이션)"""
+        query = (
+            select(
+                ProductImage.id,
+                ProductImage.product_id,
+                ProductImage.product_venue_id,
+                ProductImage.image_type,
+                ProductImage.image_url,
+            )
             .where(
                 and_(
-                    ProductImage.product_id == product_id,
-                    ProductImage.product_venue_id.is_(None),
-                    ProductImage.image_type.in_(["신부대기실", "폐백실", "연회장"]),
+                    ProductImage.id > after_id,
+                    ProductImage.derivatives.is_(None),
                     ProductImage.is_deleted == False,
                 )
             )
-            .order_by(ProductImage.image_type, ProductImage.order)
+            .order_by(ProductImage.id)
+            .limit(limit)
         )
+        result = await db.stream(query)
+        return [dict(row) for row in await result.mappings().all()]
 
-        common_result = await db.stream(common_query)
-        common_images = await common_result.scalars().all()
-
-        # 3. venue별로 이미지 그룹핑
-        venue_images = {}
-
-        # 먼저 모든 venue에 공통 이미지 할당
-        for venue_id in venue_ids:
-            venue_images[venue_id] = list(common_images)
-
-        # venue 전용 이미지가 있는 경우 해당 타입의 공통 이미지를 대체
-        for image in venue_specific_images:
-            venue_id = image.product_venue_id
-            if venue_id in venue_images:
-                # 같은 타입의 공통 이미지 제거
-                venue_images[venue_id] = [
-                    img
-                    for img in venue_images[venue_id]
-                    if img.image_type != image.image_type
-                ]
-                # venue 전용 이미지 추가
-                venue_images[venue_id].append(image)
-
-        # 각 venue의 이미지를 타입과 order로 정렬
-        for venue_id in venue_images:
-            venue_images[venue_id].sort(key=lambda x: (x.image_type, x.order))
+    async def update_derivatives(
+        self, db: AsyncSession, *, rows: list[dict[str, Any]]
+    ) -> None:
+        """
+        크기, placeholder, 파생 이미지 URL 일괄 저장 (executemany)
+        rows: {"image_id", "width", "height", "placeholder", "derivatives"}
+        """
+        if not rows:
+            return
 
-        return venue_images
+        query = (
+            update(ProductImage)
+            .where(ProductImage.id == bindparam("image_id"))
+            .values(
+                width=bindparam("width"),
+                height=bindparam("height"),
+                placeholder=bindparam("placeholder"),
+                derivatives=bindparam("derivatives"),
+            )
+        )
+        # ORM bulk update 가 아닌 Core executemany 로 실행 (WHERE 절 bindparam 사용)
+        connection = await db.connection()
+        await connection.execute(query, rows)
+        await db.commit()
@@ -1,12 +1,28 @@
-from sqlalchemy import and_, select, func
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+
+from sqlalchemy import and_, bindparam, select, func, update, Row
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import Select
 
+from models.product_halls import ProductHall
 from models.product_scores import ProductScore
+from models.products import Product
 from schemes.product_halls import HallScoreComparison, HallScoreSummary, ScoreStatistics
+from utils.utils import utc_now
 from .base import CRUDBase
 
+# 전체 점수 통계 캐시 유지 시간
+SCORE_STATISTICS_TTL_SECONDS = 300
+# 업서트 한 문장에 넣는 최대 row 수 (PostgreSQL 바인드 파라미터 수 제한)
+UPSERT_BATCH_SIZE = 1000
+
 
 class CRUDProductScore(CRUDBase[ProductScore, dict, dict, int]):
+    _statistics_cache: tuple[float, dict[str, ScoreStatistics]] | None = None
+
     async def get_by_product(
         self, db: AsyncSession, *, product_id: int
     ) -> list[ProductScore]:
@@ -38,28 +54,143 @@ class CRUDProductScore(CRUDBase[ProductScore, dict, dict, int]):
         self, db: AsyncSession, *, product_id: int, score_type: str, value: float
     ) -> ProductScore:
         """Update or create a score for a product"""
-        score = await self.get_by_product_and_type(
+        await self.upsert_scores(
+            db,
+            rows=[{"product_id": product_id, "score_type": score_type, "value": value}],
+        )
+        await db.commit()
+        self.invalidate_statistics_cache()
+        return await self.get_by_product_and_type(
             db=db, product_id=product_id, score_type=score_type
         )
 
-        if score:
-            # Update existing score
-            score.value = value
-            db.add(score)
-            await db.commit()
-            await db.refresh(score)
-            return score
-        else:
-            # Create new score
-            new_score = ProductScore(
-                product_id=product_id,
-                score_type=score_type,
-                value=value,
+    @staticmethod
+    def upsert_statement(dialect_name: str, rows: list[dict]):
+        """
+        (product_id, score_type) 기준 INSERT ... ON CONFLICT DO UPDATE 문
+        rows 는 product_id, score_type, value 를 가진 dict 목록 (삭제된 점수는 되살림)
+        """
+        insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+        now = utc_now()
+        statement = insert(ProductScore).values(
+            [
+                {
+                    **row,
+                    "is_deleted": False,
+                    "created_datetime": now,
+                    "updated_datetime": now,
+                }
+                for row in rows
+            ]
+        )
+        return statement.on_conflict_do_update(
+            index_elements=["product_id", "score_type"],
+            set_={
+                "value": statement.excluded.value,
+                "is_deleted": False,
+                "deleted_datetime": None,
+                "updated_datetime": statement.excluded.updated_datetime,
+            },
+        )
+
+    async def upsert_scores(self, db: AsyncSession, *, rows: list[dict]) -> int:
+        """점수 대량 업서트 (UPSERT_BATCH_SIZE 마다 한 문장, 커밋은 호출한 쪽에서)"""
+        dialect_name = db.get_bind().dialect.name
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            await db.execute(
+                self.upsert_statement(
+                    dialect_name, rows[start : start + UPSERT_BATCH_SIZE]
+                )
             )
-            db.add(new_score)
-            await db.commit()
-            await db.refresh(new_score)
-            return new_score
+        return len(rows)
+
+    async def get_existing_product_ids(
+        self, db: AsyncSession, *, product_ids: list[int]
+    ) -> list[int]:
+        """점수를 저장할 수 있는(삭제되지 않은) 상품 id 조회"""
+        if not product_ids:
+            return []
+        query = select(Product.id).where(
+            and_(Product.id.in_(product_ids), Product.is_deleted == False)
+        )
+        result = await db.stream(query)
+        return await result.scalars().all()
+
+    def _hall_scores_query(self, *columns) -> Select:
+        """판매중인 웨딩홀의 삭제되지 않은 점수"""
+        return (
+            select(*columns)
+            .select_from(ProductScore)
+            .join(
+                Product,
+                and_(
+                    Product.id == ProductScore.product_id,
+                    Product.is_deleted == False,
+                    Product.available == True,
+                ),
+            )
+            .join(
+                ProductHall,
+                and_(
+                    ProductHall.product_id == Product.id,
+                    ProductHall.is_deleted == False,
+                ),
+            )
+            .where(ProductScore.is_deleted == False)
+        )
+
+    async def get_hall_score_rows(self, db: AsyncSession) -> Sequence[Row]:
+        """점수 행렬 구성을 위한 (product_id, score_type, value) 전체 조회"""
+        query = self._hall_scores_query(
+            ProductScore.product_id, ProductScore.score_type, ProductScore.value
+        )
+        result = await db.stream(query)
+        return await result.all()
+
+    async def replace_percentiles(
+        self, db: AsyncSession, *, rows: list[dict]
+    ) -> None:
+        """
+        점수 백분위 순위 전체 교체 (기존 값은 NULL 로 초기화, 커밋은 호출한 쪽에서)
+        rows: {"product_id", "score_type", "percentile"}
+        """
+        connection = await db.connection()
+        await connection.execute(update(ProductScore).values(percentile=None))
+        if not rows:
+            return
+
+        # ORM bulk update 가 아닌 Core executemany 로 실행 (WHERE 절 bindparam 사용)
+        await connection.execute(
+            update(ProductScore)
+            .where(
+                and_(
+                    ProductScore.product_id == bindparam("score_product_id"),
+                    ProductScore.score_type == bindparam("score_score_type"),
+                )
+            )
+            .values(percentile=bindparam("score_percentile")),
+            [
+                {
+                    "score_product_id": row["product_id"],
+                    "score_score_type": row["score_type"],
+                    "score_percentile": row["percentile"],
+                }
+                for row in rows
+            ],
+        )
+
+    async def get_hall_scores_signature(self, db: AsyncSession) -> tuple:
+        """
+        점수 카탈로그 변경 감지용 요약값
+        (개수, 최대 id, 점수 합) 이 바뀌면 점수 행렬을 다시 만든다
+        """
+        query = self._hall_scores_query(
+            func.count(ProductScore.id),
+            func.max(ProductScore.id),
+            func.sum(ProductScore.value),
+        )
+        result = await db.stream(query)
+        return tuple(await result.one())
 
     async def get_score_statistics(
         self, db: AsyncSession, *, score_type: str = None
@@ -92,26 +223,88 @@ class CRUDProductScore(CRUDBase[ProductScore, dict, dict, int]):
 
         return statistics
 
+    def invalidate_statistics_cache(self) -> None:
+        """점수가 바뀐 뒤 다음 요청에서 통계를 다시 집계하도록 캐시 제거"""
+        self._statistics_cache = None
+
+    async def get_cached_score_statistics(
+        self, db: AsyncSession
+    ) -> dict[str, ScoreStatistics]:
+        """
+        전체 점수 통계 (워커별 캐시, SCORE_STATISTICS_TTL_SECONDS 동안 재사용)
+        전체 평균은 자주 바뀌지 않으므로 상세/비교 요청마다 집계하지 않는다
+        """
+        now = time.monotonic()
+        if self._statistics_cache is None or self._statistics_cache[0] <= now:
+            statistics = await self.get_score_statistics(db)
+            self._statistics_cache = (now + SCORE_STATISTICS_TTL_SECONDS, statistics)
+        return self._statistics_cache[1]
+
     async def get_hall_score_comparison(
         self, db: AsyncSession, *, product_id: int
     ) -> HallScoreSummary:
         """웨딩홀 점수와 평균 비교"""
+        summaries = await self.get_hall_score_comparisons(
+            db, product_ids=[product_id]
+        )
+        return summaries[product_id]
 
-        # 1. 해당 웨딩홀의 점수들 조회
-        hall_scores_query = select(ProductScore).where(
+    async def get_hall_score_comparisons(
+        self, db: AsyncSession, *, product_ids: list[int]
+    ) -> dict[int, HallScoreSummary]:
+        """여러 웨딩홀의 점수와 평균 비교 (점수 조회 1번, 통계는 캐시 사용)"""
+
+        # 1. 웨딩홀들의 점수와 백분위 조회
+        hall_scores_query = select(
+            ProductScore.product_id,
+            ProductScore.score_type,
+            ProductScore.value,
+            ProductScore.percentile,
+        ).where(
             and_(
-                ProductScore.product_id == product_id, ProductScore.is_deleted == False
+                ProductScore.product_id.in_(product_ids),
+                ProductScore.is_deleted == False,
             )
         )
         hall_scores_result = await db.execute(hall_scores_query)
-        hall_scores = {
-            score.score_type: score.value for score in hall_scores_result.scalars()
-        }
+        hall_scores = defaultdict(dict)
+        hall_percentiles = defaultdict(dict)
+        for product_id, score_type, value, percentile in hall_scores_result:
+            hall_scores[product_id][score_type] = value
+            hall_percentiles[product_id][score_type] = percentile
+
+        # 2. 배치 작업으로 저장된 종합 점수
+        composite_result = await db.execute(
+            select(
+                ProductHall.product_id,
+                ProductHall.composite_score,
+                ProductHall.composite_percentile,
+            ).where(ProductHall.product_id.in_(product_ids))
+        )
+        composites = {row[0]: (row[1], row[2]) for row in composite_result}
 
-        # 2. 전체 평균 통계 조회
-        statistics = await self.get_score_statistics(db)
+        # 3. 전체 평균 통계 조회
+        statistics = await self.get_cached_score_statistics(db)
 
-        # 3. 비교 데이터 생성
+        # 4. 비교 데이터 생성
+        return {
+            product_id: self._build_score_summary(
+                hall_scores[product_id],
+                statistics,
+                percentiles=hall_percentiles[product_id],
+                composite=composites.get(product_id, (None, None)),
+            )
+            for product_id in product_ids
+        }
+
+    @staticmethod
+    def _build_score_summary(
+        hall_scores: dict[str, float],
+        statistics: dict[str, ScoreStatistics],
+        *,
+        percentiles: dict[str, float | None] = None,
+        composite: tuple[float | None, float | None] = (None, None),
+    ) -> HallScoreSummary:
         score_comparisons = []
         total_hall_score = 0
         total_average = 0
@@ -128,6 +321,7 @@ class CRUDProductScore(CRUDBase[ProductScore, dict, dict, int]):
                     hall_score=round(hall_score, 1) if hall_score is not None else 0,
                     average=stats.average,
                     difference=round(difference, 1),
+                    percentile=(percentiles or {}).get(score_type),
                 )
             )
 
@@ -137,16 +331,21 @@ class CRUDProductScore(CRUDBase[ProductScore, dict, dict, int]):
                 valid_scores += 1
             total_average += stats.average
 
-        # 전체 점수 계산
-        overall_score = (
-            round(total_hall_score / valid_scores, 1) if valid_scores > 0 else 0.0
-        )
+        # 전체 점수 (저장된 종합 점수 우선, 배치 작업 전이면 직접 계산)
+        composite_score, composite_percentile = composite
+        if composite_score is not None:
+            overall_score = round(composite_score, 1)
+        else:
+            overall_score = (
+                round(total_hall_score / valid_scores, 1) if valid_scores > 0 else 0.0
+            )
         overall_average = (
             round(total_average / len(statistics), 1) if statistics else 0.0
         )
 
         return HallScoreSummary(
             overall_score=overall_score,
+            overall_percentile=composite_percentile,
             overall_average=overall_average,
             score_comparisons=score_comparisons,
         )
@@ -0,0 +1,174 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select, RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, selectinload, with_loader_criteria
+from sqlalchemy.sql.expression import Select
+
+from core.enums import StudioSceneEnum, StudioSortEnum
+from models.product_studio_packages import ProductStudioPackage
+from models.product_studios import ProductStudio
+from models.products import Product
+from utils.studio_scenes import scene_mask, scene_supersets
+from .base import CRUDBase
+
+# 목록 카드(ProductStudioListRead)에 필요한 컬럼
+STUDIO_CARD_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.sido,
+    Product.gugun,
+    Product.address,
+    Product.thumbnail_url,
+    ProductStudio.scene_flags,
+    ProductStudio.hair_makeup_available,
+    ProductStudio.min_package_price,
+    ProductStudio.max_package_price,
+)
+
+
+class CRUDProductStudio(
+    CRUDBase[ProductStudio, dict[str, Any], dict[str, Any], int]
+):
+    def _base_query(self, *columns) -> Select:
+        """삭제되지 않은 판매중 상품의 스튜디오 기본 쿼리"""
+        return (
+            select(*columns)
+            .select_from(ProductStudio)
+            .join(
+                Product,
+                and_(
+                    Product.id == ProductStudio.product_id,
+                    Product.is_deleted == False,
+                    Product.available == True,
+                ),
+            )
+            .where(ProductStudio.is_deleted == False)
+        )
+
+    def apply_filters(
+        self,
+        query: Select,
+        *,
+        scenes: list[StudioSceneEnum] = None,
+        hair_makeup: bool = None,
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        min_price: int = None,
+        max_price: int = None,
+    ) -> Select:
+        """
+        ProductStudio 와 Product 가 조인된 쿼리에 스튜디오 필터 조건 적용
+        씬 조건은 모든 씬을 포함하는 스튜디오 (mask 의 상위 집합 값들에 대한
+        scene_flags IN (...) 이므로 scene_flags 인덱스 사용 가능)
+        가격 조건은 저장된 패키지 가격 범위가 [min_price, max_price] 와 겹치는 스튜디오
+        """
+        if scenes:
+            mask = scene_mask(scene.value for scene in scenes)
+            query = query.where(ProductStudio.scene_flags.in_(scene_supersets(mask)))
+
+        if hair_makeup is not None:
+            query = query.where(ProductStudio.hair_makeup_available == hair_makeup)
+
+        if min_price is not None:
+            query = query.where(ProductStudio.max_package_price >= min_price)
+
+        if max_price is not None:
+            query = query.where(ProductStudio.min_package_price <= max_price)
+
+        if sidos:
+            query = query.where(
+                or_(*[Product.sido.like(f"%{sido}%") for sido in sidos])
+            )
+
+        if guguns:
+            query = query.where(
+                or_(*[Product.gugun.like(f"%{gugun}%") for gugun in guguns])
+            )
+
+        return query
+
+    async def filter_studio_rows(
+        self,
+        db: AsyncSession,
+        *,
+        scenes: list[StudioSceneEnum] = None,
+        hair_makeup: bool = None,
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        min_price: int = None,
+        max_price: int = None,
+        sort: StudioSortEnum = StudioSortEnum.default,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[RowMapping]:
+        """
+        스튜디오 목록 카드 컬럼 조회
+        가격 정렬은 패키지 가격 범위 인덱스를 사용 (패키지가 없는 스튜디오는 뒤로)
+        """
+        query = self.apply_filters(
+            self._base_query(*STUDIO_CARD_COLUMNS),
+            scenes=scenes,
+            hair_makeup=hair_makeup,
+            sidos=sidos,
+            guguns=guguns,
+            min_price=min_price,
+            max_price=max_price,
+        )
+        query = query.order_by(*self._sort_order(sort)).offset(skip).limit(limit)
+
+        result = await db.stream(query)
+        return await result.mappings().all()
+
+    @staticmethod
+    def _sort_order(sort: StudioSortEnum) -> tuple:
+        if sort == StudioSortEnum.price_asc:
+            return ProductStudio.min_package_price.asc().nulls_last(), ProductStudio.id
+        if sort == StudioSortEnum.price_desc:
+            return ProductStudio.max_package_price.desc().nulls_last(), ProductStudio.id
+        return (ProductStudio.id,)
+
+    async def count_filtered_studios(
+        self,
+        db: AsyncSession,
+        *,
+        scenes: list[StudioSceneEnum] = None,
+        hair_makeup: bool = None,
+        sidos: list[str] = None,
+        guguns: list[str] = None,
+        min_price: int = None,
+        max_price: int = None,
+    ) -> int:
+        """filter_studio_rows 와 같은 조건의 스튜디오 개수"""
+        query = self.apply_filters(
+            self._base_query(func.count(ProductStudio.id)),
+            scenes=scenes,
+            hair_makeup=hair_makeup,
+            sidos=sidos,
+            guguns=guguns,
+            min_price=min_price,
+            max_price=max_price,
+        )
+
+        result = await db.stream(query)
+        return await result.scalar_one() or 0
+
+    async def get_with_packages(
+        self, db: AsyncSession, *, product_id: int
+    ) -> ProductStudio | None:
+        """상품과 삭제되지 않은 패키지가 로드된 스튜디오 조회"""
+        query = (
+            self._base_query(ProductStudio)
+            .where(Product.id == product_id)
+            .options(
+                contains_eager(ProductStudio.product),
+                selectinload(ProductStudio.studio_packages),
+                with_loader_criteria(
+                    ProductStudioPackage, ProductStudioPackage.is_deleted == False
+                ),
+            )
+        )
+
+        result = await db.stream(query)
+        return await result.scalar_one_or_none()
@@ -1,11 +1,13 @@
-from typing import List, Optional
+from collections.abc import Sequence
+from typing import Optional
 
-from sqlalchemy import select, and_, func, update
+from sqlalchemy import select, and_, func, update, RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from crud.base import CRUDBase
 from models.product_halls import ProductHall
+from models.products import Product
 from models.suggest_halls import RecommendedHall
 from schemes.suggest_halls import RecommendedHallCreate, RecommendedHallUpdate
 
@@ -16,7 +18,7 @@ class CRUDRecommendedHall(
 
     async def get_active_recommendations(
         self, db: AsyncSession, skip: int = 0, limit: int = 10
-    ) -> List[RecommendedHall]:
+    ) -> list[RecommendedHall]:
         """활성화된 추천 웨딩홀 목록 조회 (순서대로)"""
         query = (
             select(self.model)
@@ -31,9 +33,35 @@ class CRUDRecommendedHall(
         result = await db.execute(query)
         return result.scalars().all()
 
+    async def get_active_recommendation_rows(
+        self, db: AsyncSession, skip: int = 0, limit: int = 10
+    ) -> Sequence[RowMapping]:
+        """활성화된 추천 웨딩홀의 카드 컬럼만 조회 (순서대로)"""
+        query = (
+            select(
+                Product.id,
+                Product.name,
+                Product.sido,
+                Product.gugun,
+                Product.address,
+                func.coalesce(Product.thumbnail_url, "").label("thumbnail_url"),
+                Product.subway_line,
+                Product.subway_name,
+            )
+            .select_from(self.model)
+            .join(ProductHall, ProductHall.id == self.model.product_hall_id)
+            .join(Product, Product.id == ProductHall.product_id)
+            .where(and_(self.model.is_deleted == False, self.model.is_active == True))
+            .order_by(self.model.recommendation_order.asc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return result.mappings().all()
+
     async def get_all_recommendations(
         self, db: AsyncSession, skip: int = 0, limit: int = 100
-    ) -> List[RecommendedHall]:
+    ) -> list[RecommendedHall]:
         """모든 추천 웨딩홀 목록 조회 (관리자용)"""
         query = (
             select(self.model)
@@ -70,7 +98,7 @@ class CRUDRecommendedHall(
         max_order = result.scalar()
         return (max_order or 0) + 1
 
-    async def update_orders(self, db: AsyncSession, order_updates: List[dict]) -> bool:
+    async def update_orders(self, db: AsyncSession, order_updates: list[dict]) -> bool:
         """여러 추천 웨딩홀의 순서 한번에 업데이트"""
         try:
             for order_update in order_updates:
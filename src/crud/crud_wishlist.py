@@ -1,10 +1,16 @@
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, literal, select, text, RowMapping
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from models.product_categories import ProductCategory
+from models.product_images import ProductImage
+from models.products import Product
 from models.user_wishlist import UserWishlist
 from schemes.user_wishlist import WishlistCreate, WishlistUpdate
+from utils.utils import utc_now
 from .base import CRUDBase
 
 
@@ -40,3 +46,125 @@ class CRUDUserWishlist(CRUDBase[UserWishlist, WishlistCreate, WishlistUpdate, in
         )
         result = await db.stream(query)
         return await result.scalar_one_or_none()
+
+    @staticmethod
+    def add_statement(
+        dialect_name: str, *, user_id: UUID, product_id: int, memo: str | None
+    ):
+        """
+        INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING 위시리스트 추가 문
+        삭제되지 않은 상품일 때만 SELECT 가 행을 만들고, 이미 담긴 상품은 부분 유일
+        인덱스(unique_user_product) 충돌로 건너뛴다 (두 경우 모두 반환 행 없음)
+        """
+        insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+        source = select(
+            literal(user_id, UserWishlist.user_id.type),
+            Product.id,
+            literal(memo, UserWishlist.memo.type),
+            literal(utc_now(), UserWishlist.created_datetime.type),
+            literal(False),
+        ).where(and_(Product.id == product_id, Product.is_deleted == False))
+
+        return (
+            insert(UserWishlist)
+            .from_select(
+                ["user_id", "product_id", "memo", "created_datetime", "is_deleted"],
+                source,
+            )
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "product_id"],
+                index_where=text("NOT is_deleted"),
+            )
+            .returning(*UserWishlist.__table__.columns)
+        )
+
+    async def add(
+        self, db: AsyncSession, *, user_id: UUID, obj_in: WishlistCreate
+    ) -> RowMapping | None:
+        """
+        위시리스트 추가 (문장 한 번, 커밋은 호출한 쪽에서)
+        없는 상품이거나 이미 담긴 상품이면 None
+        """
+        statement = self.add_statement(
+            db.get_bind().dialect.name,
+            user_id=user_id,
+            product_id=obj_in.product_id,
+            memo=obj_in.memo,
+        )
+        result = await db.execute(statement)
+        return result.mappings().one_or_none()
+
+    async def get_card_rows_by_user(
+        self, db: AsyncSession, *, user_id: UUID, cursor: int = None, limit: int = 20
+    ) -> Sequence[RowMapping]:
+        """
+        내 위시리스트를 상품 카드 컬럼과 함께 최신순으로 조회 (쿼리 한 번)
+        cursor 는 이전 페이지 마지막 위시리스트 id, 대표 이미지는 상품별 첫 이미지
+        """
+        first_image = (
+            select(ProductImage.image_url)
+            .where(
+                and_(
+                    ProductImage.product_id == Product.id,
+                    ProductImage.is_deleted == False,
+                )
+            )
+            .order_by(ProductImage.order, ProductImage.id)
+            .limit(1)
+            .correlate(Product)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                UserWishlist.id,
+                UserWishlist.product_id,
+                UserWishlist.memo,
+                UserWishlist.created_datetime,
+                Product.product_category_id.label("category_id"),
+                ProductCategory.type.label("category_type"),
+                Product.name,
+                Product.sido,
+                Product.gugun,
+                Product.address,
+                Product.available,
+                func.coalesce(first_image, Product.thumbnail_url).label("image_url"),
+            )
+            .join(
+                Product,
+                and_(
+                    Product.id == UserWishlist.product_id,
+                    Product.is_deleted == False,
+                ),
+            )
+            .join(ProductCategory, ProductCategory.id == Product.product_category_id)
+            .where(
+                and_(
+                    UserWishlist.user_id == user_id,
+                    UserWishlist.is_deleted == False,
+                )
+            )
+            .order_by(UserWishlist.id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            query = query.where(UserWishlist.id < cursor)
+
+        result = await db.stream(query)
+        return await result.mappings().all()
+
+    async def get_wished_product_ids(
+        self, db: AsyncSession, *, user_id: UUID, product_ids: list[int]
+    ) -> list[int]:
+        """주어진 상품 중 위시리스트에 담긴 상품 id ((user_id, product_id) 인덱스 IN 조회)"""
+        if not product_ids:
+            return []
+
+        query = select(UserWishlist.product_id).where(
+            and_(
+                UserWishlist.user_id == user_id,
+                UserWishlist.product_id.in_(product_ids),
+                UserWishlist.is_deleted == False,
+            )
+        )
+        result = await db.stream(query)
+        return await result.scalars().all()
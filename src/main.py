@@ -1,13 +1,16 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
 
 from admin.setup import setup_admin
 from api.v1.router import api_router
+from core.catalogue_index import build_catalogue_indexes, run_catalogue_index_refresher
 from core.config import settings
 from core.db import async_engine, check_db_connection, close_db_connections
 from core.exceptions import exception_handlers
@@ -32,12 +35,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"❌ Database warmup failed: {e}")
 
+    await build_catalogue_indexes()
+    index_refresher = asyncio.create_task(run_catalogue_index_refresher())
+
     print("🎉 Application startup completed")
 
     yield  # 애플리케이션 실행
 
     # 종료 시 정리
     print("🛑 Shutting down application...")
+    index_refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await index_refresher
     try:
         await close_db_connections()
         print("✅ Database connections closed")
@@ -92,6 +101,7 @@ app = FastAPI(
     docs_url="/-/docs",
     redoc_url=None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     exception_handlers=exception_handlers,
 )
 app.openapi = custom_openapi
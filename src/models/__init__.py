@@ -5,6 +5,7 @@ from .news import NewsItem, NewsCategory
 from .product_ai_review import ProductAIReview
 from .product_blogs import ProductBlog
 from .product_categories import ProductCategory
+from .product_hall_similarities import ProductHallSimilarity
 from .product_halls import ProductHall
 from .product_images import ProductImage
 from .product_scores import ProductScore
@@ -28,6 +29,7 @@ all_models = [
     ProductAIReview,
     ProductScore,
     ProductHall,
+    ProductHallSimilarity,
     ProductStudio,
     ProductStudioPackage,
     ProductBlog,
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field, SQLModel
+
+from utils.utils import utc_now
+
+
+class ProductHallSimilarity(SQLModel, table=True):
+    """
+    웨딩홀별 유사 웨딩홀 (배치 작업으로 미리 계산)
+    (product_id, rank) 기본키 범위 조회 한 번으로 목록을 읽는다
+    """
+
+    __tablename__ = "product_hall_similarities"
+
+    product_id: int = Field(foreign_key="products.id", primary_key=True)
+    rank: int = Field(primary_key=True)  # 1부터 시작, 낮을수록 유사
+    similar_product_id: int = Field(foreign_key="products.id")
+    score: float = Field(default=0.0)  # 코사인 유사도
+
+    created_datetime: datetime = Field(
+        default_factory=utc_now,
+        sa_column=Column(DateTime(timezone=True)),
+    )
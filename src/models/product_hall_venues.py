@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import JSON, Column, DateTime
 from sqlmodel import Field, Relationship, SQLModel
 
 from utils.utils import utc_now
@@ -61,6 +61,13 @@ class ProductHallVenue(SQLModel, table=True):
     has_banquet_hall: bool = Field(default=False)
     has_stage: bool = Field(default=False)
 
+    # 타입별 편의시설 이미지 URL (공통/전용 이미지 병합 결과, 이미지 변경 시 갱신)
+    amenity_images: dict[str, list[str]] | None = Field(
+        default=None, sa_column=Column(JSON)
+    )
+    # 베뉴 전용 이미지 URL (order 순, 이미지 변경 시 갱신)
+    image_urls: list[str] | None = Field(default=None, sa_column=Column(JSON))
+
     is_deleted: bool = Field(default=False)
     created_datetime: datetime = Field(
         default_factory=utc_now,
@@ -1,11 +1,29 @@
+from collections import defaultdict
 from datetime import datetime
+from itertools import chain
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Index,
+    and_,
+    bindparam,
+    event,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.orm.util import identity_key
 from sqlmodel import Field, Relationship, SQLModel
 
 from models.product_hall_venues import ProductHallVenue
+from models.product_images import ProductImage
 from models.products import Product
 from utils.utils import utc_now
+from utils.venue_images import AMENITY_IMAGE_TYPES, resolve_amenity_images
 
 
 class ProductHall(SQLModel, table=True):
@@ -26,6 +44,14 @@ class ProductHall(SQLModel, table=True):
     has_smoking_area: bool = Field(default=False)
     has_photo_zone: bool = Field(default=False)
 
+    # 베뉴 견적 범위 (베뉴 변경 시 갱신, 가격 필터/정렬용)
+    min_price: int | None = Field(default=None, index=True)
+    max_price: int | None = Field(default=None)
+
+    # 점수 평균과 그 백분위 순위 (점수 변경 후 배치 작업으로 계산, 종합 순위용)
+    composite_score: float | None = Field(default=None)
+    composite_percentile: float | None = Field(default=None)
+
     is_deleted: bool = Field(default=False)
     created_datetime: datetime = Field(
         default_factory=utc_now,
@@ -44,3 +70,181 @@ class ProductHall(SQLModel, table=True):
     product_hall_venues: list["ProductHallVenue"] = Relationship(
         back_populates="product_hall"
     )
+
+
+# 가격 내림차순 정렬(NULLS LAST)용 인덱스, SQLite 는 인덱스의 NULLS LAST 를 지원하지 않음
+Index(
+    "ix_product_halls_max_price_desc",
+    ProductHall.max_price.desc().nulls_last(),
+).ddl_if(dialect="postgresql")
+
+# 종합 점수 내림차순 정렬(NULLS LAST)용 인덱스
+Index(
+    "ix_product_halls_composite_score_desc",
+    ProductHall.composite_score.desc().nulls_last(),
+).ddl_if(dialect="postgresql")
+
+
+def price_envelope_values() -> dict:
+    """
+    삭제되지 않은 베뉴 기준 웨딩홀 최소/최대 견적 (product_halls 에 상관된 서브쿼리)
+    최소: 기본 대관료 + 최소 보증 인원 식대, 최대: 성수기 대관료 + 최소 보증 인원 식대
+    """
+    food_cost = (
+        ProductHallVenue.guaranteed_min_count * ProductHallVenue.food_cost_per_adult
+    )
+    active_venue = and_(
+        ProductHallVenue.product_hall_id == ProductHall.id,
+        ProductHallVenue.is_deleted == False,
+    )
+    return {
+        "min_price": select(func.min(ProductHallVenue.basic_price + food_cost))
+        .where(active_venue)
+        .scalar_subquery(),
+        "max_price": select(func.max(ProductHallVenue.peak_season_price + food_cost))
+        .where(active_venue)
+        .scalar_subquery(),
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_price_envelopes(session: Session, _flush_context) -> None:
+    """베뉴가 추가/수정/삭제되면 같은 flush 안에서 해당 웨딩홀 견적 범위 갱신"""
+    hall_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, ProductHallVenue):
+            hall_ids.add(obj.product_hall_id)
+            # 다른 웨딩홀로 옮겨진 베뉴는 이전 웨딩홀 견적 범위도 다시 계산
+            hall_ids.update(attributes.get_history(obj, "product_hall_id").deleted)
+    hall_ids.discard(None)
+    if not hall_ids:
+        return
+
+    result = session.connection().execute(
+        update(ProductHall)
+        .where(ProductHall.id.in_(hall_ids))
+        .values(**price_envelope_values())
+        .returning(ProductHall.id, ProductHall.min_price, ProductHall.max_price)
+    )
+
+    # 세션에 로드된 웨딩홀 객체도 DB 값과 맞춤 (추가 flush 대상이 되지 않도록 committed 값으로)
+    for hall_id, min_price, max_price in result:
+        hall = session.identity_map.get(identity_key(ProductHall, hall_id))
+        if hall is not None:
+            attributes.set_committed_value(hall, "min_price", min_price)
+            attributes.set_committed_value(hall, "max_price", max_price)
+
+
+def refresh_venue_amenity_images(
+    connection: Connection,
+    *,
+    product_ids: set[int] | None = None,
+    hall_ids: set[int] = frozenset(),
+) -> dict[int, dict]:
+    """
+    베뉴별 편의시설 이미지(amenity_images)와 베뉴 전용 이미지 URL(image_urls) 재계산 후
+    저장 (베뉴 id 별 컬럼 값 반환)
+    product_ids 가 None 이면 전체 베뉴, 아니면 해당 상품/웨딩홀의 베뉴만 갱신
+    """
+    venue_query = (
+        select(ProductHallVenue.id, ProductHall.product_id)
+        .join(ProductHall, ProductHall.id == ProductHallVenue.product_hall_id)
+        .where(ProductHallVenue.is_deleted == False)
+    )
+    image_query = (
+        select(
+            ProductImage.product_id,
+            ProductImage.product_venue_id,
+            ProductImage.image_type,
+            ProductImage.order,
+            ProductImage.image_url,
+        )
+        .where(
+            and_(
+                or_(
+                    ProductImage.image_type.in_(AMENITY_IMAGE_TYPES),
+                    ProductImage.product_venue_id.is_not(None),
+                ),
+                ProductImage.is_deleted == False,
+            )
+        )
+        .order_by(ProductImage.order, ProductImage.id)
+    )
+    if product_ids is not None:
+        venue_query = venue_query.where(
+            or_(ProductHall.product_id.in_(product_ids), ProductHall.id.in_(hall_ids))
+        )
+
+    venues = connection.execute(venue_query).all()
+    if not venues:
+        return {}
+    if product_ids is not None:
+        image_query = image_query.where(
+            ProductImage.product_id.in_({product_id for _, product_id in venues})
+        )
+
+    common_images = defaultdict(list)
+    venue_images = defaultdict(list)
+    for product_id, venue_id, image_type, order, image_url in connection.execute(
+        image_query
+    ):
+        if venue_id is None:
+            common_images[product_id].append((image_type, order, image_url))
+        else:
+            venue_images[venue_id].append((image_type, order, image_url))
+
+    resolved = {
+        venue_id: {
+            "amenity_images": resolve_amenity_images(
+                common_images[product_id], venue_images[venue_id]
+            ),
+            # 베뉴 전용 이미지 전체 (order 순)
+            "image_urls": [image_url for _, _, image_url in venue_images[venue_id]],
+        }
+        for venue_id, product_id in venues
+    }
+    connection.execute(
+        update(ProductHallVenue)
+        .where(ProductHallVenue.id == bindparam("venue_id"))
+        .values(
+            amenity_images=bindparam("resolved_amenity_images"),
+            image_urls=bindparam("resolved_image_urls"),
+        ),
+        [
+            {
+                "venue_id": venue_id,
+                "resolved_amenity_images": values["amenity_images"],
+                "resolved_image_urls": values["image_urls"],
+            }
+            for venue_id, values in resolved.items()
+        ],
+    )
+    return resolved
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_venue_amenity_images(session: Session, _flush_context) -> None:
+    """
+    상품 이미지가 바뀌거나 베뉴가 추가되면 같은 flush 안에서 amenity_images/image_urls 갱신
+    """
+    product_ids = set()
+    hall_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, ProductImage):
+            # 타입이 편의시설 이미지에서 다른 타입으로 바뀐 경우도 포함
+            product_ids.add(obj.product_id)
+        elif isinstance(obj, ProductHallVenue) and obj in session.new:
+            hall_ids.add(obj.product_hall_id)
+    if not product_ids and not hall_ids:
+        return
+
+    resolved = refresh_venue_amenity_images(
+        session.connection(), product_ids=product_ids, hall_ids=hall_ids
+    )
+
+    # 세션에 로드된 베뉴 객체도 DB 값과 맞춤
+    for venue_id, values in resolved.items():
+        venue = session.identity_map.get(identity_key(ProductHallVenue, venue_id))
+        if venue is not None:
+            for key, value in values.items():
+                attributes.set_committed_value(venue, key, value)
@@ -22,6 +22,14 @@ class ProductImage(SQLModel, table=True):
     image_url: str = Field(max_length=500)
     image_type: str = Field(max_length=50)
     order: int = Field(default=0, ge=0)
+    # 반응형 파생 이미지 (build_image_derivatives 배치가 채움)
+    width: int | None = Field(default=None)
+    height: int | None = Field(default=None)
+    placeholder: str | None = Field(default=None)
+    derivatives: dict[str, str] | None = Field(
+        default=None,
+        sa_column=sqlmodel.Column(sqlmodel.JSON(none_as_null=True)),
+    )
     is_deleted: bool = Field(default=False)
     created_datetime: datetime = Field(
         default_factory=utc_now,
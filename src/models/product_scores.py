@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index, UniqueConstraint
 from sqlmodel import SQLModel, Relationship, Field
 
 from utils.utils import utc_now
@@ -17,6 +17,8 @@ class ProductScore(SQLModel, table=True):
     product_id: int = Field(foreign_key="products.id")
     score_type: str = Field(...)
     value: float = Field(default=0.0)
+    # 같은 점수 타입의 판매중 웨딩홀 중 백분위 순위 (0~100, 배치 작업으로 계산)
+    percentile: float | None = Field(default=None)
 
     is_deleted: bool = Field(default=False)
     created_datetime: datetime = Field(
@@ -33,3 +35,10 @@ class ProductScore(SQLModel, table=True):
 
     # Relationship
     product: "Product" = Relationship(back_populates="scores")
+
+    __table_args__ = (
+        # 상품별 점수 타입은 하나 (대량 업서트의 ON CONFLICT 대상)
+        UniqueConstraint("product_id", "score_type", name="unique_product_score_type"),
+        # 점수 타입별 순위(리더보드) 조회용
+        Index("ix_product_scores_score_type_value", "score_type", "value"),
+    )
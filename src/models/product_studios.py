@@ -1,13 +1,27 @@
 from datetime import datetime
+from itertools import chain
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    and_,
+    case,
+    event,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.orm.util import identity_key
 from sqlmodel import Field, Relationship, SQLModel
 
+from models.product_studio_packages import ProductStudioPackage
+from utils.studio_scenes import SCENE_COLUMNS, pack_scene_flags
 from utils.utils import utc_now
 
 if TYPE_CHECKING:
-    from models.product_studio_packages import ProductStudioPackage
     from models.products import Product
 
 
@@ -26,9 +40,16 @@ class ProductStudio(SQLModel, table=True):
     has_pet_scene: bool = Field(default=False)
     has_black_white_scene: bool = Field(default=False)
 
+    # has_*_scene 비트마스크 (저장 시 자동 계산, 씬 조합 필터용)
+    scene_flags: int = Field(default=0, index=True)
+
     # 서비스 관련
     hair_makeup_available: bool = Field(default=False)
 
+    # 패키지 가격 범위 (패키지 변경 시 갱신, 가격 필터/정렬용)
+    min_package_price: int | None = Field(default=None, index=True)
+    max_package_price: int | None = Field(default=None)
+
     # 시스템 필드
     is_deleted: bool = Field(default=False)
     created_datetime: datetime = Field(
@@ -48,3 +69,73 @@ class ProductStudio(SQLModel, table=True):
     studio_packages: list["ProductStudioPackage"] = Relationship(
         back_populates="product_studio"
     )
+
+
+# 가격 내림차순 정렬(NULLS LAST)용 인덱스, SQLite 는 인덱스의 NULLS LAST 를 지원하지 않음
+Index(
+    "ix_product_studios_max_package_price_desc",
+    ProductStudio.max_package_price.desc().nulls_last(),
+).ddl_if(dialect="postgresql")
+
+
+@event.listens_for(ProductStudio, "before_insert")
+@event.listens_for(ProductStudio, "before_update")
+def _sync_scene_flags(_mapper, _connection, target: ProductStudio) -> None:
+    """has_*_scene 변경 시 scene_flags 컬럼 동기화"""
+    target.scene_flags = pack_scene_flags(
+        {column: getattr(target, column) for column in SCENE_COLUMNS.values()}
+    )
+
+
+def package_price():
+    """패키지 판매가 SQL 식 (utils.studio_packages.selling_price 와 같은 규칙)"""
+    return case(
+        (ProductStudioPackage.discount_price > 0, ProductStudioPackage.discount_price),
+        else_=ProductStudioPackage.price,
+    )
+
+
+def package_price_envelope_values() -> dict:
+    """삭제되지 않은 패키지 기준 스튜디오 최소/최대 패키지 가격 (상관된 서브쿼리)"""
+    active_package = and_(
+        ProductStudioPackage.product_studio_id == ProductStudio.id,
+        ProductStudioPackage.is_deleted == False,
+    )
+    return {
+        "min_package_price": select(func.min(package_price()))
+        .where(active_package)
+        .scalar_subquery(),
+        "max_package_price": select(func.max(package_price()))
+        .where(active_package)
+        .scalar_subquery(),
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_package_price_envelopes(session: Session, _flush_context) -> None:
+    """패키지가 추가/수정/삭제되면 같은 flush 안에서 해당 스튜디오 가격 범위 갱신"""
+    studio_ids = {
+        obj.product_studio_id
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, ProductStudioPackage) and obj.product_studio_id is not None
+    }
+    if not studio_ids:
+        return
+
+    result = session.connection().execute(
+        update(ProductStudio)
+        .where(ProductStudio.id.in_(studio_ids))
+        .values(**package_price_envelope_values())
+        .returning(
+            ProductStudio.id,
+            ProductStudio.min_package_price,
+            ProductStudio.max_package_price,
+        )
+    )
+
+    # 세션에 로드된 스튜디오 객체도 DB 값과 맞춤 (추가 flush 대상이 되지 않도록 committed 값으로)
+    for studio_id, min_price, max_price in result:
+        studio = session.identity_map.get(identity_key(ProductStudio, studio_id))
+        if studio is not None:
+            attributes.set_committed_value(studio, "min_package_price", min_price)
+            attributes.set_committed_value(studio, "max_package_price", max_price)
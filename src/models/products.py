@@ -2,9 +2,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 import sqlmodel
-from sqlalchemy import Text
+from sqlalchemy import Column, Index, Text, event
 from sqlmodel import Field, Relationship, SQLModel
 
+from utils.geo import geohash_or_none
+from utils.search_text import SEARCH_TEXT_COLUMNS, build_search_text
 from utils.utils import utc_now
 
 if TYPE_CHECKING:
@@ -20,9 +22,26 @@ if TYPE_CHECKING:
 
 class Product(SQLModel, table=True):
     __tablename__ = "products"
+    __table_args__ = (
+        # geohash prefix(LIKE 'abc%') 검색을 위한 pattern_ops 인덱스
+        Index(
+            "ix_products_geohash",
+            "geohash",
+            postgresql_ops={"geohash": "varchar_pattern_ops"},
+        ),
+        # 카테고리 통합 검색(LIKE '%검색어%')을 위한 trigram GIN 인덱스
+        Index(
+            "ix_products_search_text",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     product_category_id: int = Field(foreign_key="product_categories.id")
+    # 수집 원본의 안정 키 (웨딩홀: banquet_code), 카탈로그 증분 동기화 기준
+    source_code: str | None = Field(max_length=50, default=None, index=True)
     name: str = Field(max_length=100)
     description: str = Field(Text)
     hashtag: str | None = Field(max_length=100, default=None)
@@ -47,6 +66,10 @@ class Product(SQLModel, table=True):
     address: str = Field(max_length=250)
     lat: float = Field(default=0.0)
     lng: float = Field(default=0.0)
+    # lat/lng 로부터 자동 계산 (근처 웨딩홀 검색용 공간 인덱스)
+    geohash: str | None = Field(max_length=12, default=None)
+    # 이름/주소/해시태그 등으로 자동 계산 (카테고리 통합 검색용)
+    search_text: str | None = Field(default=None, sa_column=Column(Text))
 
     # subway
     subway_line: str | None = Field(max_length=30, default=None)
@@ -88,3 +111,19 @@ class Product(SQLModel, table=True):
     # studio_detail: Optional["StudioDetail"] = Relationship(back_populates="product")
     # dress_detail: Optional["DressDetail"] = Relationship(back_populates="product")
     # makeup_detail: Optional["MakeupDetail"] = Relationship(back_populates="product")
+
+
+@event.listens_for(Product, "before_insert")
+@event.listens_for(Product, "before_update")
+def _sync_geohash(_mapper, _connection, target: Product) -> None:
+    """lat/lng 변경 시 geohash 컬럼 동기화"""
+    target.geohash = geohash_or_none(target.lat, target.lng)
+
+
+@event.listens_for(Product, "before_insert")
+@event.listens_for(Product, "before_update")
+def _sync_search_text(_mapper, _connection, target: Product) -> None:
+    """검색 대상 컬럼 변경 시 search_text 컬럼 동기화"""
+    target.search_text = build_search_text(
+        *(getattr(target, column) for column in SEARCH_TEXT_COLUMNS)
+    )
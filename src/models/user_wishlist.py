@@ -2,7 +2,7 @@ from datetime import datetime
 from uuid import UUID
 
 import sqlmodel
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship
 
 from models.products import Product
@@ -26,5 +26,15 @@ class UserWishlist(SQLModel, table=True):
     product: Product = Relationship(back_populates="wishlists")
 
     __table_args__ = (
-        UniqueConstraint("user_id", "product_id", name="unique_user_product"),
+        # 삭제되지 않은 위시리스트만 유일 (삭제 후 다시 담기 가능, 추가 시 ON CONFLICT 대상)
+        Index(
+            "unique_user_product",
+            "user_id",
+            "product_id",
+            unique=True,
+            postgresql_where=text("NOT is_deleted"),
+            sqlite_where=text("NOT is_deleted"),
+        ),
+        # 내 위시리스트 커서 페이지네이션 (최신순)
+        Index("ix_user_wishlists_user_id_id", "user_id", "id"),
     )
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from pydantic import TypeAdapter
 from sqlmodel import SQLModel, Field
 
 
@@ -41,3 +42,8 @@ class NewsItemRead(SQLModel):
 
     # Relationship
     news_category: NewsCategoryRead | None = None
+
+
+# 목록 응답을 한 번의 검증으로 처리하기 위한 bulk adapter
+NewsCategoryReadList = TypeAdapter(list[NewsCategoryRead])
+NewsItemReadList = TypeAdapter(list[NewsItemRead])
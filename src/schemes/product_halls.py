@@ -1,8 +1,8 @@
-from pydantic import computed_field
+from pydantic import NonNegativeFloat, TypeAdapter, computed_field, field_validator
 from sqlmodel import SQLModel, Field
 
-from models import ProductImage
 from schemes.products import ProductCreate
+from utils.score_percentiles import top_percent
 
 
 class ProductHallCreate(ProductCreate):
@@ -18,6 +18,17 @@ class ProductHallCreateInternal(ProductHallCreate):
     product_id: int
 
 
+class ImageVariantsRead(SQLModel):
+    """반응형 이미지 (파생 이미지가 아직 없으면 원본 URL 만 채워짐)"""
+
+    url: str
+    width: int | None = None
+    height: int | None = None
+    placeholder: str | None = None
+    # 가로 크기(px) -> WebP URL
+    derivatives: dict[str, str] | None = None
+
+
 class ProductHallListRead(SQLModel):
     id: int
     hashtags: list[str]
@@ -26,6 +37,51 @@ class ProductHallListRead(SQLModel):
     gugun: str
     address: str
     image_urls: list[str] | None
+    images: list[ImageVariantsRead] = []
+    composite_score: float | None = None  # 점수 평균 (배치 작업으로 계산)
+    composite_percentile: float | None = None  # 종합 점수 백분위 순위 (0~100)
+
+    @field_validator("hashtags", mode="before")
+    @classmethod
+    def split_hashtags(cls, value):
+        # DB 컬럼(쉼표 구분 문자열)을 그대로 받을 수 있도록 변환
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return value.split(",") if value else []
+        return value
+
+
+class ProductHallNearbyRead(ProductHallListRead):
+    distance_km: float
+
+
+class ProductHallAffordableRead(ProductHallListRead):
+    estimated_cost: int  # 조건에 맞는 베뉴 중 최저 예상 견적
+
+
+class ProductHallSimilarRead(ProductHallListRead):
+    similarity: float  # 코사인 유사도
+
+
+class HallRankingRequest(SQLModel):
+    weights: dict[str, NonNegativeFloat]  # 점수 타입별 가중치 (예: {"분위기": 2, "위치": 1})
+    limit: int = Field(default=10, ge=1, le=50)
+
+
+class ProductHallRankedRead(ProductHallListRead):
+    weighted_score: float  # 가중 평균 점수 (10점 만점)
+
+
+class ProductHallTopRead(ProductHallListRead):
+    score: float  # 점수 타입 점수 (score_type 미지정 시 종합 점수)
+    percentile: float | None = None  # 백분위 순위 (0~100)
+
+    @computed_field
+    @property
+    def top_percent(self) -> int | None:
+        """상위 N% 배지용"""
+        return top_percent(self.percentile)
 
 
 class ProductHallSearchRead(SQLModel):
@@ -63,6 +119,10 @@ class HallAIReviewRead(SQLModel):
 class ProductHallImage(SQLModel):
     image_type: str
     image_url: str
+    width: int | None = None
+    height: int | None = None
+    placeholder: str | None = None
+    derivatives: dict[str, str] | None = None
 
 
 class HallVenueRead(SQLModel):
@@ -94,15 +154,8 @@ class HallVenueRead(SQLModel):
     additional_info: str
     special_notes: str
 
-    # images 필드는 숨김
-    images: list["ProductImage"] = Field(default=[], exclude=True)
-
-    @computed_field
-    @property
-    def image_urls(self) -> list[str]:
-        return [img.image_url for img in self.images] if self.images else []
-
     amenities_info: HallVenueAmenitiesRead = None
+    image_urls: list[str] = []  # 베뉴 전용 이미지 (미리 계산된 값)
 
 
 class HallScoreRead(SQLModel):
@@ -128,6 +181,13 @@ class HallScoreComparison(SQLModel):
     hall_score: float | None = None
     average: float
     difference: float  # 평균 대비 차이 (양수면 평균 이상, 음수면 평균 이하)
+    percentile: float | None = None  # 판매중 웨딩홀 중 백분위 순위 (0~100)
+
+    @computed_field
+    @property
+    def top_percent(self) -> int | None:
+        """상위 N% 배지용 (예: 9 → 상위 9%)"""
+        return top_percent(self.percentile)
 
 
 # 전체 점수 요약
@@ -135,6 +195,7 @@ class HallScoreSummary(SQLModel):
     """웨딩홀 점수 요약"""
 
     overall_score: float | None = 0  # 전체 평균 점수
+    overall_percentile: float | None = None  # 종합 점수 백분위 순위 (0~100)
     overall_average: float  # 전체 평균
     score_comparisons: list[HallScoreComparison]  # 카테고리별 점수 비교
 
@@ -171,3 +232,13 @@ class ProductHallRead(SQLModel):
     ai_score_summary: HallScoreSummary
 
     blogs: list[HallBlogRead] = []
+
+
+# 목록 응답을 한 번의 검증으로 처리하기 위한 bulk adapter
+ProductHallListReadList = TypeAdapter(list[ProductHallListRead])
+ProductHallSearchReadList = TypeAdapter(list[ProductHallSearchRead])
+ProductHallNearbyReadList = TypeAdapter(list[ProductHallNearbyRead])
+ProductHallAffordableReadList = TypeAdapter(list[ProductHallAffordableRead])
+ProductHallRankedReadList = TypeAdapter(list[ProductHallRankedRead])
+ProductHallSimilarReadList = TypeAdapter(list[ProductHallSimilarRead])
+ProductHallTopReadList = TypeAdapter(list[ProductHallTopRead])
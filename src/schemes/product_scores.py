@@ -0,0 +1,13 @@
+from sqlmodel import SQLModel
+
+
+class ScoreImportError(SQLModel):
+    line: int  # 입력 행 번호 (JSON 은 항목 순서, CSV 는 헤더 제외 행 순서, 1부터)
+    reason: str
+
+
+class ScoreImportResult(SQLModel):
+    received: int
+    imported: int  # 업서트된 (상품, 점수 타입) 수 (중복 행은 마지막 값으로 합쳐짐)
+    rejected: int
+    errors: list[ScoreImportError]  # 최대 MAX_REPORTED_ERRORS 개
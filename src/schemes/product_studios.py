@@ -0,0 +1,56 @@
+from pydantic import TypeAdapter, field_validator
+from sqlmodel import SQLModel
+
+from utils.studio_scenes import unpack_scene_flags
+
+
+class ProductStudioListRead(SQLModel):
+    id: int
+    name: str
+    sido: str
+    gugun: str
+    address: str
+    thumbnail_url: str | None
+    scenes: list[str]
+    hair_makeup_available: bool
+    min_package_price: int | None
+    max_package_price: int | None
+
+    @field_validator("scenes", mode="before")
+    @classmethod
+    def unpack_scenes(cls, value):
+        # DB 컬럼(scene_flags 비트마스크)을 그대로 받을 수 있도록 변환
+        if isinstance(value, int):
+            return unpack_scene_flags(value)
+        return value
+
+
+class StudioPackageRead(SQLModel):
+    id: int
+    name: str
+    description: str | None
+    original_price: int | None
+    price: int
+    discount_price: int | None
+    album_count: int
+    album_page_count: int
+    frame_count: int
+    include_original_data: bool
+    include_edited_data: bool
+    outfit_count: int
+    dress_count: int
+    casual_count: int
+    shooting_duration: int  # 분 단위
+    additional_info: str | None
+
+
+class ProductStudioRead(ProductStudioListRead):
+    description: str
+    tel: str
+    holiday: str | None
+    business_hours: str | None
+    packages: list[StudioPackageRead]
+
+
+# 목록 응답을 한 번의 검증으로 처리하기 위한 bulk adapter
+ProductStudioListReadList = TypeAdapter(list[ProductStudioListRead])
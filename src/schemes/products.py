@@ -118,3 +118,28 @@ class ProductResponse(SQLModel):
 
     # Relationships
     category: ProductCategoryResponse | None = None
+
+
+class ProductSearchRead(SQLModel):
+    id: int
+    category_id: int
+    category_type: str
+    name: str
+    sido: str
+    gugun: str
+    address: str
+    thumbnail_url: str
+
+
+class ProductSearchFacet(SQLModel):
+    category_id: int
+    name: str
+    display_name: str
+    type: str
+    count: int
+
+
+class ProductSearchResponse(SQLModel):
+    total: int  # 카테고리 필터가 적용된 전체 결과 수
+    facets: list[ProductSearchFacet]  # 카테고리 필터와 관계없이 카테고리별 결과 수
+    items: list[ProductSearchRead]
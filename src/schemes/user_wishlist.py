@@ -2,10 +2,13 @@ from uuid import UUID
 from datetime import datetime
 
 from pydantic import BaseModel
-from sqlmodel import SQLModel
+from sqlmodel import Field, SQLModel
 
 from schemes.products import ProductResponse
 
+# 위시리스트 포함 여부 한 번에 확인할 수 있는 최대 상품 수
+WISHLIST_CONTAINS_LIMIT = 100
+
 
 class WishlistCreate(SQLModel):
     product_id: int
@@ -38,3 +41,32 @@ class WishlistDetailResponse(WishlistResponse):
 class WishlistListResponse(BaseModel):
     total: int
     items: list[WishlistDetailResponse]
+
+
+class WishlistItemRead(SQLModel):
+    id: int
+    product_id: int
+    memo: str | None = None
+    created_datetime: datetime
+    # 상품 카드
+    category_id: int
+    category_type: str
+    name: str
+    sido: str
+    gugun: str
+    address: str
+    available: bool
+    image_url: str | None = None  # 첫 번째 상품 이미지 (없으면 썸네일)
+
+
+class WishlistPage(SQLModel):
+    items: list[WishlistItemRead]
+    next_cursor: int | None = None  # 다음 페이지 요청 시 cursor 값 (마지막 페이지면 null)
+
+
+class WishlistContainsRequest(SQLModel):
+    product_ids: list[int] = Field(max_length=WISHLIST_CONTAINS_LIMIT)
+
+
+class WishlistContainsResponse(SQLModel):
+    product_ids: list[int]  # 요청한 상품 중 위시리스트에 담긴 상품
@@ -0,0 +1,145 @@
+import io
+import json
+from collections.abc import Hashable
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import Connection, Table, insert
+
+from utils.utils import utc_now
+
+# 모든 모델이 가진 생성/수정 시각 컬럼 (sa_column 으로 정의되어 컬럼 기본값이 없음)
+TIMESTAMP_COLUMNS = ("created_datetime", "updated_datetime")
+
+
+def _copy_value(value: Any) -> str:
+    """COPY (FORMAT csv) 필드 값 (NULL 은 따옴표 없는 빈 값, 나머지는 모두 따옴표)"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    elif isinstance(value, datetime | date):
+        value = value.isoformat()
+    elif isinstance(value, dict | list):
+        value = json.dumps(value, ensure_ascii=False)
+    else:
+        value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
+class BulkWriter:
+    """
+    스크립트용 대량 INSERT 버퍼
+
+    add() 로 row 를 모았다가 batch_size 마다(또는 flush/with 블록 종료 시) 한 번에 저장한다.
+
+    - returning=True: 다중 row INSERT ... RETURNING id 로 저장하고, add() 에 넘긴 key 로
+      생성된 id 를 ids 에서 찾을 수 있다. (SQLAlchemy insertmanyvalues, 입력 순서 보장)
+    - returning=False: PostgreSQL 은 COPY FROM STDIN, 그 외(SQLite 등)는 executemany
+
+    Core 수준 INSERT 이므로 ORM 이벤트(before_insert, after_flush 등)는 실행되지 않는다.
+    컬럼 기본값과 생성/수정 시각은 빠진 row 에 채워 넣는다.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        table: Table | type,
+        *,
+        returning: bool = False,
+        batch_size: int = 1000,
+    ):
+        self.connection = connection
+        self.table: Table = getattr(table, "__table__", table)
+        self.returning = returning
+        self.batch_size = batch_size
+        self.ids: dict[Hashable, int] = {}
+        self.written = 0
+
+        self._rows: list[dict] = []
+        self._keys: list[Hashable] = []
+        self._defaults = self._column_defaults()
+
+    def _column_defaults(self) -> dict[str, Any]:
+        defaults = {}
+        for column in self.table.columns:
+            if column.primary_key:
+                continue
+            default = column.default
+            if default is not None and default.is_scalar:
+                defaults[column.name] = lambda value=default.arg: value
+            elif default is not None and default.is_callable:
+                # SQLAlchemy 는 인자 없는 함수를 context 를 받는 함수로 감싸 둔다
+                defaults[column.name] = lambda func=default.arg: func(None)
+            elif column.name in TIMESTAMP_COLUMNS:
+                defaults[column.name] = utc_now
+        return defaults
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def add(self, row: dict, key: Hashable = None) -> None:
+        """row 추가 (returning=True 면 key 로 생성된 id 를 조회)"""
+        for name, default in self._defaults.items():
+            if name not in row:
+                row[name] = default()
+        self._rows.append(row)
+        self._keys.append(key)
+
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼의 row 저장"""
+        if not self._rows:
+            return
+
+        rows, keys = self._rows, self._keys
+        self._rows, self._keys = [], []
+
+        # 모든 row 가 같은 컬럼 집합을 갖도록 맞춤 (없는 값은 NULL)
+        columns = [
+            column.name
+            for column in self.table.columns
+            if any(column.name in row for row in rows)
+        ]
+        rows = [{name: row.get(name) for name in columns} for row in rows]
+
+        if self.returning:
+            result = self.connection.execute(
+                insert(self.table).returning(
+                    self.table.c.id, sort_by_parameter_order=True
+                ),
+                rows,
+            )
+            for key, (row_id,) in zip(keys, result, strict=True):
+                if key is not None:
+                    self.ids[key] = row_id
+        elif self.connection.dialect.name == "postgresql":
+            self._copy(columns, rows)
+        else:
+            self.connection.execute(insert(self.table), rows)
+
+        self.written += len(rows)
+
+    def _copy(self, columns: list[str], rows: list[dict]) -> None:
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(_copy_value(row[name]) for name in columns))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        column_list = ", ".join(f'"{name}"' for name in columns)
+        # 같은 트랜잭션을 쓰도록 SQLAlchemy 연결의 DBAPI 커서로 실행
+        cursor = self.connection.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f'COPY "{self.table.name}" ({column_list}) FROM STDIN WITH (FORMAT csv)',
+                buffer,
+            )
+        finally:
+            cursor.close()
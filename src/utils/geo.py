@@ -0,0 +1,142 @@
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
+# 저장용 geohash 정밀도 (약 38m x 19m)
+GEOHASH_PRECISION = 8
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# 정밀도별 셀 크기 (위도 높이 km, 적도 기준 경도 폭 km)
+_CELL_SIZE_KM = {
+    1: (4992.6, 5009.4),
+    2: (624.1, 1252.3),
+    3: (156.0, 156.5),
+    4: (19.5, 39.1),
+    5: (4.89, 4.89),
+    6: (0.61, 1.22),
+    7: (0.153, 0.153),
+    8: (0.019, 0.038),
+}
+
+
+def has_coordinates(lat: float | None, lng: float | None) -> bool:
+    """좌표가 설정되어 있는지 확인 (기본값 0.0, 0.0 은 미설정으로 간주)"""
+    if lat is None or lng is None:
+        return False
+    return not (lat == 0.0 and lng == 0.0)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 대원 거리 (km)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+
+def bounding_box(
+    lat: float, lng: float, radius_km: float
+) -> tuple[float, float, float, float]:
+    """
+    중심 좌표와 반경을 감싸는 위경도 사각형
+    (min_lat, max_lat, min_lng, max_lng)
+    """
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    d_lng = min(180.0, math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)))
+
+    return (
+        max(-90.0, lat - d_lat),
+        min(90.0, lat + d_lat),
+        max(-180.0, lng - d_lng),
+        min(180.0, lng + d_lng),
+    )
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """위경도를 geohash 문자열로 인코딩"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_range[0] = mid
+            else:
+                bits <<= 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def geohash_or_none(lat: float | None, lng: float | None) -> str | None:
+    """좌표가 있으면 geohash, 없으면 None"""
+    if not has_coordinates(lat, lng):
+        return None
+    return encode_geohash(lat, lng)
+
+
+def _search_precision(radius_km: float, lat: float) -> int:
+    """반경보다 큰 셀 중 가장 정밀한 geohash 정밀도 선택"""
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height_km, width_km = _CELL_SIZE_KM[precision]
+        if height_km >= radius_km and width_km * cos_lat >= radius_km:
+            return precision
+    return 1
+
+
+def geohash_prefixes(lat: float, lng: float, radius_km: float) -> list[str]:
+    """
+    반경을 감싸는 사각형을 덮는 geohash prefix 목록
+
+    셀 크기가 반경 이상인 정밀도를 사용하므로 보통 4~9개의 prefix 가 나온다.
+    """
+    precision = _search_precision(radius_km, lat)
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+
+    # 셀 크기보다 촘촘한 간격으로 사각형을 훑으며 셀을 수집
+    lat_step = 180.0 / (2 ** ((5 * precision) // 2)) / 2
+    lng_step = 360.0 / (2 ** ((5 * precision + 1) // 2)) / 2
+
+    prefixes = set()
+    cur_lat = min_lat
+    while True:
+        cur_lng = min_lng
+        while True:
+            prefixes.add(encode_geohash(cur_lat, cur_lng, precision))
+            if cur_lng >= max_lng:
+                break
+            cur_lng = min(cur_lng + lng_step, max_lng)
+        if cur_lat >= max_lat:
+            break
+        cur_lat = min(cur_lat + lat_step, max_lat)
+
+    return sorted(prefixes)
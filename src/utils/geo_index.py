@@ -0,0 +1,152 @@
+import math
+
+import numpy as np
+
+from utils.geo import EARTH_RADIUS_KM, bounding_box
+
+# 격자 셀 크기 (도 단위, 위도 기준 약 1.1km)
+DEFAULT_CELL_DEG = 0.01
+
+
+def haversine_km_array(
+    lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray
+) -> np.ndarray:
+    """기준점과 여러 좌표 사이 haversine 거리 (벡터 연산)"""
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(lngs - lng)
+
+    a = (
+        np.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GeoGridIndex:
+    """
+    좌표를 균일 격자 셀 순서로 정렬해 둔 배열 기반 공간 인덱스
+
+    점들은 (행 * 열 수 + 열) 셀 키로 정렬되어 있으므로 한 행에서 연속된 셀들은
+    배열에서도 연속 구간이 된다. 반경 검색은 행마다 searchsorted 한 번으로
+    후보 구간을 찾고, 후보에 대해서만 haversine 거리를 계산한다.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        lats: np.ndarray,
+        lngs: np.ndarray,
+        cell_deg: float = DEFAULT_CELL_DEG,
+    ):
+        ids = np.asarray(ids, dtype=np.int64)
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+
+        self.cell_deg = cell_deg
+        self.size = len(ids)
+
+        if self.size == 0:
+            self.lat0 = self.lng0 = 0.0
+            self.n_rows = self.n_cols = 0
+            self.ids = ids
+            self.lats = lats
+            self.lngs = lngs
+            self.keys = np.empty(0, dtype=np.int64)
+            return
+
+        self.lat0 = float(lats.min())
+        self.lng0 = float(lngs.min())
+        rows = self._rows(lats)
+        cols = self._cols(lngs)
+        self.n_rows = int(rows.max()) + 1
+        self.n_cols = int(cols.max()) + 1
+
+        keys = rows * self.n_cols + cols
+        order = np.argsort(keys, kind="stable")
+
+        self.ids = ids[order]
+        self.lats = lats[order]
+        self.lngs = lngs[order]
+        self.keys = keys[order]
+
+    def _rows(self, lats: np.ndarray) -> np.ndarray:
+        return np.floor((lats - self.lat0) / self.cell_deg).astype(np.int64)
+
+    def _cols(self, lngs: np.ndarray) -> np.ndarray:
+        return np.floor((lngs - self.lng0) / self.cell_deg).astype(np.int64)
+
+    def _candidates(self, lat: float, lng: float, radius_km: float) -> np.ndarray:
+        """반경을 감싸는 사각형에 걸친 셀들의 점 위치(index) 목록"""
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+
+        row_start = max(0, math.floor((min_lat - self.lat0) / self.cell_deg))
+        row_end = min(self.n_rows - 1, math.floor((max_lat - self.lat0) / self.cell_deg))
+        col_start = max(0, math.floor((min_lng - self.lng0) / self.cell_deg))
+        col_end = min(self.n_cols - 1, math.floor((max_lng - self.lng0) / self.cell_deg))
+
+        if row_start > row_end or col_start > col_end:
+            return np.empty(0, dtype=np.int64)
+
+        rows = np.arange(row_start, row_end + 1, dtype=np.int64)
+        starts = np.searchsorted(self.keys, rows * self.n_cols + col_start, "left")
+        ends = np.searchsorted(self.keys, rows * self.n_cols + col_end, "right")
+
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # 각 구간 [start, end) 를 하나의 index 배열로 펼침
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return offsets + np.arange(total, dtype=np.int64)
+
+    def within(
+        self, lat: float, lng: float, radius_km: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """반경 내 (id 배열, 거리 배열) 을 거리순으로 반환"""
+        if self.size == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        candidates = self._candidates(lat, lng, radius_km)
+        distances = haversine_km_array(
+            lat, lng, self.lats[candidates], self.lngs[candidates]
+        )
+        mask = distances <= radius_km
+        candidates, distances = candidates[mask], distances[mask]
+
+        order = np.lexsort((self.ids[candidates], distances))
+        return self.ids[candidates][order], distances[order]
+
+    def nearest(
+        self, lat: float, lng: float, k: int, max_radius_km: float | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        가까운 k개의 (id 배열, 거리 배열) 을 거리순으로 반환
+
+        셀 한 칸 크기에서 시작해 반경을 두 배씩 넓히며, 반경 안에 k개 이상이
+        들어오면 그 안에 진짜 최근접 k개가 모두 포함된다.
+        """
+        if self.size == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        radius_km = self.cell_deg * math.pi / 180 * EARTH_RADIUS_KM
+        # 전체 좌표를 덮는 반경 (이 이상 넓혀도 결과가 늘지 않음)
+        extent_km = (
+            (self.n_rows + self.n_cols) * radius_km
+            + math.hypot(lat - self.lat0, lng - self.lng0) * 111.32
+        )
+
+        while True:
+            if max_radius_km is not None:
+                radius_km = min(radius_km, max_radius_km)
+
+            ids, distances = self.within(lat, lng, radius_km)
+            exhausted = radius_km >= extent_km or (
+                max_radius_km is not None and radius_km >= max_radius_km
+            )
+            if len(ids) >= k or exhausted:
+                return ids[:k], distances[:k]
+
+            radius_km *= 2
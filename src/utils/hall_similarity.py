@@ -0,0 +1,106 @@
+import math
+
+import numpy as np
+
+# 특성 블록별 가중치 (각 블록은 행 단위로 정규화된 뒤 곱해짐)
+FEATURE_WEIGHTS = {
+    "score": 1.0,
+    "region": 1.0,
+    "price": 1.0,
+    "venue": 0.8,
+}
+
+
+def _normalize_rows(block: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    return np.divide(block, norms, out=np.zeros_like(block), where=norms > 0)
+
+
+def _standardize_columns(block: np.ndarray) -> np.ndarray:
+    """열별 z-score (결측치는 열 평균인 0 으로)"""
+    mean = np.nanmean(block, axis=0, keepdims=True) if len(block) else 0
+    std = np.nanstd(block, axis=0, keepdims=True) if len(block) else 1
+    std = np.where(std > 0, std, 1.0)
+    return np.nan_to_num((block - np.nan_to_num(mean)) / std)
+
+
+def one_hot(values: list[str | None]) -> np.ndarray:
+    """범주 값 목록을 one-hot 행렬로 변환 (None 은 모두 0)"""
+    categories = sorted({value for value in values if value})
+    columns = {category: i for i, category in enumerate(categories)}
+    block = np.zeros((len(values), len(categories)))
+    for row, value in enumerate(values):
+        if value:
+            block[row, columns[value]] = 1.0
+    return block
+
+
+def multi_hot(token_sets: list[set[str]]) -> np.ndarray:
+    """토큰 집합 목록을 multi-hot 행렬로 변환"""
+    tokens = sorted(set().union(*token_sets)) if token_sets else []
+    columns = {token: i for i, token in enumerate(tokens)}
+    block = np.zeros((len(token_sets), len(tokens)))
+    for row, token_set in enumerate(token_sets):
+        for token in token_set:
+            block[row, columns[token]] = 1.0
+    return block
+
+
+def build_feature_matrix(
+    *,
+    scores: np.ndarray,
+    sidos: list[str | None],
+    guguns: list[str | None],
+    prices: np.ndarray,
+    venue_tokens: list[set[str]],
+) -> np.ndarray:
+    """
+    웨딩홀 특성 행렬 구성
+
+    - scores: 웨딩홀 x 점수 타입 (결측 NaN)
+    - sidos / guguns: 지역 (구군은 시도보다 두 배 가중)
+    - prices: 웨딩홀 x (최소 견적, 최대 견적) (결측 NaN, 로그 스케일로 비교)
+    - venue_tokens: 베뉴의 홀 타입/스타일/식사 메뉴 토큰 집합
+    """
+    blocks = {
+        "score": _standardize_columns(scores),
+        "region": np.hstack([one_hot(sidos), 2 * one_hot(guguns)]),
+        "price": _standardize_columns(np.log1p(prices)),
+        "venue": multi_hot(venue_tokens),
+    }
+    return np.hstack(
+        [FEATURE_WEIGHTS[name] * _normalize_rows(block) for name, block in blocks.items()]
+    )
+
+
+def top_k_cosine(
+    features: np.ndarray, k: int, batch_size: int = 1024
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    모든 행에 대해 자기 자신을 제외한 코사인 유사도 상위 k개
+    (행 index 배열, 유사도 배열) 을 유사도 내림차순으로 반환, 크기는 (n, k)
+
+    전체 n x n 유사도 행렬을 만들지 않도록 batch_size 행씩 계산한다.
+    """
+    n = len(features)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int64), np.empty((n, 0))
+
+    unit = _normalize_rows(features.astype(np.float32))
+    neighbours = np.empty((n, k), dtype=np.int64)
+    similarities = np.empty((n, k), dtype=np.float32)
+
+    for start in range(0, n, batch_size):
+        stop = min(start + batch_size, n)
+        block = unit[start:stop] @ unit.T
+        block[np.arange(stop - start), np.arange(start, stop)] = -math.inf
+
+        candidates = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(block, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+
+        neighbours[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        similarities[start:stop] = np.take_along_axis(candidate_scores, order, axis=1)
+
+    return neighbours, similarities
@@ -0,0 +1,86 @@
+import base64
+import io
+from dataclasses import dataclass, field
+
+from PIL import Image
+
+# 생성할 파생 이미지 가로 크기 (px)
+DERIVATIVE_WIDTHS = (320, 640, 1280)
+
+# 블러 placeholder(LQIP) 가로 크기 (px)
+PLACEHOLDER_WIDTH = 16
+
+
+@dataclass
+class ImageDerivatives:
+    """원본 이미지 크기, placeholder, 가로 크기별 WebP 데이터"""
+
+    width: int
+    height: int
+    placeholder: str
+    variants: dict[int, bytes] = field(default_factory=dict)
+
+
+def to_rgb(img: Image.Image) -> Image.Image:
+    """투명 배경은 흰색으로 채워 RGB 로 변환 (WebP 호환성을 위해)"""
+    if img.mode in ("RGBA", "LA", "P"):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        if img.mode == "P":
+            img = img.convert("RGBA")
+        if img.mode in ("RGBA", "LA"):
+            background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def encode_webp(img: Image.Image, quality: int = 85) -> bytes:
+    output = io.BytesIO()
+    img.save(output, format="WEBP", quality=quality, optimize=True)
+    return output.getvalue()
+
+
+def convert_to_webp(image_data: bytes, quality: int = 85) -> bytes:
+    """이미지를 WebP로 변환"""
+    with Image.open(io.BytesIO(image_data)) as img:
+        return encode_webp(to_rgb(img), quality=quality)
+
+
+def _resize_to_width(img: Image.Image, width: int) -> Image.Image:
+    height = max(1, round(img.height * width / img.width))
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def build_derivatives(
+    image_data: bytes,
+    widths: tuple[int, ...] = DERIVATIVE_WIDTHS,
+    quality: int = 80,
+) -> ImageDerivatives:
+    """
+    원본 이미지로 가로 크기별 WebP 와 placeholder 생성 (CPU 작업, 프로세스 풀에서 실행)
+
+    원본보다 큰 크기는 만들지 않으며, 원본이 가장 작은 크기보다 작으면
+    원본 크기 하나만 만든다. placeholder 는 data URI 로 인코딩한 아주 작은 WebP 이다.
+    """
+    with Image.open(io.BytesIO(image_data)) as opened:
+        img = to_rgb(opened)
+        img.load()
+
+    target_widths = [width for width in widths if width < img.width] or [img.width]
+    variants = {
+        width: encode_webp(
+            img if width == img.width else _resize_to_width(img, width), quality
+        )
+        for width in target_widths
+    }
+
+    tiny = _resize_to_width(img, min(PLACEHOLDER_WIDTH, img.width))
+    placeholder = base64.b64encode(encode_webp(tiny, quality=30)).decode("ascii")
+
+    return ImageDerivatives(
+        width=img.width,
+        height=img.height,
+        placeholder=f"data:image/webp;base64,{placeholder}",
+        variants=variants,
+    )
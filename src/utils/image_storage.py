@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+# 파생 이미지는 내용이 바뀌면 키가 바뀌므로 장기 캐시
+IMMUTABLE_CACHE_CONTROL = "max-age=31536000"
+
+
+def build_image_key(
+    image_id: int,
+    product_id: int,
+    product_venue_id: int | None = None,
+    image_type: str | None = None,
+    suffix: str = "",
+) -> str:
+    """
+    이미지 저장 키 생성
+    경로 구조: products/{product_id}/{venue_{id}|common}/{image_type}_{image_id}{suffix}.webp
+    """
+    if image_type:
+        # 이미지 타입을 안전한 파일명으로 변환
+        safe_type = "".join(c if c.isalnum() or c in "-_" else "_" for c in image_type)
+        filename = f"{safe_type}_{image_id}{suffix}.webp"
+    else:
+        filename = f"{image_id}{suffix}.webp"
+
+    folder = f"venue_{product_venue_id}" if product_venue_id else "common"
+    return f"products/{product_id}/{folder}/{filename}"
+
+
+class ImageStorage(ABC):
+    """이미지 저장소 인터페이스 (키 기준 저장 후 공개 URL 반환)"""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    def save(self, key: str, data: bytes, content_type: str = "image/webp") -> str: ...
+
+    @abstractmethod
+    def url(self, key: str) -> str: ...
+
+
+class LocalImageStorage(ImageStorage):
+    """로컬 파일시스템 저장소 (개발/테스트용)"""
+
+    def __init__(self, root: str | Path, base_url: str = "/statics/images"):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def exists(self, key: str) -> bool:
+        return (self.root / key).exists()
+
+    def save(self, key: str, data: bytes, content_type: str = "image/webp") -> str:
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return self.url(key)
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+class S3ImageStorage(ImageStorage):
+    """S3 저장소 (cdn_domain 이 있으면 CloudFront URL 반환)"""
+
+    def __init__(self, bucket: str, region: str, cdn_domain: str | None = None):
+        import boto3
+
+        self.bucket = bucket
+        self.region = region
+        self.cdn_domain = cdn_domain
+        self.client = boto3.client("s3", region_name=region)
+
+    def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError:
+            return False
+
+    def save(self, key: str, data: bytes, content_type: str = "image/webp") -> str:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            CacheControl=IMMUTABLE_CACHE_CONTROL,
+        )
+        return self.url(key)
+
+    def url(self, key: str) -> str:
+        if self.cdn_domain:
+            return f"https://{self.cdn_domain}/{key}"
+        return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
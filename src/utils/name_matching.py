@@ -0,0 +1,107 @@
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+
+# 이름 비교 시 무시할 문자 (공백, 문장부호 등 한글/영문/숫자 외)
+_IGNORED_CHARS = re.compile(r"[^0-9a-z가-힣]")
+
+# 후보 점수 하한 (Dice 계수), 포함 관계 후보는 하한과 무관하게 포함
+MIN_SCORE = 0.5
+
+# 1위와 점수 차이가 이 값 이하인 후보가 있으면 모호한 매칭으로 판단
+AMBIGUITY_MARGIN = 0.05
+
+
+def normalize_name(name: str) -> str:
+    """비교용 이름 정규화 (NFKC, 소문자, 공백/문장부호 제거)"""
+    return _IGNORED_CHARS.sub("", unicodedata.normalize("NFKC", name).lower())
+
+
+def char_ngrams(text: str, n: int = 2) -> set[str]:
+    """문자 n-gram 집합 (n 보다 짧으면 문자열 자체)"""
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class NameMatcher:
+    """
+    문자 n-gram 역색인 기반 이름 매칭
+
+    정규화한 이름이 정확히 같으면 바로 반환하고, 아니면 n-gram 을 공유하는
+    후보만 역색인으로 모아 Dice 계수로 순위를 매긴다. 전체 이름을 훑지 않으므로
+    이름 수가 늘어도 후보 수에 비례한 시간만 든다.
+    """
+
+    def __init__(self, names: Iterable[str], n: int = 2):
+        self.n = n
+        self.names: list[str] = []
+        self.normalized: list[str] = []
+        self.grams: list[set[str]] = []
+        self.exact: dict[str, str] = {}
+        self.index: dict[str, list[int]] = {}
+
+        # 입력 순서와 무관하게 결과가 같도록 정렬해서 색인
+        for name in sorted(set(names)):
+            normalized = normalize_name(name)
+            if not normalized:
+                continue
+            position = len(self.names)
+            grams = char_ngrams(normalized, n)
+
+            self.names.append(name)
+            self.normalized.append(normalized)
+            self.grams.append(grams)
+            self.exact.setdefault(normalized, name)
+            for gram in grams:
+                self.index.setdefault(gram, []).append(position)
+
+    def candidates(
+        self, query: str, min_score: float = MIN_SCORE
+    ) -> list[tuple[str, float]]:
+        """(이름, 점수) 후보 목록 (점수 내림차순, 같은 점수는 이름순)"""
+        normalized = normalize_name(query)
+        query_grams = char_ngrams(normalized, self.n)
+        if not query_grams:
+            return []
+
+        shared = Counter(
+            position for gram in query_grams for position in self.index.get(gram, ())
+        )
+
+        scored = []
+        for position, count in shared.items():
+            score = 2 * count / (len(query_grams) + len(self.grams[position]))
+            name = self.normalized[position]
+            contains = normalized in name or name in normalized
+            if score >= min_score or contains:
+                scored.append((self.names[position], round(score, 4)))
+
+        return sorted(scored, key=lambda item: (-item[1], item[0]))
+
+    def match(self, query: str) -> tuple[str | None, list[tuple[str, float]]]:
+        """
+        가장 유사한 이름 찾기
+
+        (이름, []) : 매칭 성공
+        (None, 후보들) : 1위와 점수가 비슷한 후보가 여러 개라 판단 보류
+        (None, []) : 후보 없음
+        """
+        exact = self.exact.get(normalize_name(query))
+        if exact is not None:
+            return exact, []
+
+        candidates = self.candidates(query)
+        if not candidates:
+            return None, []
+
+        best_score = candidates[0][1]
+        contenders = [
+            candidate
+            for candidate in candidates
+            if best_score - candidate[1] <= AMBIGUITY_MARGIN
+        ]
+        if len(contenders) > 1:
+            return None, contenders
+        return candidates[0][0], []
@@ -0,0 +1,150 @@
+import csv
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+# 점수 범위 (10점 만점)
+SCORE_MIN = 0.0
+SCORE_MAX = 10.0
+# 응답/로그에 포함할 최대 오류 수
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class ScoreBatch:
+    """(product_id, score_type, value) 열 배열로 보관하는 점수 묶음"""
+
+    product_ids: np.ndarray
+    score_types: np.ndarray
+    values: np.ndarray
+    # 입력 순서 기준 행 번호 (1부터, 오류 보고용)
+    line_numbers: np.ndarray | None = None
+
+    def __post_init__(self):
+        if self.line_numbers is None:
+            self.line_numbers = np.arange(1, len(self.product_ids) + 1)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def rows(self) -> list[dict]:
+        """INSERT 파라미터용 dict 목록"""
+        return [
+            {"product_id": product_id, "score_type": score_type, "value": value}
+            for product_id, score_type, value in zip(
+                self.product_ids.tolist(),
+                self.score_types.tolist(),
+                self.values.tolist(),
+                strict=True,
+            )
+        ]
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _to_str(value) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+def read_score_items(items: Iterable[Mapping]) -> ScoreBatch:
+    """
+    {"product_id", "score_type", "value"} 항목들을 점수 묶음으로 변환
+    값 변환만 하며, 변환할 수 없는 값은 검증에서 걸러지도록 -1 / "" / NaN 으로 둔다
+    """
+    product_ids, score_types, values = [], [], []
+    for item in items:
+        if not isinstance(item, Mapping):
+            item = {}
+        product_ids.append(_to_int(item.get("product_id")))
+        score_types.append(_to_str(item.get("score_type")))
+        values.append(_to_float(item.get("value")))
+
+    return ScoreBatch(
+        product_ids=np.asarray(product_ids, dtype=np.int64),
+        score_types=np.asarray(score_types, dtype=object),
+        values=np.asarray(values, dtype=np.float64),
+    )
+
+
+def read_score_csv(lines: Iterable[str]) -> ScoreBatch:
+    """product_id,score_type,value 헤더가 있는 CSV 줄들을 점수 묶음으로 변환"""
+    return read_score_items(csv.DictReader(lines))
+
+
+def validate_score_batch(
+    batch: ScoreBatch, *, known_product_ids: Iterable[int]
+) -> tuple[ScoreBatch, list[dict]]:
+    """
+    점수 묶음을 열 단위로 검증하여 (유효한 묶음, 오류 목록) 반환
+
+    - 존재하지 않는 상품, 빈 점수 타입, 숫자가 아니거나 범위를 벗어난 점수는 제외
+    - 같은 (상품, 점수 타입) 이 여러 번 있으면 마지막 값만 사용
+    """
+    if len(batch) == 0:
+        return batch, []
+
+    known = np.fromiter(known_product_ids, dtype=np.int64)
+    type_lengths = np.fromiter(
+        (len(score_type) for score_type in batch.score_types),
+        dtype=np.int64,
+        count=len(batch),
+    )
+
+    checks = (
+        (~np.isin(batch.product_ids, known), "unknown product_id"),
+        (type_lengths == 0, "missing score_type"),
+        (np.isnan(batch.values), "invalid value"),
+        (
+            (batch.values < SCORE_MIN) | (batch.values > SCORE_MAX),
+            f"value out of range [{SCORE_MIN}, {SCORE_MAX}]",
+        ),
+    )
+
+    invalid = np.zeros(len(batch), dtype=bool)
+    errors = []
+    for mask, reason in checks:
+        mask &= ~invalid
+        invalid |= mask
+        errors.extend(
+            {"line": int(line), "reason": reason}
+            for line in batch.line_numbers[mask]
+        )
+
+    # 중복 키는 마지막 행만 남김 (뒤집어서 첫 등장 위치를 찾음)
+    valid_index = np.flatnonzero(~invalid)
+    keys = np.array(
+        [
+            f"{product_id}\x00{score_type}"
+            for product_id, score_type in zip(
+                batch.product_ids[valid_index].tolist(),
+                batch.score_types[valid_index].tolist(),
+                strict=True,
+            )
+        ],
+        dtype=object,
+    )
+    _, last = np.unique(keys[::-1], return_index=True)
+    keep = np.sort(valid_index[len(valid_index) - 1 - last])
+
+    errors.sort(key=lambda error: error["line"])
+    valid = ScoreBatch(
+        product_ids=batch.product_ids[keep],
+        score_types=batch.score_types[keep],
+        values=batch.values[keep],
+        line_numbers=batch.line_numbers[keep],
+    )
+    return valid, errors
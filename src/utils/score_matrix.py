@@ -0,0 +1,64 @@
+import numpy as np
+
+
+class ScoreMatrix:
+    """
+    웨딩홀 x 점수 타입 점수 행렬
+
+    없는 점수는 해당 타입의 평균으로 채워, 점수가 없는 항목이 순위에서
+    불리하거나 유리하지 않게 한다. 전체 카탈로그 순위는 행렬-벡터 곱 한 번과
+    argpartition 으로 계산한다.
+    """
+
+    def __init__(self, product_ids, score_types, values):
+        """(product_id, score_type, value) 세 배열로 행렬 구성"""
+        product_ids = np.asarray(product_ids, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+
+        self.ids, rows = np.unique(product_ids, return_inverse=True)
+        types, cols = np.unique(np.asarray(score_types, dtype=object), return_inverse=True)
+        self.score_types: list[str] = [str(score_type) for score_type in types]
+        self._columns = {
+            score_type: i for i, score_type in enumerate(self.score_types)
+        }
+
+        matrix = np.full((len(self.ids), len(self.score_types)), np.nan)
+        matrix[rows, cols] = values
+        if matrix.size:
+            column_means = np.nan_to_num(np.nanmean(matrix, axis=0, keepdims=True))
+            matrix = np.where(np.isnan(matrix), column_means, matrix)
+        self.matrix = matrix
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def weight_vector(self, weights: dict[str, float]) -> np.ndarray:
+        """점수 타입별 가중치를 열 순서의 정규화된 벡터로 변환"""
+        unknown = set(weights) - set(self._columns)
+        if unknown:
+            raise ValueError(f"Unknown score types: {', '.join(sorted(unknown))}")
+
+        vector = np.zeros(len(self.score_types))
+        for score_type, weight in weights.items():
+            vector[self._columns[score_type]] = weight
+
+        total = vector.sum()
+        if total <= 0:
+            raise ValueError("At least one weight must be positive")
+        return vector / total
+
+    def top_k(
+        self, weights: dict[str, float], k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """가중 평균 점수 상위 k개의 (id 배열, 점수 배열) 을 점수 내림차순으로 반환"""
+        vector = self.weight_vector(weights)
+        k = min(k, self.size)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        scores = self.matrix @ vector
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        order = np.lexsort((self.ids[candidates], -scores[candidates]))
+        top = candidates[order]
+        return self.ids[top], scores[top]
@@ -0,0 +1,37 @@
+import math
+
+import numpy as np
+
+
+def percentile_ranks(values: np.ndarray) -> np.ndarray:
+    """
+    웨딩홀 x 점수 타입 행렬의 열별 백분위 순위 (0~100, 높을수록 상위, 결측은 NaN)
+    순위는 해당 점수보다 낮은 점수의 비율이며 같은 점수는 같은 순위 (SQL percent_rank 와 동일)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    ranks = np.full(values.shape, np.nan)
+    for column in range(values.shape[1]):
+        present = ~np.isnan(values[:, column])
+        count = int(present.sum())
+        if count == 0:
+            continue
+        scores = values[present, column]
+        below = np.searchsorted(np.sort(scores), scores, side="left")
+        ranks[present, column] = 100.0 * below / (count - 1) if count > 1 else 100.0
+    return ranks
+
+
+def composite_scores(values: np.ndarray) -> np.ndarray:
+    """웨딩홀별 종합 점수 (있는 점수들의 평균, 점수가 없으면 NaN)"""
+    values = np.asarray(values, dtype=np.float64)
+    counts = (~np.isnan(values)).sum(axis=1)
+    totals = np.nansum(values, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, totals / counts, np.nan)
+
+
+def top_percent(percentile: float | None) -> int | None:
+    """백분위 순위를 '상위 N%' 의 N 으로 변환 (1~100)"""
+    if percentile is None:
+        return None
+    return min(100, max(1, math.ceil(100 - percentile)))
@@ -0,0 +1,30 @@
+import re
+
+# 상품 검색 문서에 포함되는 컬럼 (products.search_text)
+SEARCH_TEXT_COLUMNS = (
+    "name",
+    "hashtag",
+    "enterprise_name",
+    "sido",
+    "gugun",
+    "dong",
+    "address",
+    "subway_name",
+    "description",
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def build_search_text(*parts: str | None) -> str:
+    """검색 문서 생성 (빈 값 제외, 소문자, 연속 공백은 하나로)"""
+    text = " ".join(part for part in parts if part)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def search_pattern(term: str) -> str:
+    """검색어를 search_text 부분 일치용 LIKE 패턴으로 변환 (escape 문자: \\)"""
+    term = build_search_text(term)
+    for char in ("\\", "%", "_"):
+        term = term.replace(char, "\\" + char)
+    return f"%{term}%"
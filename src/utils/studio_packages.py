@@ -0,0 +1,8 @@
+def selling_price(price: int, discount_price: int | None) -> int:
+    """
+    패키지 판매가 (할인가가 0 보다 크면 할인가)
+    저장된 스튜디오 가격 범위(models.product_studios.package_price)와 같은 규칙
+    """
+    if discount_price is not None and discount_price > 0:
+        return discount_price
+    return price
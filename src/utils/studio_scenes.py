@@ -0,0 +1,55 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# 촬영 씬 -> product_studios 불리언 컬럼 (순서가 비트 위치, 추가는 끝에만)
+SCENE_COLUMNS = {
+    "garden": "has_garden_scene",
+    "road": "has_road_scene",
+    "rooftop": "has_rooftop_scene",
+    "night": "has_night_scene",
+    "hanbok": "has_hanbok_scene",
+    "pet": "has_pet_scene",
+    "black_white": "has_black_white_scene",
+}
+SCENE_BITS = {scene: 1 << bit for bit, scene in enumerate(SCENE_COLUMNS)}
+ALL_SCENES_MASK = (1 << len(SCENE_BITS)) - 1
+
+
+def pack_scene_flags(values: Mapping[str, Any]) -> int:
+    """불리언 씬 컬럼 값(컬럼명 -> bool)을 scene_flags 비트마스크로 변환"""
+    flags = 0
+    for scene, column in SCENE_COLUMNS.items():
+        if values.get(column):
+            flags |= SCENE_BITS[scene]
+    return flags
+
+
+def scene_mask(scenes: Iterable[str]) -> int:
+    """씬 이름 목록을 비트마스크로 변환 (모든 씬을 포함해야 하는 필터용)"""
+    mask = 0
+    for scene in scenes:
+        mask |= SCENE_BITS[scene]
+    return mask
+
+
+def scene_supersets(mask: int) -> list[int]:
+    """
+    mask 의 씬을 모두 포함하는 scene_flags 값 목록 (오름차순)
+    flags & mask = mask 조건을 인덱스를 탈 수 있는 scene_flags IN (...) 으로 바꾸기 위함
+    (씬이 7개라 최대 128개)
+    """
+    free = ALL_SCENES_MASK & ~mask
+    supersets = []
+    # free 비트의 모든 부분집합을 순회
+    subset = free
+    while True:
+        supersets.append(mask | subset)
+        if subset == 0:
+            break
+        subset = (subset - 1) & free
+    return sorted(supersets)
+
+
+def unpack_scene_flags(flags: int) -> list[str]:
+    """scene_flags 비트마스크를 씬 이름 목록으로 변환 (SCENE_COLUMNS 순서)"""
+    return [scene for scene, bit in SCENE_BITS.items() if flags & bit]
@@ -1,6 +1,8 @@
 import datetime
 import random
 import re
+from collections.abc import Mapping
+from typing import Any
 
 from fastapi.routing import APIRoute
 
@@ -329,3 +331,26 @@ def parse_guest_count_range(range_str: str) -> tuple:
     else:
         # "100~200명" 형태 (범위)
         return int(numbers[0]), int(numbers[1])
+
+
+def nest_columns(row: Mapping[str, Any], sep: str = "__") -> dict[str, Any]:
+    """
+    "news_category__id" 처럼 접두사가 붙은 컬럼을 중첩 dict 로 변환
+
+    outer join 으로 비어있는 관계(중첩 값이 모두 None)는 None 으로 설정한다.
+    """
+    nested: dict[str, Any] = {}
+    relations: dict[str, dict[str, Any]] = {}
+
+    for key, value in row.items():
+        prefix, found, field = key.partition(sep)
+        if found:
+            relations.setdefault(prefix, {})[field] = value
+        else:
+            nested[key] = value
+
+    for prefix, values in relations.items():
+        has_value = any(value is not None for value in values.values())
+        nested[prefix] = values if has_value else None
+
+    return nested
@@ -0,0 +1,28 @@
+from collections.abc import Iterable
+
+# 베뉴 편의시설 이미지 타입
+AMENITY_IMAGE_TYPES = ("신부대기실", "폐백실", "연회장")
+
+
+def resolve_amenity_images(
+    common_images: Iterable[tuple[str, int, str]],
+    venue_images: Iterable[tuple[str, int, str]],
+) -> dict[str, list[str]]:
+    """
+    베뉴의 편의시설 이미지 URL 을 타입별로 결정
+    이미지는 (image_type, order, image_url) 이며, 베뉴 전용 이미지가 있는 타입은
+    상품 공통 이미지를 대신한다. 각 타입의 URL 은 order 순으로 정렬된다.
+    """
+    by_type: dict[str, list[tuple[int, str]]] = {}
+    for image_type, order, image_url in venue_images:
+        by_type.setdefault(image_type, []).append((order, image_url))
+
+    overridden = set(by_type)
+    for image_type, order, image_url in common_images:
+        if image_type not in overridden:
+            by_type.setdefault(image_type, []).append((order, image_url))
+
+    return {
+        image_type: [image_url for _, image_url in sorted(by_type.get(image_type, []))]
+        for image_type in AMENITY_IMAGE_TYPES
+    }
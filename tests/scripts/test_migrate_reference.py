@@ -0,0 +1,237 @@
+import copy
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlmodel import Session, SQLModel
+
+from models.product_hall_venues import ProductHallVenue
+from models.product_halls import ProductHall
+from models.product_images import ProductImage
+from models.products import Product
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+import migrate_reference  # noqa: E402
+from migrate_reference import sync_rows, with_ordinals  # noqa: E402
+
+
+def empty_changes() -> dict:
+    return {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+
+def row(value: str, is_deleted: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(
+        value=value, is_deleted=is_deleted, deleted_datetime=None, updated_datetime=None
+    )
+
+
+def test_with_ordinals_numbers_repeated_names():
+    names = ["본관", "별관", "본관", "본관"]
+
+    assert with_ordinals(names, lambda name: name) == [
+        ("본관", 0),
+        ("별관", 0),
+        ("본관", 1),
+        ("본관", 2),
+    ]
+
+
+def test_sync_rows_creates_updates_restores_and_deletes():
+    session = SimpleNamespace(added=[])
+    session.add = session.added.append
+    kept, changed, restored = row("a"), row("old"), row("c", is_deleted=True)
+    duplicate, vanished = row("a"), row("gone")
+    changes = empty_changes()
+
+    matched, deleted = sync_rows(
+        session,
+        changes,
+        existing=[
+            ("a", kept),
+            ("b", changed),
+            ("c", restored),
+            ("a", duplicate),
+            ("x", vanished),
+        ],
+        desired={
+            "a": {"value": "a"},
+            "b": {"value": "new"},
+            "c": {"value": "c"},
+            "d": {"value": "d"},
+        },
+        create=lambda values: row(**values),
+    )
+
+    assert changes == {"created": 1, "updated": 2, "deleted": 2, "unchanged": 1}
+    assert matched["a"] is kept and matched["b"] is changed and matched["c"] is restored
+    assert session.added == [matched["d"]]
+    assert changed.value == "new"
+    assert not restored.is_deleted and restored.deleted_datetime is None
+    assert deleted == [duplicate, vanished]
+    assert all(obj.is_deleted and obj.deleted_datetime for obj in deleted)
+
+
+def product_values(code: str, name: str) -> dict:
+    return {
+        "product_category_id": migrate_reference.PRODUCT_CATEGORY_ID,
+        "source_code": code,
+        "name": name,
+        "description": "",
+        "hashtag": "",
+        "direct_link": "",
+        "thumbnail_url": "",
+        "logo_url": "",
+        "enterprise_name": "",
+        "enterprise_code": code,
+        "tel": "",
+        "fax_tel": "",
+        "sido": "서울",
+        "gugun": "강남구",
+        "dong": "",
+        "address": f"{name} 주소",
+        "lat": 37.5,
+        "lng": 127.0,
+        "business_hours": "",
+        "available": True,
+    }
+
+
+def venue_entry(name: str, images: list[str]) -> dict:
+    values = {
+        "name": name,
+        "wedding_interval": 60,
+        "wedding_times": "",
+        "wedding_type": "분리",
+        "hall_types": "호텔",
+        "hall_styles": "밝음",
+        "guaranteed_min_count": 200,
+        "min_capacity": 200,
+        "max_capacity": 300,
+        "basic_price": 1000000,
+        "peak_season_price": 2000000,
+        "ceiling_height": 0,
+        "virgin_road_length": 0,
+        "include_drink": True,
+        "include_alcohol": True,
+        "include_service_fee": True,
+        "include_vat": True,
+        "bride_room_entry_methods": "",
+        "bride_room_makeup_room": True,
+        "food_menu": "뷔페",
+        "food_cost_per_adult": 50000,
+        "food_cost_per_child": 30000,
+        "banquet_hall_running_time": 60,
+        "banquet_hall_max_capacity": 300,
+        "additional_info": "",
+        "special_notes": "",
+    }
+    return {
+        "values": values,
+        "images": [
+            {"image_url": url, "order": order, "image_type": "연회장"}
+            for order, url in enumerate(images)
+        ],
+    }
+
+
+def catalogue_entry(code: str, name: str, venues: list[dict]) -> dict:
+    return {
+        "product": product_values(code, name),
+        "hall": {"name": name},
+        "reviews": {"분위기": f"{name} 분위기"},
+        "venues": venues,
+    }
+
+
+@pytest.fixture
+def target_engine(monkeypatch):
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(migrate_reference, "get_target_engine", lambda: engine)
+    return engine
+
+
+def run_sync(monkeypatch, catalogue: dict) -> dict:
+    monkeypatch.setattr(
+        migrate_reference, "load_catalogue", lambda workers: copy.deepcopy(catalogue)
+    )
+    return migrate_reference.sync_data(workers=1)
+
+
+def test_sync_data_round_trip(monkeypatch, target_engine):
+    # 전체 재적재로 만든 (source_code 없는) 기존 상품은 이름으로 이어받음
+    with Session(target_engine) as session:
+        legacy = Product(**{**product_values("legacy", "더채플"), "source_code": None})
+        session.add(legacy)
+        session.commit()
+        legacy_id = legacy.id
+
+    catalogue = {
+        "B1": catalogue_entry(
+            "B1",
+            "더채플",
+            # 같은 이름의 베뉴는 순번으로 구분
+            [venue_entry("그랜드홀", ["a1", "a2"]), venue_entry("그랜드홀", ["b1"])],
+        ),
+        "B2": catalogue_entry("B2", "라비두스", [venue_entry("단독홀", ["c1"])]),
+    }
+
+    changes = run_sync(monkeypatch, catalogue)
+    assert changes["products"] == {
+        "created": 1,
+        "updated": 1,
+        "deleted": 0,
+        "unchanged": 0,
+    }
+    assert changes["product_hall_venues"]["created"] == 3
+    assert changes["product_images"]["created"] == 4
+
+    # 바뀐 것이 없으면 모두 유지
+    changes = run_sync(monkeypatch, catalogue)
+    for table, counter in changes.items():
+        assert counter["created"] == counter["updated"] == counter["deleted"] == 0, table
+
+    # 웨딩홀 하나와 다른 웨딩홀의 베뉴 하나가 소스에서 사라짐
+    del catalogue["B2"]
+    catalogue["B1"]["venues"].pop()
+    changes = run_sync(monkeypatch, catalogue)
+    assert changes["products"]["deleted"] == 1
+    assert changes["product_halls"]["deleted"] == 1
+    # 사라진 웨딩홀의 베뉴/이미지도 함께 삭제
+    assert changes["product_hall_venues"]["deleted"] == 2
+    assert changes["product_images"]["deleted"] == 2
+
+    with Session(target_engine) as session:
+        products = {
+            product.source_code: product
+            for product in session.execute(select(Product)).scalars()
+        }
+        assert products["B1"].id == legacy_id and not products["B1"].is_deleted
+        assert products["B2"].is_deleted
+
+        hall = session.execute(
+            select(ProductHall).where(ProductHall.product_id == products["B2"].id)
+        ).scalar_one()
+        assert hall.is_deleted
+
+        venues = session.execute(
+            select(ProductHallVenue).order_by(ProductHallVenue.id)
+        ).scalars()
+        assert [(venue.name, venue.is_deleted) for venue in venues] == [
+            ("그랜드홀", False),
+            ("그랜드홀", True),
+            ("단독홀", True),
+        ]
+        images = session.execute(
+            select(ProductImage.image_url, ProductImage.is_deleted).order_by(
+                ProductImage.id
+            )
+        ).all()
+        assert images == [
+            ("a1", False),
+            ("a2", False),
+            ("b1", True),
+            ("c1", True),
+        ]
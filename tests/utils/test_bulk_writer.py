@@ -0,0 +1,41 @@
+from sqlalchemy import create_engine, select
+from sqlmodel import SQLModel
+
+from models.product_images import ProductImage
+from utils.bulk_writer import BulkWriter, _copy_value
+
+
+def test_copy_value_quotes_everything_but_null():
+    assert _copy_value(None) == ""
+    assert _copy_value("") == '""'
+    assert _copy_value('a "b"') == '"a ""b"""'
+    assert _copy_value(True) == '"true"'
+    assert _copy_value({"320": "u"}) == '"{""320"": ""u""}"'
+
+
+def test_bulk_writer_returns_ids_and_fills_defaults():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[ProductImage.__table__])
+
+    with engine.begin() as connection:
+        with BulkWriter(
+            connection, ProductImage, returning=True, batch_size=2
+        ) as writer:
+            for n in range(3):
+                writer.add(
+                    {"product_id": 1, "image_url": f"u{n}", "image_type": "연회장"},
+                    key=f"u{n}",
+                )
+
+        rows = connection.execute(
+            select(
+                ProductImage.id,
+                ProductImage.image_url,
+                ProductImage.is_deleted,
+                ProductImage.created_datetime,
+            )
+        ).all()
+
+    assert writer.written == 3
+    assert writer.ids == {row.image_url: row.id for row in rows}
+    assert all(row.is_deleted is False and row.created_datetime for row in rows)
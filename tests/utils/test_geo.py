@@ -0,0 +1,57 @@
+import math
+
+import pytest
+
+from utils.geo import (
+    EARTH_RADIUS_KM,
+    bounding_box,
+    encode_geohash,
+    geohash_or_none,
+    geohash_prefixes,
+    haversine_km,
+)
+
+# 강남역 / 서울시청
+GANGNAM = (37.4979, 127.0276)
+CITY_HALL = (37.5665, 126.9780)
+
+
+def test_encode_geohash_known_value():
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_geohash_or_none_skips_default_coordinates():
+    assert geohash_or_none(0.0, 0.0) is None
+    assert geohash_or_none(None, 127.0) is None
+    assert geohash_or_none(*GANGNAM) == encode_geohash(*GANGNAM)
+
+
+def test_haversine_km():
+    assert haversine_km(*GANGNAM, *GANGNAM) == 0
+    assert 8.7 < haversine_km(*GANGNAM, *CITY_HALL) < 8.9
+
+
+def test_bounding_box_contains_radius():
+    min_lat, max_lat, min_lng, max_lng = bounding_box(*GANGNAM, 5)
+    assert haversine_km(min_lat, GANGNAM[1], *GANGNAM) == pytest.approx(5, rel=1e-3)
+    assert min_lng < GANGNAM[1] < max_lng
+
+
+def test_geohash_prefixes_cover_every_point_in_radius():
+    lat, lng = GANGNAM
+    for radius_km in (0.3, 1, 3, 5, 10, 30):
+        prefixes = geohash_prefixes(lat, lng, radius_km)
+        assert len(prefixes) <= 9
+
+        # 원 둘레의 점들이 모두 prefix 중 하나에 포함되어야 함
+        for step in range(36):
+            angle = math.radians(step * 10)
+            d_lat = math.degrees(radius_km * math.cos(angle) / EARTH_RADIUS_KM)
+            d_lng = math.degrees(
+                radius_km
+                * math.sin(angle)
+                / (EARTH_RADIUS_KM * math.cos(math.radians(lat)))
+            )
+            geohash = encode_geohash(lat + d_lat * 0.99, lng + d_lng * 0.99)
+            assert any(geohash.startswith(prefix) for prefix in prefixes)
+
@@ -0,0 +1,45 @@
+import numpy as np
+
+from utils.geo import haversine_km
+from utils.geo_index import GeoGridIndex
+
+
+def _points(n=2000, seed=7):
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(37.3, 37.8, n)
+    lngs = rng.uniform(126.7, 127.3, n)
+    return np.arange(1, n + 1), lats, lngs
+
+
+def _brute_force(lats, lngs, lat, lng):
+    return np.array(
+        [haversine_km(lat, lng, a, b) for a, b in zip(lats, lngs, strict=True)]
+    )
+
+
+def test_within_matches_brute_force():
+    ids, lats, lngs = _points()
+    index = GeoGridIndex(ids, lats, lngs)
+
+    found_ids, distances = index.within(37.55, 127.0, 3.0)
+
+    expected = _brute_force(lats, lngs, 37.55, 127.0)
+    assert set(found_ids.tolist()) == set(ids[expected <= 3.0].tolist())
+    assert np.all(np.diff(distances) >= 0)
+
+
+def test_nearest_matches_brute_force():
+    ids, lats, lngs = _points()
+    index = GeoGridIndex(ids, lats, lngs)
+
+    found_ids, _ = index.nearest(37.41, 126.95, 15)
+
+    expected = _brute_force(lats, lngs, 37.41, 126.95)
+    assert found_ids.tolist() == ids[np.argsort(expected, kind="stable")][:15].tolist()
+
+
+def test_empty_index():
+    index = GeoGridIndex([], [], [])
+
+    assert len(index.within(37.5, 127.0, 5.0)[0]) == 0
+    assert len(index.nearest(37.5, 127.0, 3)[0]) == 0
@@ -0,0 +1,37 @@
+import numpy as np
+
+from utils.hall_similarity import build_feature_matrix, top_k_cosine
+
+
+def test_top_k_cosine_matches_full_matrix():
+    features = np.random.default_rng(3).normal(size=(300, 12))
+
+    neighbours, similarities = top_k_cosine(features, 5, batch_size=64)
+
+    unit = features / np.linalg.norm(features, axis=1, keepdims=True)
+    full = unit @ unit.T
+    np.fill_diagonal(full, -np.inf)
+    expected = np.argsort(-full, axis=1)[:, :5]
+    assert (neighbours == expected).all()
+    assert np.allclose(similarities, np.take_along_axis(full, expected, axis=1), atol=1e-5)
+
+
+def test_top_k_cosine_small_catalogue():
+    neighbours, _ = top_k_cosine(np.eye(3), 10)
+
+    assert neighbours.shape == (3, 2)
+    assert all(i not in row for i, row in enumerate(neighbours.tolist()))
+
+
+def test_similar_profiles_are_neighbours():
+    features = build_feature_matrix(
+        scores=np.array([[9.0, 8.0], [8.9, 8.1], [5.0, 4.0]]),
+        sidos=["서울", "서울", "부산"],
+        guguns=["강남구", "강남구", "해운대구"],
+        prices=np.array([[2e7, 3e7], [2.1e7, 3.2e7], [np.nan, np.nan]]),
+        venue_tokens=[{"호텔", "밝음"}, {"호텔"}, {"채플"}],
+    )
+
+    neighbours, _ = top_k_cosine(features, 1)
+
+    assert neighbours[:, 0].tolist()[:2] == [1, 0]
@@ -0,0 +1,40 @@
+import io
+
+from PIL import Image
+
+from utils.image_processing import build_derivatives
+from utils.image_storage import LocalImageStorage
+
+
+def _png(width: int, height: int, mode: str = "RGBA") -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, (width, height), (200, 100, 50, 128)[: len(mode)]).save(
+        output, format="PNG"
+    )
+    return output.getvalue()
+
+
+def test_build_derivatives_sizes_and_placeholder():
+    derivatives = build_derivatives(_png(1000, 500))
+
+    assert (derivatives.width, derivatives.height) == (1000, 500)
+    assert sorted(derivatives.variants) == [320, 640]
+    assert derivatives.placeholder.startswith("data:image/webp;base64,")
+    with Image.open(io.BytesIO(derivatives.variants[320])) as img:
+        assert img.size == (320, 160)
+
+
+def test_small_image_keeps_original_width():
+    derivatives = build_derivatives(_png(200, 100, "RGB"))
+
+    assert sorted(derivatives.variants) == [200]
+
+
+def test_local_storage(tmp_path):
+    storage = LocalImageStorage(tmp_path, base_url="http://cdn.test/")
+
+    url = storage.save("products/1/common/a.webp", b"data")
+
+    assert url == "http://cdn.test/products/1/common/a.webp"
+    assert storage.exists("products/1/common/a.webp")
+    assert (tmp_path / "products/1/common/a.webp").read_bytes() == b"data"
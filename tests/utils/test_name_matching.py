@@ -0,0 +1,27 @@
+from utils.name_matching import NameMatcher, normalize_name
+
+
+def test_normalize_name():
+    assert normalize_name(" 더 채플 앳 청담 (Chapel) ") == "더채플앳청담chapel"
+
+
+def test_exact_match_after_normalization():
+    matcher = NameMatcher(["더채플앳청담", "아펠가모 선릉"])
+
+    assert matcher.match("아펠가모선릉") == ("아펠가모 선릉", [])
+
+
+def test_partial_match_ranks_candidates():
+    matcher = NameMatcher(["더채플앳청담", "더채플앳논현", "루클라비더화이트"])
+
+    assert matcher.match("더채플앳청담점") == ("더채플앳청담", [])
+    assert matcher.match("없는웨딩홀") == (None, [])
+
+
+def test_ambiguous_match_is_reported():
+    matcher = NameMatcher(["더채플앳청담", "더채플앳논현"])
+
+    name, candidates = matcher.match("더채플앳")
+
+    assert name is None
+    assert [candidate[0] for candidate in candidates] == ["더채플앳논현", "더채플앳청담"]
@@ -0,0 +1,54 @@
+from utils.score_import import read_score_csv, read_score_items, validate_score_batch
+
+
+def test_read_score_csv():
+    batch = read_score_csv(
+        ["product_id,score_type,value\n", "1,분위기,8.5\n", "2, 위치 ,x\n"]
+    )
+
+    assert batch.product_ids.tolist() == [1, 2]
+    assert batch.score_types.tolist() == ["분위기", "위치"]
+    assert batch.values[0] == 8.5
+
+
+def test_validate_score_batch_reports_invalid_rows():
+    batch = read_score_items(
+        [
+            {"product_id": 1, "score_type": "분위기", "value": 8.5},
+            {"product_id": 9, "score_type": "분위기", "value": 8.0},
+            {"product_id": 1, "score_type": "", "value": 8.0},
+            {"product_id": 2, "score_type": "위치", "value": "abc"},
+            {"product_id": 2, "score_type": "식사", "value": 11},
+            "not an object",
+        ]
+    )
+
+    valid, errors = validate_score_batch(batch, known_product_ids=[1, 2])
+
+    assert valid.rows() == [{"product_id": 1, "score_type": "분위기", "value": 8.5}]
+    assert [(error["line"], error["reason"]) for error in errors] == [
+        (2, "unknown product_id"),
+        (3, "missing score_type"),
+        (4, "invalid value"),
+        (5, "value out of range [0.0, 10.0]"),
+        (6, "unknown product_id"),
+    ]
+
+
+def test_validate_score_batch_keeps_last_duplicate():
+    batch = read_score_items(
+        [
+            {"product_id": 1, "score_type": "위치", "value": 5},
+            {"product_id": 2, "score_type": "위치", "value": 6},
+            {"product_id": 1, "score_type": "위치", "value": 7},
+        ]
+    )
+
+    valid, errors = validate_score_batch(batch, known_product_ids=[1, 2])
+
+    assert errors == []
+    assert valid.rows() == [
+        {"product_id": 2, "score_type": "위치", "value": 6.0},
+        {"product_id": 1, "score_type": "위치", "value": 7.0},
+    ]
+    assert valid.line_numbers.tolist() == [2, 3]
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from utils.score_matrix import ScoreMatrix
+
+
+def _matrix():
+    rows = [
+        (1, "분위기", 9.0),
+        (1, "위치", 6.0),
+        (2, "분위기", 7.0),
+        (2, "위치", 9.5),
+        (3, "분위기", 8.0),
+        # 3번 홀은 위치 점수 없음 -> 위치 평균(7.75) 사용
+    ]
+    ids, types, values = zip(*rows, strict=True)
+    return ScoreMatrix(ids, types, values)
+
+
+def test_missing_score_uses_column_mean():
+    matrix = _matrix()
+
+    row = matrix.matrix[list(matrix.ids).index(3)]
+    assert row[matrix.score_types.index("위치")] == pytest.approx(7.75)
+
+
+def test_top_k_matches_full_sort():
+    matrix = _matrix()
+    weights = {"분위기": 1.0, "위치": 3.0}
+
+    ids, scores = matrix.top_k(weights, 2)
+
+    expected = matrix.matrix @ matrix.weight_vector(weights)
+    assert ids.tolist() == matrix.ids[np.argsort(-expected)][:2].tolist()
+    assert scores.tolist() == pytest.approx(sorted(expected, reverse=True)[:2])
+
+
+def test_invalid_weights():
+    matrix = _matrix()
+
+    with pytest.raises(ValueError):
+        matrix.top_k({"주차": 1.0}, 3)
+    with pytest.raises(ValueError):
+        matrix.top_k({"분위기": 0.0}, 3)
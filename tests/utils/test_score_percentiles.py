@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+
+from utils.score_percentiles import composite_scores, percentile_ranks, top_percent
+
+
+def test_percentile_ranks_per_column_with_ties_and_missing():
+    values = np.array(
+        [
+            [9.0, 7.0],
+            [8.0, np.nan],
+            [8.0, 6.0],
+            [7.0, 8.0],
+        ]
+    )
+
+    ranks = percentile_ranks(values)
+
+    assert ranks[:, 0].tolist() == [100.0, 100 / 3, 100 / 3, 0.0]
+    assert ranks[[0, 2, 3], 1].tolist() == [50.0, 0.0, 100.0]
+    assert math.isnan(ranks[1, 1])
+
+
+def test_composite_scores_ignore_missing():
+    values = np.array([[9.0, 7.0], [8.0, np.nan], [np.nan, np.nan]])
+
+    composite = composite_scores(values)
+
+    assert composite[:2].tolist() == [8.0, 8.0]
+    assert math.isnan(composite[2])
+
+
+def test_top_percent():
+    assert top_percent(100.0) == 1
+    assert top_percent(91.5) == 9
+    assert top_percent(0.0) == 100
+    assert top_percent(None) is None
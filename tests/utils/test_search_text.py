@@ -0,0 +1,11 @@
+from utils.search_text import build_search_text, search_pattern
+
+
+def test_build_search_text_normalizes_parts():
+    text = build_search_text(" 더채플 앳 청담 ", None, "호텔,채플", "", "서울\n강남구")
+
+    assert text == "더채플 앳 청담 호텔,채플 서울 강남구"
+
+
+def test_search_pattern_escapes_like_wildcards():
+    assert search_pattern(" 100% Studio_A ") == "%100\\% studio\\_a%"
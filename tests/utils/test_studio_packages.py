@@ -0,0 +1,8 @@
+from utils.studio_packages import selling_price
+
+
+def test_selling_price_uses_positive_discount_only():
+    assert selling_price(100000, 80000) == 80000
+    assert selling_price(100000, None) == 100000
+    assert selling_price(100000, 0) == 100000
+    assert selling_price(100000, -1) == 100000
@@ -0,0 +1,37 @@
+from utils.studio_scenes import (
+    ALL_SCENES_MASK,
+    SCENE_BITS,
+    pack_scene_flags,
+    scene_mask,
+    scene_supersets,
+    unpack_scene_flags,
+)
+
+
+def test_pack_and_unpack_round_trip():
+    flags = pack_scene_flags(
+        {"has_garden_scene": True, "has_night_scene": True, "has_pet_scene": False}
+    )
+
+    assert flags == SCENE_BITS["garden"] | SCENE_BITS["night"]
+    assert unpack_scene_flags(flags) == ["garden", "night"]
+
+
+def test_scene_mask_requires_all_scenes():
+    mask = scene_mask(["garden", "night", "hanbok"])
+    studio = pack_scene_flags(
+        {"has_garden_scene": True, "has_night_scene": True, "has_hanbok_scene": True}
+    )
+    partial = pack_scene_flags({"has_garden_scene": True, "has_night_scene": True})
+
+    assert studio & mask == mask
+    assert partial & mask != mask
+
+
+def test_scene_supersets_match_bitwise_filter():
+    mask = scene_mask(["garden", "hanbok"])
+    expected = [flags for flags in range(ALL_SCENES_MASK + 1) if flags & mask == mask]
+
+    assert scene_supersets(mask) == expected
+    assert len(scene_supersets(0)) == ALL_SCENES_MASK + 1
+    assert scene_supersets(ALL_SCENES_MASK) == [ALL_SCENES_MASK]
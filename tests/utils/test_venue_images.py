@@ -0,0 +1,20 @@
+from utils.venue_images import resolve_amenity_images
+
+
+def test_venue_images_override_common_images_by_type():
+    common = [("연회장", 2, "c-hall-2"), ("연회장", 1, "c-hall-1"), ("폐백실", 1, "c-pyebaek")]
+    venue = [("연회장", 3, "v-hall-3"), ("연회장", 1, "v-hall-1")]
+
+    resolved = resolve_amenity_images(common, venue)
+
+    assert resolved == {
+        "신부대기실": [],
+        "폐백실": ["c-pyebaek"],
+        "연회장": ["v-hall-1", "v-hall-3"],
+    }
+
+
+def test_common_images_only():
+    resolved = resolve_amenity_images([("신부대기실", 0, "c-bride")], [])
+
+    assert resolved["신부대기실"] == ["c-bride"]